@@ -2,14 +2,11 @@ import streamlit as st
 import os
 import tempfile
 import yaml
-import json
 import pandas as pd
 import plotly.express as px
 import cv2
 import time
-import importlib
-import src.pipeline.orchestrator
-importlib.reload(src.pipeline.orchestrator)
+from src.explanation.report_stream import ReportReader
 from src.pipeline.orchestrator import PipelineOrchestrator
 from generate_choppy_video import create_choppy_video
 
@@ -139,7 +136,7 @@ if uploaded_file:
                     metric_consistency.metric("Temporal Consistency", f"{metrics.get('temporal_consistency', 0):.2f}")
                     metric_edge.metric("Edge Preservation", f"{metrics.get('edge_preservation', 0):.2f}")
 
-        # Run Pipeline
+        # Run Pipeline (models are loaded once per process by the model registry, so this is cheap)
         orchestrator = PipelineOrchestrator(config)
         
         results = {} # Store paths to display later
@@ -150,57 +147,49 @@ if uploaded_file:
                 results['original'] = input_path
                 
                 # Step 1: Choppify
-                status_text.markdown("### [1/3] Generating Choppy Video (10 FPS)...")
+                status_text.markdown("### [1/2] Generating Choppy Video (10 FPS)...")
                 choppy_path = input_path.replace(".mp4", "_choppy.mp4")
                 create_choppy_video(input_path, choppy_path, target_fps=10)
                 results['choppy'] = choppy_path
                 
-                # Step 2: Restore Pass 1 (10 -> 20)
-                status_text.markdown("### [2/3] Restoration Pass 1 (10 -> 20 FPS)...")
+                # Step 2+3: Restore Pass 1 (10 -> 20) and Pass 2 (20 -> 40) in one fused run.
+                # Pass 1 frames feed pass 2 in memory; the 20 FPS video is still written for display.
+                status_text.markdown("### [2/2] Restoration Passes 1+2 (10 -> 20 -> 40 FPS)...")
                 pass1_path = input_path.replace(".mp4", "_restored_20fps.mp4")
-                pass1_report = input_path.replace(".mp4", "_report_pass1.json")
-                
-                progress_bar.progress(0)
-                orchestrator.process_video(choppy_path, pass1_path, pass1_report, progress_callback=progress_callback)
-                results['restored_2x'] = pass1_path
-                
-                # Step 3: Restore Pass 2 (20 -> 40)
-                status_text.markdown("### [3/3] Restoration Pass 2 (20 -> 40 FPS)...")
                 pass2_path = input_path.replace(".mp4", "_restored_40fps.mp4")
-                pass2_report = input_path.replace(".mp4", "_report_pass2.json")
+                report_path = input_path.replace(".mp4", "_report.jsonl")
                 
                 progress_bar.progress(0)
-                orchestrator.process_video(pass1_path, pass2_path, pass2_report, progress_callback=progress_callback)
+                orchestrator.process_multipass(choppy_path, pass2_path, report_path, [2, 2],
+                                               intermediate_outputs=[pass1_path],
+                                               progress_callback=progress_callback)
+                results['restored_2x'] = pass1_path
                 results['restored_4x'] = pass2_path
                 
-                final_report_path = pass2_report # Use final report for dashboard
+                final_report_path = report_path # Merged report covers both passes
 
             # --- WORKFLOW 2: RESTORE EXISTING ---
             else:
                 results['original'] = input_path
                 
-                # Pass 1
-                status_text.markdown("### [1/2] Restoration Pass 1 (2x)...")
                 output_path = input_path.replace(".mp4", "_out.mp4")
-                report_path = input_path.replace(".mp4", "_report.json")
-                
+                report_path = input_path.replace(".mp4", "_report.jsonl")
                 progress_bar.progress(0)
-                orchestrator.process_video(input_path, output_path, report_path, progress_callback=progress_callback)
-                results['restored_2x'] = output_path
-                final_report_path = report_path
                 
-                # Pass 2 (Optional)
                 if target_fps_mult == "4x (Ultra Smooth)":
-                    status_text.markdown("### [2/2] Restoration Pass 2 (4x)...")
-                    input_pass2 = output_path
+                    # Two fused passes (2x, then 2x again) with a single merged report
+                    status_text.markdown("### Restoration Passes 1+2 (4x)...")
                     output_pass2 = output_path.replace(".mp4", "_4x.mp4")
-                    report_pass2 = report_path.replace(".json", "_4x.json")
-                    
-                    progress_bar.progress(0)
-                    orchestrator.process_video(input_pass2, output_pass2, report_pass2, progress_callback=progress_callback)
-                    
+                    orchestrator.process_multipass(input_path, output_pass2, report_path, [2, 2],
+                                                   intermediate_outputs=[output_path],
+                                                   progress_callback=progress_callback)
+                    results['restored_2x'] = output_path
                     results['restored_4x'] = output_pass2
-                    final_report_path = report_pass2
+                else:
+                    status_text.markdown("### Restoration Pass (2x)...")
+                    orchestrator.process_video(input_path, output_path, report_path, progress_callback=progress_callback)
+                    results['restored_2x'] = output_path
+                final_report_path = report_path
 
             status_text.success("Processing Complete!")
             
@@ -229,9 +218,8 @@ if uploaded_file:
                         st.video(path)
                     idx += 1
                 
-            # Load Report Data
-            with open(final_report_path, 'r') as f:
-                report_data = json.load(f)
+            # Load Report Data (streamed; frames are read one at a time)
+            report = ReportReader(final_report_path)
                 
             # --- Dashboard Section ---
             st.markdown("---")
@@ -239,16 +227,17 @@ if uploaded_file:
             
             # Metrics Overview
             m1, m2, m3, m4 = st.columns(4)
-            m1.metric("Total Frames", report_data['metadata']['total_frames_processed'])
-            m2.metric("Output FPS", f"{report_data['metadata']['frame_rate_output']:.2f}")
-            m3.metric("Avg Severity", f"{report_data['summary']['average_severity']:.4f}")
-            m4.metric("Processing Time", f"{report_data['summary']['processing_time_seconds']:.2f}s")
+            m1.metric("Total Frames", report.metadata['total_frames_processed'])
+            m2.metric("Output FPS", f"{report.metadata['frame_rate_output']:.2f}")
+            m3.metric("Avg Severity", f"{report.summary['average_severity']:.4f}")
+            m4.metric("Processing Time", f"{report.summary['processing_time_seconds']:.2f}s")
             
             # Graphs
             st.subheader("Temporal Quality Metrics")
-            df = pd.DataFrame([f['metrics'] for f in report_data['frames']])
-            df['frame'] = [f['frame_number'] for f in report_data['frames']]
-            df['verdict'] = [f['verdict'] for f in report_data['frames']]
+            df = pd.DataFrame([
+                {**f['metrics'], 'frame': f['frame_number'], 'verdict': f['verdict']}
+                for f in report.frames()
+            ])
             
             fig = px.line(df, x='frame', y=['motion_complexity', 'temporal_consistency', 'edge_preservation'],
                           title="Frame-by-Frame Analysis", template="plotly_dark")
@@ -258,13 +247,13 @@ if uploaded_file:
             st.subheader("Deep Dive: Frame Inspector")
             st.markdown("Explore the AI's internal reasoning for each frame.")
             
-            selected_frame_idx = st.slider("Select Frame", 0, len(report_data['frames'])-1, 0)
-            frame_info = report_data['frames'][selected_frame_idx]
+            selected_frame_idx = st.slider("Select Frame", 0, len(df)-1, 0)
+            frame_info = report.frame(selected_frame_idx)
             
             col_xai_img, col_xai_info = st.columns([2, 1])
             
             with col_xai_img:
-                debug_fname = f"debug_frames/frame_{selected_frame_idx}_xai.jpg"
+                debug_fname = os.path.join(report.metadata.get('debug_dir', 'debug_frames'), f"frame_{selected_frame_idx}_xai.jpg")
                 if os.path.exists(debug_fname):
                     st.image(debug_fname, caption=f"XAI Composite: Frame {selected_frame_idx}", use_column_width=True)
                 else:
@@ -274,6 +263,8 @@ if uploaded_file:
                 st.markdown(f"### Frame {selected_frame_idx}")
                 st.markdown(f"**Verdict:** `{frame_info['verdict']}`")
                 st.markdown(f"**Severity:** {frame_info['severity_score']:.2f}")
+                if frame_info.get('qa') == "inferred":
+                    st.caption("Scores inferred from neighbouring measured frames (sampled QA).")
                 
                 st.markdown("#### Explanations:")
                 for exp in frame_info['explanation']:
@@ -0,0 +1,89 @@
+import argparse
+import os
+import sys
+import time
+
+import cv2
+import numpy as np
+
+# Ensure we can import from src
+sys.path.append(os.getcwd())
+
+from src.detection.feature_cache import downscale
+from src.detection.flow import create_flow_backend
+
+BACKENDS = {
+    "farneback": {"method": "farneback"},
+    "dis-ultrafast": {"method": "dis", "preset": "ultrafast"},
+    "dis-fast": {"method": "dis", "preset": "fast"},
+    "dis-medium": {"method": "dis", "preset": "medium"},
+    "pyramid": {"method": "pyramid", "pyramid_levels": 2},
+}
+
+
+def read_gray_pairs(video_path, num_pairs):
+    """Read the first num_pairs consecutive frame pairs (grayscale) from a video."""
+    cap = cv2.VideoCapture(video_path)
+    if not cap.isOpened():
+        raise ValueError(f"Could not open video: {video_path}")
+    frames = []
+    while len(frames) < num_pairs + 1:
+        ret, frame = cap.read()
+        if not ret:
+            break
+        frames.append(cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY))
+    cap.release()
+    return list(zip(frames[:-1], frames[1:]))
+
+
+def motion_complexity(backend, pairs, scale):
+    """Per-pair mean flow magnitude in source pixels, plus ms/pair."""
+    small = [(downscale(g1, scale), downscale(g2, scale)) for g1, g2 in pairs]
+    values = []
+    start = time.time()
+    for g1, g2 in small:
+        flow = backend.calc(g1, g2)
+        values.append(float(np.mean(cv2.magnitude(flow[..., 0], flow[..., 1]))) / scale)
+    elapsed = time.time() - start
+    return np.array(values), 1000 * elapsed / max(1, len(pairs))
+
+
+def benchmark(args):
+    pairs = read_gray_pairs(args.input_video, args.pairs)
+    if not pairs:
+        print("[ERROR] Need at least two frames to benchmark.")
+        return 1
+    height, width = pairs[0][0].shape[:2]
+    widths = sorted({min(w, width) for w in args.widths or [width]}, reverse=True)
+
+    # Reference: Farneback at full resolution (the detector's historical metric)
+    reference, _ = motion_complexity(create_flow_backend(BACKENDS["farneback"]), pairs, 1.0)
+
+    print(f"[INFO] {len(pairs)} pairs at {width}x{height}; reference = farneback @ {width}px "
+          f"(mean motion {reference.mean():.3f} px)")
+    print(f"\n{'Backend':<14} | {'Width':<6} | {'ms/pair':<8} | {'Speedup':<8} | {'Motion':<8} | {'Abs diff':<8} | {'Corr':<6}")
+    print("-" * 76)
+
+    baseline_ms = None
+    for name in args.backends:
+        backend = create_flow_backend(BACKENDS[name])
+        for w in widths:
+            values, ms = motion_complexity(backend, pairs, w / width)
+            if baseline_ms is None:
+                baseline_ms = ms
+            diff = float(np.mean(np.abs(values - reference)))
+            corr = float(np.corrcoef(values, reference)[0, 1]) if len(pairs) > 1 and values.std() > 0 and reference.std() > 0 else float("nan")
+            print(f"{name:<14} | {w:<6} | {ms:<8.1f} | {baseline_ms / ms:<8.2f} | {values.mean():<8.3f} | {diff:<8.3f} | {corr:<6.3f}")
+    print("\nSpeedup is relative to the first row. Motion is mean motion_complexity in source pixels.")
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Time optical-flow backends and compare their motion_complexity values")
+    parser.add_argument("input_video", help="Video to sample frame pairs from")
+    parser.add_argument("--pairs", type=int, default=16, help="Number of frame pairs to measure")
+    parser.add_argument("--backends", nargs="+", default=list(BACKENDS), choices=list(BACKENDS), help="Backends to compare")
+    parser.add_argument("--widths", nargs="+", type=int, help="Analysis widths to test (default: source width only)")
+    args = parser.parse_args()
+
+    sys.exit(benchmark(args))
@@ -0,0 +1,122 @@
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+import cv2
+import numpy as np
+import yaml
+from skimage.metrics import structural_similarity as ssim
+from skimage.metrics import peak_signal_noise_ratio as psnr
+
+# Ensure we can import from src
+sys.path.append(os.getcwd())
+
+PRECISIONS = ["float32", "float16", "bfloat16", "int8"]
+
+
+def read_pairs(video_path, num_pairs):
+    """Read the first num_pairs consecutive frame pairs (RGB) from a video."""
+    cap = cv2.VideoCapture(video_path)
+    if not cap.isOpened():
+        raise ValueError(f"Could not open video: {video_path}")
+    frames = []
+    while len(frames) < num_pairs + 1:
+        ret, frame = cap.read()
+        if not ret:
+            break
+        frames.append(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB))
+    cap.release()
+    return list(zip(frames[:-1], frames[1:]))
+
+
+def run_worker(args):
+    """
+    Time one precision in a fresh process. Grappler's mixed-precision rewrite
+    is a process-wide setting, so each precision gets its own interpreter.
+    """
+    from src.interpolation.engine import SmartInterpolator, FILMInterpolator
+
+    with open(args.config, 'r') as f:
+        config = yaml.safe_load(f)
+    config['interpolation']['precision'] = args.worker
+    config['interpolation'].setdefault('warmup', {})['enabled'] = False
+
+    engine = SmartInterpolator(config).engine
+    if not isinstance(engine, FILMInterpolator):
+        raise RuntimeError("FILM engine could not be initialized; nothing to benchmark.")
+
+    pairs = read_pairs(args.input_video, args.pairs)
+    height, width = pairs[0][0].shape[:2]
+    batch_size = engine.batch_size
+
+    # Warm up (and build the TFLite model for int8) outside the timed region
+    engine.warm_up(width, height)
+
+    outputs = []
+    start = time.time()
+    for i in range(0, len(pairs), batch_size):
+        outputs.extend(engine.interpolate_batch(pairs[i:i + batch_size]))
+    elapsed = time.time() - start
+
+    np.save(args.output, np.stack(outputs))
+    with open(args.output + ".json", 'w') as f:
+        json.dump({"precision": engine.precision, "seconds": elapsed, "frames": len(outputs)}, f)
+
+
+def compare(args):
+    precisions = ["float32"] + [p for p in args.precisions if p != "float32"]
+    results = {}
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for precision in precisions:
+            out_path = os.path.join(tmp, f"{precision}.npy")
+            print(f"[INFO] Running FILM at {precision}...")
+            cmd = [sys.executable, __file__, args.input_video, "--worker", precision,
+                   "--output", out_path, "--pairs", str(args.pairs), "--config", args.config]
+            proc = subprocess.run(cmd)
+            if proc.returncode != 0:
+                print(f"[ERROR] {precision} run failed; skipping.")
+                continue
+            with open(out_path + ".json", 'r') as f:
+                stats = json.load(f)
+            stats["images"] = np.load(out_path)
+            results[precision] = stats
+
+    if "float32" not in results:
+        print("[ERROR] float32 reference run failed; cannot compare.")
+        return 1
+
+    reference = results["float32"]
+    ref_ms = 1000 * reference["seconds"] / reference["frames"]
+
+    print(f"\n{'Precision':<12} | {'Effective':<10} | {'ms/frame':<10} | {'Speedup':<8} | {'PSNR (dB)':<10} | {'SSIM':<8}")
+    print("-" * 72)
+    for precision, stats in results.items():
+        ms = 1000 * stats["seconds"] / stats["frames"]
+        if precision == "float32":
+            quality_psnr, quality_ssim = float("inf"), 1.0
+        else:
+            quality_psnr = np.mean([psnr(r, o) for r, o in zip(reference["images"], stats["images"])])
+            quality_ssim = np.mean([ssim(r, o, channel_axis=-1) for r, o in zip(reference["images"], stats["images"])])
+        print(f"{precision:<12} | {stats['precision']:<10} | {ms:<10.1f} | {ref_ms / ms:<8.2f} | {quality_psnr:<10.2f} | {quality_ssim:<8.4f}")
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare speed and accuracy of FILM precision backends against float32")
+    parser.add_argument("input_video", help="Video to sample frame pairs from")
+    parser.add_argument("--pairs", type=int, default=16, help="Number of frame pairs to interpolate")
+    parser.add_argument("--precisions", nargs="+", default=PRECISIONS[1:], choices=PRECISIONS, help="Precisions to compare against float32")
+    parser.add_argument("--config", "-c", default="config.yaml", help="Path to config file")
+    parser.add_argument("--worker", choices=PRECISIONS, help=argparse.SUPPRESS)
+    parser.add_argument("--output", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        run_worker(args)
+    else:
+        sys.exit(compare(args))
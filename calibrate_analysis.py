@@ -0,0 +1,135 @@
+import argparse
+import copy
+import os
+import sys
+import time
+
+import cv2
+import numpy as np
+import yaml
+
+# Ensure we can import from src
+sys.path.append(os.getcwd())
+
+from src.detection.metrics import ArtifactDetector
+from src.explanation.generator import ExplanationGenerator
+from src.interpolation.engine import create_engine
+
+METRICS = ["motion_complexity", "temporal_consistency", "edge_preservation", "occlusion_risk"]
+
+# Smallest denominator for relative drift, in each metric's own units, so
+# near-zero means (e.g. the motion of a static clip) do not inflate it
+METRIC_FLOORS = {
+    "motion_complexity": 1.0,       # px
+    "temporal_consistency": 0.1,
+    "edge_preservation": 0.1,
+    "occlusion_risk": 1.0,          # grey levels
+}
+
+
+def read_pairs(video_path, num_pairs):
+    """Read the first num_pairs consecutive frame pairs (BGR) from a video."""
+    cap = cv2.VideoCapture(video_path)
+    if not cap.isOpened():
+        raise ValueError(f"Could not open video: {video_path}")
+    frames = []
+    while len(frames) < num_pairs + 1:
+        ret, frame = cap.read()
+        if not ret:
+            break
+        frames.append(frame)
+    cap.release()
+    return list(zip(frames[:-1], frames[1:]))
+
+
+def detector_for_level(config, level):
+    config = copy.deepcopy(config)
+    config.setdefault('detection', {})['analysis'] = {'pyramid_level': level, 'max_width': 0}
+    return ArtifactDetector(config)
+
+
+def score_level(detector, explainer, pairs, interpolated):
+    """Metrics and verdicts for every pair at one analysis level, plus ms/pair."""
+    results = []
+    start = time.time()
+    for i, ((prev, nxt), interp) in enumerate(zip(pairs, interpolated)):
+        metrics = detector.detect_artifacts(prev, nxt, interp, 0.5, frame_keys=(i, i + 1))
+        results.append((metrics, explainer.generate_explanation(metrics)))
+    elapsed = time.time() - start
+    return results, 1000 * elapsed / max(1, len(pairs))
+
+
+def calibrate(args):
+    with open(args.config, 'r') as f:
+        config = yaml.safe_load(f)
+
+    pairs = read_pairs(args.input_video, args.pairs)
+    if not pairs:
+        print("[ERROR] Need at least two frames to calibrate.")
+        return 1
+    height, width = pairs[0][0].shape[:2]
+
+    # Realistic interpolated frames to score (engines work in RGB)
+    engine = create_engine(args.engine, config['interpolation'])
+    interpolated = []
+    for prev, nxt in pairs:
+        rgb = engine.interpolate(cv2.cvtColor(prev, cv2.COLOR_BGR2RGB), cv2.cvtColor(nxt, cv2.COLOR_BGR2RGB), 0.5)
+        interpolated.append(cv2.cvtColor(rgb, cv2.COLOR_RGB2BGR))
+
+    explainer = ExplanationGenerator(config)
+    reference, reference_ms = score_level(detector_for_level(config, 0), explainer, pairs, interpolated)
+
+    print(f"[INFO] {len(pairs)} pairs at {width}x{height}, engine '{getattr(engine, 'name', args.engine)}'")
+    header = (f"{'Level':<6} | {'Size':<10} | {'ms/pair':<8} | {'Speedup':<8} | "
+              + " | ".join(f"{m[:16]:<16}" for m in METRICS) + f" | {'Severity':<8} | {'Verdicts':<8}")
+    print("\n" + header)
+    print("-" * len(header))
+
+    recommended = 0
+    for level in range(args.max_level + 1):
+        detector = detector_for_level(config, level)
+        if level == 0:
+            results, ms = reference, reference_ms
+        else:
+            results, ms = score_level(detector, explainer, pairs, interpolated)
+
+        # Mean absolute drift from full resolution, and relative to the metric's
+        # mean (per-pair ratios blow up on near-static pairs; the mean itself is
+        # floored for the same reason)
+        drifts = []
+        for metric in METRICS:
+            ref = np.array([r[0][metric] for r in reference])
+            val = np.array([r[0][metric] for r in results])
+            drift = float(np.mean(np.abs(val - ref)))
+            drifts.append((drift, drift / max(float(np.mean(np.abs(ref))), METRIC_FLOORS[metric])))
+        severity_drift = float(np.mean([abs(r[1]['severity'] - q[1]['severity']) for r, q in zip(results, reference)]))
+        agreement = float(np.mean([r[1]['verdict'] == q[1]['verdict'] for r, q in zip(results, reference)]))
+
+        scale = detector.analysis_scale(width)
+        size = f"{int(round(width * scale))}x{int(round(height * scale))}"
+        print(f"{level:<6} | {size:<10} | {ms:<8.1f} | {reference_ms / ms:<8.2f} | "
+              + " | ".join(f"{f'{drift:.3f} ({100 * relative:.1f}%)':<16}" for drift, relative in drifts)
+              + f" | {severity_drift:<8.3f} | {100 * agreement:<7.1f}%")
+
+        if agreement >= args.min_agreement and severity_drift <= args.max_severity_drift and level == recommended + 1:
+            recommended = level
+
+    print("\nMetric columns are mean absolute drift from full resolution, in the metric's units, and as % of "
+          "the full-resolution mean (floored: " + ", ".join(f"{m} {f:g}" for m, f in METRIC_FLOORS.items()) + ").")
+    print(f"Lowest safe resolution (verdict agreement >= {100 * args.min_agreement:.0f}%, "
+          f"severity drift <= {args.max_severity_drift}): detection.analysis.pyramid_level = {recommended}")
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Report how far artifact metrics drift from full resolution at each analysis pyramid level")
+    parser.add_argument("input_video", help="Sample video to calibrate on")
+    parser.add_argument("--pairs", type=int, default=32, help="Number of frame pairs to score")
+    parser.add_argument("--max-level", type=int, default=3, help="Deepest pyramid level to try (each level halves the resolution)")
+    parser.add_argument("--engine", default="flow", choices=["film", "flow", "linear"], help="Engine producing the frames to score")
+    parser.add_argument("--min-agreement", type=float, default=0.95, help="Minimum fraction of verdicts matching full resolution")
+    parser.add_argument("--max-severity-drift", type=float, default=0.05, help="Maximum mean absolute severity difference")
+    parser.add_argument("--config", "-c", default="config.yaml", help="Path to config file")
+    args = parser.parse_args()
+
+    sys.exit(calibrate(args))
@@ -15,9 +15,9 @@ echo "========================================================"
 echo "[1/2] Enhancing 2x (Original -> 48 FPS)..."
 python main.py "$INPUT_VIDEO" -o "$ENHANCED_2X" -r "report_enhance_2x.json"
 
-# Pass 2: 48 FPS -> 96 FPS
-echo "[2/2] Enhancing 4x (48 FPS -> 96 FPS)..."
-python main.py "$ENHANCED_2X" -o "$ENHANCED_4X" -r "report_enhance_4x.json"
+# Pass 2: 24 FPS -> 96 FPS (single pass, all three intermediate timesteps per pair)
+echo "[2/2] Enhancing 4x (Original -> 96 FPS)..."
+python main.py "$INPUT_VIDEO" -o "$ENHANCED_4X" -r "report_enhance_4x.json" --factor 4
 
 echo "========================================================"
 echo "Enhancement Complete!"
@@ -1,7 +1,6 @@
 import argparse
 import logging
 import sys
-import os
 import yaml
 from rich.logging import RichHandler
 
@@ -14,6 +13,9 @@ logging.basicConfig(
 )
 
 from src.pipeline.orchestrator import PipelineOrchestrator
+from src.pipeline.checkpoint import run_checkpointed
+from src.pipeline.segments import run_segmented
+from src.pipeline.sources import input_exists, open_source, parse_position
 
 def load_config(config_path="config.yaml"):
     with open(config_path, 'r') as f:
@@ -21,23 +23,90 @@ def load_config(config_path="config.yaml"):
 
 def main():
     parser = argparse.ArgumentParser(description="SYNTHESIGHT: Explainable Frame Interpolation")
-    parser.add_argument("input_video", help="Path to input video file")
+    parser.add_argument("input_video", help="Input video file, image sequence (directory, glob or frame_%%05d.png) or - for raw bgr24 frames on stdin")
     parser.add_argument("--output", "-o", default="output.mp4", help="Path to output video file")
     parser.add_argument("--report", "-r", default="report.json", help="Path to output report JSON")
     parser.add_argument("--config", "-c", default="config.yaml", help="Path to config file")
+    rate_group = parser.add_mutually_exclusive_group()
+    rate_group.add_argument("--target-fps", type=float, help="Exact output frame rate (e.g. 60 for 24->60)")
+    rate_group.add_argument("--factor", type=int, help="Output frame-rate multiplier (e.g. 4 for 4x in one pass)")
+    parser.add_argument("--passes", type=int, default=1, help="Chain N in-memory interpolation passes of --factor each (e.g. 2 for 10->20->40 FPS)")
+    parser.add_argument("--intermediate", nargs="*", default=[], help="Optional video paths for the intermediate passes' output")
+    parser.add_argument("--workers", type=int, default=1, help="Split the video into N time ranges processed in parallel processes")
+    parser.add_argument("--start", help="First source frame to process: frame number, seconds (12.5s) or timecode (00:01:02.5)")
+    parser.add_argument("--end", help="Last source frame to process (inclusive), in the same forms as --start")
+    parser.add_argument("--input-fps", type=float, help="Frame rate of image-sequence and raw-pipe input (overrides input.fps)")
+    parser.add_argument("--input-size", help="WxH of raw-pipe input, e.g. 1920x1080 (overrides input.size)")
+    parser.add_argument("--resume", action="store_true", help="Continue an interrupted checkpointed run from its last checkpoint")
     
     args = parser.parse_args()
 
-    if not os.path.exists(args.input_video):
+    if args.passes > 1 and args.target_fps:
+        parser.error("--target-fps cannot be combined with --passes; use --factor")
+    if args.workers > 1 and args.resume:
+        parser.error("--resume is not supported with --workers")
+
+    if not input_exists(args.input_video):
         print(f"Error: Input file '{args.input_video}' not found.")
         sys.exit(1)
 
     try:
         config = load_config(args.config)
         # Override config with CLI args if needed
-        
+        config['input'] = input_cfg = config.get('input') or {}
+        if args.input_fps:
+            input_cfg['fps'] = args.input_fps
+        if args.input_size:
+            input_cfg['size'] = args.input_size
+
+        frame_range = None
+        if args.start is not None or args.end is not None:
+            source = open_source(args.input_video, config)
+            source.release()
+            try:
+                start = parse_position(args.start, source.fps) if args.start is not None else 0
+            except ValueError as e:
+                parser.error(f"--start: {e}")
+            try:
+                end = parse_position(args.end, source.fps) if args.end is not None else None
+            except ValueError as e:
+                parser.error(f"--end: {e}")
+            if end is not None and end <= start:
+                parser.error("--end must come after --start")
+            frame_range = (start, end)
+
+        # Configs written before the pipeline section existed have none
+        checkpoint_interval = (config.get('pipeline') or {}).get('checkpoint_interval', 0)
+        checkpointed = args.resume or checkpoint_interval > 0
+
+        if args.workers > 1 or checkpointed:
+            if args.intermediate:
+                parser.error("--intermediate is not supported with --workers or checkpointing")
+            if args.passes > 1:
+                factor = args.factor or config['interpolation'].get('factor', 2)
+                stage_rates = [(None, factor)] * args.passes
+            else:
+                stage_rates = [(args.target_fps, args.factor)]
+            if args.workers > 1:
+                run_segmented(config, args.input_video, args.output, args.report, stage_rates, args.workers,
+                              frame_range=frame_range)
+            else:
+                run_checkpointed(config, args.input_video, args.output, args.report, stage_rates,
+                                 checkpoint_interval, resume=args.resume, frame_range=frame_range)
+            return
+
         orchestrator = PipelineOrchestrator(config)
-        orchestrator.process_video(args.input_video, args.output, args.report)
+        if args.passes > 1:
+            factor = args.factor or config['interpolation'].get('factor', 2)
+            orchestrator.process_multipass(
+                args.input_video, args.output, args.report,
+                [factor] * args.passes, intermediate_outputs=args.intermediate, frame_range=frame_range
+            )
+        else:
+            orchestrator.process_video(
+                args.input_video, args.output, args.report,
+                target_fps=args.target_fps, factor=args.factor, frame_range=frame_range
+            )
     except Exception as e:
         logging.error(f"Fatal error: {e}", exc_info=True)
         sys.exit(1)
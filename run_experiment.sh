@@ -16,22 +16,19 @@ echo "========================================================"
 echo "[1/3] Choppifying original video to 10 FPS..."
 python generate_choppy_video.py "$INPUT_VIDEO" -o "$CHOPPY_VIDEO" -f 10
 
-# 2. Restore Pass 1 (10 FPS -> 20 FPS)
-echo "[2/3] Running Restoration Pass 1 (10 -> 20 FPS)..."
-python main.py "$CHOPPY_VIDEO" -o "$RESTORED_1" -r "report_pass1.json"
-
-# 3. Restore Pass 2 (20 FPS -> 40 FPS)
-echo "[3/3] Running Restoration Pass 2 (20 -> 40 FPS)..."
-# We use the output of pass 1 as input here
-python main.py "$RESTORED_1" -o "$RESTORED_2" -r "report_pass2.json"
+# 2-3. Restore Pass 1 + Pass 2 (10 FPS -> 20 FPS -> 40 FPS)
+# Both passes run in one invocation; pass 1 frames stay in memory and are
+# also written to $RESTORED_1 for inspection.
+echo "[2-3/6] Running Restoration Passes 1+2 (10 -> 20 -> 40 FPS)..."
+python main.py "$CHOPPY_VIDEO" -o "$RESTORED_2" -r "report_pass2.json" --factor 2 --passes 2 --intermediate "$RESTORED_1"
 
 # 4. Super-Smooth 2x (Original -> 2x)
 echo "[4/6] Generating Super-Smooth 2x (Original -> 2x)..."
 python main.py "$INPUT_VIDEO" -o "my_video_2x.mp4" -r "report_2x.json"
 
-# 5. Super-Smooth 4x (2x -> 4x)
-echo "[5/6] Generating Super-Smooth 4x (2x -> 4x)..."
-python main.py "my_video_2x.mp4" -o "my_video_4x.mp4" -r "report_4x.json"
+# 5. Super-Smooth 4x (Original -> 4x in a single pass)
+echo "[5/6] Generating Super-Smooth 4x (Original -> 4x)..."
+python main.py "$INPUT_VIDEO" -o "my_video_4x.mp4" -r "report_4x.json" --factor 4
 
 # 6. Generate Final Report
 echo "[6/6] Injecting Video Gallery and Stats into Report..."
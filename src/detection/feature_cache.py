@@ -0,0 +1,88 @@
+import threading
+from collections import OrderedDict
+
+import cv2
+import numpy as np
+
+
+def downscale(frame, scale):
+    """Area-downscale a frame by `scale` (returned as-is when scale >= 1)."""
+    if scale >= 1.0:
+        return frame
+    h, w = frame.shape[:2]
+    size = (max(1, int(round(w * scale))), max(1, int(round(h * scale))))
+    return cv2.resize(frame, size, interpolation=cv2.INTER_AREA)
+
+
+class FrameFeatures:
+    """Derived images of one original frame, computed lazily and at most once."""
+    def __init__(self, frame):
+        self.frame = frame
+        self._gray = None
+        self._edges = None
+        self._edge_density = None
+        self._scaled = {}
+
+    @property
+    def gray(self):
+        if self._gray is None:
+            self._gray = cv2.cvtColor(self.frame, cv2.COLOR_BGR2GRAY)
+        return self._gray
+
+    @property
+    def edges(self):
+        # Canny on the colour frame, matching ArtifactDetector's edge metric
+        if self._edges is None:
+            self._edges = cv2.Canny(self.frame, 100, 200)
+        return self._edges
+
+    @property
+    def edge_density(self):
+        if self._edge_density is None:
+            self._edge_density = float(np.sum(self.edges))
+        return self._edge_density
+
+    def scaled(self, scale):
+        """Features of the frame downscaled by `scale` (self when scale >= 1)."""
+        if scale >= 1.0:
+            return self
+        if scale not in self._scaled:
+            self._scaled[scale] = FrameFeatures(downscale(self.frame, scale))
+        return self._scaled[scale]
+
+
+class FrameFeatureCache:
+    """
+    Small LRU of FrameFeatures keyed by frame index. In a streaming pipeline a
+    pair's "next" frame is the following pair's "prev", so keeping the last
+    few frames is enough for every original frame to be analyzed once.
+    Safe to share between QA worker threads.
+    """
+    def __init__(self, max_frames=8):
+        self.max_frames = max(1, int(max_frames))
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, frame):
+        """
+        Features for `frame`; key=None bypasses the cache. Entries are found
+        by key alone, so a frame arriving as a new array (a fresh view of a
+        shared-memory slot in QA worker processes) still hits; keys must not
+        be reused for other frames until clear().
+        """
+        if key is None:
+            return FrameFeatures(frame)
+        with self._lock:
+            features = self._entries.get(key)
+            if features is None:
+                features = FrameFeatures(frame)
+                self._entries[key] = features
+                if len(self._entries) > self.max_frames:
+                    self._entries.popitem(last=False)
+            else:
+                self._entries.move_to_end(key)
+        return features
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
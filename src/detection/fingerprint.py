@@ -0,0 +1,27 @@
+import cv2
+import numpy as np
+
+
+class FrameFingerprinter:
+    """
+    Cheap per-frame fingerprint used to spot duplicate / static frame pairs.
+    A frame is reduced to a tiny grayscale thumbnail (area-averaged), so codec
+    noise averages out while any real change (even a moving cursor) still
+    shifts at least one cell noticeably.
+    """
+    def __init__(self, config=None):
+        fast_cfg = ((config or {}).get('detection', {}) or {}).get('duplicate_fast_path', {})
+        self.enabled = fast_cfg.get('enabled', True)
+        self.hash_size = int(fast_cfg.get('hash_size', 32))
+        # Largest per-cell difference (0-255) still treated as "identical"
+        self.tolerance = float(fast_cfg.get('tolerance', 2.0))
+
+    def compute(self, frame):
+        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+        thumb = cv2.resize(gray, (self.hash_size, self.hash_size), interpolation=cv2.INTER_AREA)
+        return thumb.astype(np.int16)
+
+    def is_duplicate(self, fingerprint1, fingerprint2):
+        if not self.enabled or fingerprint1 is None or fingerprint2 is None:
+            return False
+        return int(np.abs(fingerprint1 - fingerprint2).max()) <= self.tolerance
@@ -0,0 +1,105 @@
+import threading
+
+import cv2
+from abc import ABC, abstractmethod
+
+
+class FlowBackend(ABC):
+    """Dense optical flow between two grayscale frames, returned as (H, W, 2) float32."""
+    name = None
+
+    @abstractmethod
+    def calc(self, gray1, gray2):
+        pass
+
+    def describe(self):
+        return self.name
+
+
+class FarnebackFlow(FlowBackend):
+    name = "farneback"
+
+    def __init__(self, flow_config=None):
+        flow_config = flow_config or {}
+        self.pyr_scale = float(flow_config.get('pyr_scale', 0.5))
+        self.levels = int(flow_config.get('levels', 3))
+        self.winsize = int(flow_config.get('winsize', 15))
+        self.iterations = int(flow_config.get('iterations', 3))
+        self.poly_n = int(flow_config.get('poly_n', 5))
+        self.poly_sigma = float(flow_config.get('poly_sigma', 1.2))
+
+    def calc(self, gray1, gray2):
+        return cv2.calcOpticalFlowFarneback(
+            gray1, gray2, None,
+            self.pyr_scale, self.levels, self.winsize, self.iterations, self.poly_n, self.poly_sigma, 0
+        )
+
+
+class DISFlow(FlowBackend):
+    """
+    OpenCV's Dense Inverse Search; several times faster than Farneback on CPU.
+    The DIS object keeps state between calls, so each thread gets its own.
+    """
+    name = "dis"
+
+    PRESETS = {
+        "ultrafast": cv2.DISOPTICAL_FLOW_PRESET_ULTRAFAST,
+        "fast": cv2.DISOPTICAL_FLOW_PRESET_FAST,
+        "medium": cv2.DISOPTICAL_FLOW_PRESET_MEDIUM,
+    }
+
+    def __init__(self, flow_config=None):
+        flow_config = flow_config or {}
+        self.preset = flow_config.get('preset', 'fast')
+        if self.preset not in self.PRESETS:
+            raise ValueError(f"Unknown DIS preset: {self.preset}")
+        self._local = threading.local()
+
+    def calc(self, gray1, gray2):
+        dis = getattr(self._local, 'dis', None)
+        if dis is None:
+            dis = self._local.dis = cv2.DISOpticalFlow_create(self.PRESETS[self.preset])
+        return dis.calc(gray1, gray2, None)
+
+    def describe(self):
+        return f"dis-{self.preset}"
+
+
+class PyramidFlow(FlowBackend):
+    """
+    Coarse estimate only: both frames are reduced `pyramid_levels` times with
+    cv2.pyrDown, single-level Farneback runs on the smallest image, and the
+    flow is upsampled (vectors scaled by 2^levels). Misses fine motion but
+    costs a small fraction of a full-resolution solve.
+    """
+    name = "pyramid"
+
+    def __init__(self, flow_config=None):
+        flow_config = flow_config or {}
+        self.levels = max(0, int(flow_config.get('pyramid_levels', 2)))
+        self.winsize = int(flow_config.get('winsize', 9))
+
+    def calc(self, gray1, gray2):
+        h, w = gray1.shape[:2]
+        for _ in range(self.levels):
+            gray1 = cv2.pyrDown(gray1)
+            gray2 = cv2.pyrDown(gray2)
+        flow = cv2.calcOpticalFlowFarneback(gray1, gray2, None, 0.5, 1, self.winsize, 3, 5, 1.1, 0)
+        if self.levels:
+            flow = cv2.resize(flow, (w, h), interpolation=cv2.INTER_LINEAR) * (w / gray1.shape[1])
+        return flow
+
+    def describe(self):
+        return f"pyramid-{self.levels}"
+
+
+FLOW_BACKENDS = {backend.name: backend for backend in (FarnebackFlow, DISFlow, PyramidFlow)}
+
+
+def create_flow_backend(flow_config=None, default_method="farneback"):
+    """Build a flow backend from a config section whose 'method' picks the estimator."""
+    flow_config = flow_config or {}
+    method = flow_config.get('method', default_method)
+    if method not in FLOW_BACKENDS:
+        raise ValueError(f"Unknown optical flow method: {method}")
+    return FLOW_BACKENDS[method](flow_config)
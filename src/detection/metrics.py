@@ -1,22 +1,99 @@
 import cv2
 import numpy as np
-from skimage.metrics import structural_similarity as ssim
 from skimage.metrics import peak_signal_noise_ratio as psnr
 import logging
+import threading
+from collections import OrderedDict
+
+from src.detection.feature_cache import FrameFeatureCache, downscale
+from src.detection.flow import create_flow_backend
+from src.detection.ssim import ssim
+from src.detection.tiles import tile_means, tile_sums
+
+class ArtifactAnalysis:
+    """
+    Result of ArtifactDetector.analyze: the scalar metrics that go into the
+    report, plus the intermediate arrays they were computed from so the
+    visualizer and explanation stages can reuse them instead of recomputing.
+    Arrays are at analysis resolution (source size * scale); flow values are
+    in source pixels.
+    """
+    def __init__(self, metrics, flow, magnitude, edges_interp, frame_diff, ssim_map=None, scale=1.0, tiles=None):
+        self.metrics = metrics
+        self.scale = scale
+        # Coarse (rows, cols) grids of motion, ssim, edge_loss and difference
+        self.tiles = tiles
+        self.ssim_map = ssim_map          # interpolated vs time-weighted blend, per pixel
+        self.flow = flow                  # prev -> next optical flow (h, w, 2)
+        self.magnitude = magnitude        # per-pixel flow magnitude (h, w)
+        self.edges_interp = edges_interp  # Canny edges of the interpolated frame
+        self.frame_diff = frame_diff      # absdiff(prev, next)
+
+    def error_map(self, width, height, tile_severity=None):
+        """
+        Per-pixel dissimilarity (1 - SSIM) as a 0-255 uint8 map at frame size.
+        With a tile severity grid, each pixel shows the larger of the two, so
+        tiles flagged by other metrics (motion, edge loss) light up as well.
+        """
+        error = np.clip(1.0 - self.ssim_map, 0.0, 1.0)
+        if tile_severity is not None:
+            severity = cv2.resize(tile_severity.astype(np.float32), (error.shape[1], error.shape[0]),
+                                  interpolation=cv2.INTER_LINEAR)
+            error = np.maximum(error, severity)
+        error = (error * 255).astype(np.uint8)
+        if error.shape[:2] != (height, width):
+            error = cv2.resize(error, (width, height))
+        return error
 
 class ArtifactDetector:
     def __init__(self, config=None):
         self.logger = logging.getLogger(__name__)
         self.config = config
+        detection_cfg = (config or {}).get('detection', {})
+        cache_size = detection_cfg.get('feature_cache_size', 8)
+        # Shared with AdvancedVisualizer so each original frame is analyzed once
+        self.feature_cache = FrameFeatureCache(cache_size)
+        # Pair-level results (flow, occlusion) by frame keys, reused across the
+        # timesteps and engine-cascade candidates of a pair; LRU like the feature cache
+        self._pair_cache = OrderedDict()
+        self._pair_cache_size = max(1, int(cache_size))
+        self._pair_lock = threading.Lock()
+        # Metrics are computed on frames downscaled by 2^-pyramid_level,
+        # and/or capped to max_width pixels (0 = no cap)
+        analysis_cfg = detection_cfg.get('analysis', {}) or {}
+        self.pyramid_level = int(analysis_cfg.get('pyramid_level', 0))
+        self.max_width = int(analysis_cfg.get('max_width', 0))
+        self.ssim_window = detection_cfg.get('ssim_window', 'box')
+        # Coarse spatial grid of the metrics, for heatmaps and localized explanations
+        tiles_cfg = detection_cfg.get('tiles', {}) or {}
+        self.tiles_enabled = tiles_cfg.get('enabled', True)
+        self.tile_rows = int(tiles_cfg.get('rows', 9))
+        self.tile_cols = int(tiles_cfg.get('cols', 16))
+        # Motion estimator for the motion_complexity metric and the shared flow field
+        self.flow_backend = create_flow_backend(detection_cfg.get('flow'))
 
-    def calculate_ssim(self, img1, img2):
+    def analysis_scale(self, width):
+        """Downscale factor applied to a frame of this width before analysis."""
+        scale = 0.5 ** self.pyramid_level
+        if self.max_width and width * scale > self.max_width:
+            scale = self.max_width / width
+        return min(1.0, scale)
+
+    def calculate_ssim(self, img1, img2, full=False):
         """
         Calculate Structural Similarity Index (SSIM).
+        With full=True, returns (score, per-pixel SSIM map).
         """
         # Convert to grayscale for SSIM
         gray1 = cv2.cvtColor(img1, cv2.COLOR_BGR2GRAY)
         gray2 = cv2.cvtColor(img2, cv2.COLOR_BGR2GRAY)
-        return ssim(gray1, gray2)
+        return ssim(gray1, gray2, full=full, window=self.ssim_window)
+
+    def calculate_ssim_batch(self, imgs1, imgs2, full=False):
+        """SSIM of two equally long lists of BGR frames, evaluated as one stack."""
+        gray1 = np.stack([cv2.cvtColor(img, cv2.COLOR_BGR2GRAY) for img in imgs1])
+        gray2 = np.stack([cv2.cvtColor(img, cv2.COLOR_BGR2GRAY) for img in imgs2])
+        return ssim(gray1, gray2, full=full, window=self.ssim_window)
 
     def calculate_psnr(self, img1, img2):
         """
@@ -24,20 +101,14 @@ class ArtifactDetector:
         """
         return psnr(img1, img2)
 
-    def calculate_optical_flow_magnitude(self, img1, img2):
+    def calculate_optical_flow(self, gray1, gray2):
         """
-        Calculate average optical flow magnitude to estimate motion complexity.
+        Dense optical flow between two grayscale frames.
+        Returns (flow, per-pixel magnitude).
         """
-        gray1 = cv2.cvtColor(img1, cv2.COLOR_BGR2GRAY)
-        gray2 = cv2.cvtColor(img2, cv2.COLOR_BGR2GRAY)
-        
-        flow = cv2.calcOpticalFlowFarneback(
-            gray1, gray2, None, 
-            0.5, 3, 15, 3, 5, 1.2, 0
-        )
-        
+        flow = self.flow_backend.calc(gray1, gray2)
         magnitude, _ = cv2.cartToPolar(flow[..., 0], flow[..., 1])
-        return np.mean(magnitude)
+        return flow, magnitude
 
     def estimate_occlusion(self, img1, img2):
         """
@@ -48,36 +119,130 @@ class ArtifactDetector:
         diff = cv2.absdiff(img1, img2)
         return np.mean(diff)
 
-    def detect_artifacts(self, original_prev, original_next, interpolated):
+    def detect_artifacts(self, original_prev, original_next, interpolated, time=0.5, frame_keys=None):
+        """
+        Run a suite of checks to detect potential artifacts.
+        Returns the metrics dict; use analyze() to also get the flow field
+        and other intermediate arrays.
+        """
+        return self.analyze(original_prev, original_next, interpolated, time, frame_keys).metrics
+
+    def _pair_analysis(self, original_prev, original_next, frame_keys, scale):
+        """
+        Flow and frame difference depend only on the original pair, so with
+        frame keys they are computed once and reused for every timestep and
+        every engine-cascade candidate of the pair.
+        """
+        prev_key, next_key = frame_keys or (None, None)
+        prev_features = self.feature_cache.get(prev_key, original_prev).scaled(scale)
+        next_features = self.feature_cache.get(next_key, original_next).scaled(scale)
+
+        cache_key = (prev_key, next_key, scale) if frame_keys is not None else None
+        if cache_key is not None:
+            with self._pair_lock:
+                results = self._pair_cache.get(cache_key)
+                if results is not None:
+                    self._pair_cache.move_to_end(cache_key)
+                    return prev_features, next_features, results
+
+        flow, magnitude = self.calculate_optical_flow(prev_features.gray, next_features.gray)
+        if scale < 1.0:
+            # Report motion in source pixels
+            flow /= scale
+            magnitude /= scale
+        frame_diff = cv2.absdiff(prev_features.frame, next_features.frame)
+        pair_tiles = self._pair_tiles(prev_features, next_features, magnitude, frame_diff) if self.tiles_enabled else None
+        results = (flow, magnitude, frame_diff, pair_tiles)
+        if cache_key is not None:
+            with self._pair_lock:
+                self._pair_cache[cache_key] = results
+                if len(self._pair_cache) > self._pair_cache_size:
+                    self._pair_cache.popitem(last=False)
+        return prev_features, next_features, results
+
+    def clear_cache(self):
+        """Forget cached frame features and pair results (frame keys restart with each run)."""
+        self.feature_cache.clear()
+        with self._pair_lock:
+            self._pair_cache.clear()
+
+    def _pair_tiles(self, prev_features, next_features, magnitude, frame_diff):
+        """Tile reductions that depend only on the original pair."""
+        rows, cols = self.tile_rows, self.tile_cols
+        return {
+            "motion": tile_means(magnitude, rows, cols),
+            "difference": tile_means(frame_diff, rows, cols),
+            "edge_sums": (tile_sums(prev_features.edges, rows, cols) + tile_sums(next_features.edges, rows, cols)) / 2,
+        }
+
+    def _frame_tiles(self, pair_tiles, ssim_map, edges_interp):
+        rows, cols = self.tile_rows, self.tile_cols
+        edge_orig = pair_tiles["edge_sums"]
+        edge_interp = tile_sums(edges_interp, rows, cols)
+        # Edge loss only where the originals have some structure (>= 1% edge pixels)
+        tile_area = (edges_interp.shape[0] / rows) * (edges_interp.shape[1] / cols)
+        textured = edge_orig >= 0.01 * tile_area * 255
+        edge_loss = np.where(textured, np.clip(1.0 - edge_interp / np.maximum(edge_orig, 1e-6), 0.0, 1.0), 0.0)
+        return {
+            "motion": pair_tiles["motion"],
+            "ssim": tile_means(ssim_map, rows, cols),
+            "edge_loss": edge_loss.astype(np.float32),
+            "difference": pair_tiles["difference"],
+        }
+
+    def analyze(self, original_prev, original_next, interpolated, time=0.5, frame_keys=None):
         """
         Run a suite of checks to detect potential artifacts.
+        `time` is the timestep of the interpolated frame between prev and next.
+        `frame_keys` = (prev_key, next_key) lets derived features of the
+        original frames (gray, edges) come from the per-frame cache.
+        """
+        return self.analyze_batch(original_prev, original_next, [interpolated], [time], frame_keys)[0]
+
+    def analyze_batch(self, original_prev, original_next, interpolated_frames, times, frame_keys=None):
         """
-        
+        analyze() for several interpolated frames of the same pair, one per
+        entry of `times`. The SSIM of all of them is evaluated as one stack.
+        Returns one ArtifactAnalysis per frame.
+        """
+        if not interpolated_frames:
+            return []
+        scale = self.analysis_scale(original_prev.shape[1])
+        prev_features, next_features, (flow, magnitude, frame_diff, pair_tiles) = self._pair_analysis(
+            original_prev, original_next, frame_keys, scale
+        )
+        interpolated_frames = [downscale(interpolated, scale) for interpolated in interpolated_frames]
+
         # 1. Motion Complexity
-        motion_mag = self.calculate_optical_flow_magnitude(original_prev, original_next)
-        
+        motion_mag = np.mean(magnitude)
+
         # 2. Temporal Consistency (simplified)
-        # Compare interpolated frame to the average of prev and next
-        avg_frame = cv2.addWeighted(original_prev, 0.5, original_next, 0.5, 0)
-        consistency_score = self.calculate_ssim(interpolated, avg_frame)
-        
-        # 3. Edge Analysis (Ghosting detection)
-        edges_prev = cv2.Canny(original_prev, 100, 200)
-        edges_next = cv2.Canny(original_next, 100, 200)
-        edges_interp = cv2.Canny(interpolated, 100, 200)
-        
-        edge_density_orig = (np.sum(edges_prev) + np.sum(edges_next)) / 2
-        edge_density_interp = np.sum(edges_interp)
-        edge_preservation = edge_density_interp / (edge_density_orig + 1e-6) 
+        # Compare each interpolated frame to the time-weighted average of prev and next
+        avg_frames = [
+            cv2.addWeighted(prev_features.frame, 1.0 - time, next_features.frame, time, 0) for time in times
+        ]
+        consistency_scores, ssim_maps = self.calculate_ssim_batch(interpolated_frames, avg_frames, full=True)
+
+        edge_density_orig = (prev_features.edge_density + next_features.edge_density) / 2
 
         # 4. Occlusion Risk
-        occlusion_risk = self.estimate_occlusion(original_prev, original_next)
+        # For MVP: mean pixel difference between frames as a proxy (see estimate_occlusion)
+        occlusion_risk = np.mean(frame_diff)
 
-        metrics = {
-            "motion_complexity": float(motion_mag),
-            "temporal_consistency": float(consistency_score),
-            "edge_preservation": float(edge_preservation),
-            "occlusion_risk": float(occlusion_risk)
-        }
-        
-        return metrics
+        analyses = []
+        for interpolated, consistency_score, ssim_map in zip(interpolated_frames, consistency_scores, ssim_maps):
+            # 3. Edge Analysis (Ghosting detection)
+            edges_interp = cv2.Canny(interpolated, 100, 200)
+            edge_density_interp = np.sum(edges_interp)
+            edge_preservation = edge_density_interp / (edge_density_orig + 1e-6)
+
+            metrics = {
+                "motion_complexity": float(motion_mag),
+                "temporal_consistency": float(consistency_score),
+                "edge_preservation": float(edge_preservation),
+                "occlusion_risk": float(occlusion_risk)
+            }
+
+            tiles = self._frame_tiles(pair_tiles, ssim_map, edges_interp) if pair_tiles is not None else None
+            analyses.append(ArtifactAnalysis(metrics, flow, magnitude, edges_interp, frame_diff, ssim_map, scale, tiles))
+        return analyses
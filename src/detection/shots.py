@@ -0,0 +1,158 @@
+import argparse
+import bisect
+import json
+
+import cv2
+
+from src.pipeline.sources import open_source
+
+
+class ShotBoundaryDetector:
+    """
+    Scene-cut detection from compact per-frame colour signatures.
+    Each frame is reduced once to a normalized 180x256-bin H-S histogram of
+    a copy area-downscaled by an integer factor to about signature_width
+    (integer factors take OpenCV's fast path; fractional ones can cost more
+    than the full frame). The bins stay those scene_change_diff is
+    calibrated for: coarser bins raise the similarity of real cuts.
+    Consecutive signatures are compared with histogram correlation.
+    Callers that stream frames keep the signature of "next" and reuse it as
+    "prev" for the following pair, so every frame is analyzed exactly once.
+    """
+    def __init__(self, config=None):
+        config = config or {}
+        detection_cfg = config.get('detection', {})
+        shots_cfg = detection_cfg.get('shots', {})
+        self.signature_width = int(shots_cfg.get('signature_width', 320))
+        self.hist_bins = list(shots_cfg.get('hist_bins', [180, 256]))
+        self.scene_change_threshold = detection_cfg.get('thresholds', {}).get('scene_change_diff', 0.3)
+        self.config = config
+
+    def signature(self, frame, is_rgb=False):
+        h, w = frame.shape[:2]
+        factor = w // self.signature_width if self.signature_width > 0 else 1
+        if factor >= 2 and h >= factor:
+            # Crop to a multiple of the factor so the reduction is exact
+            h, w = h - h % factor, w - w % factor
+            frame = cv2.resize(frame[:h, :w], (w // factor, h // factor), interpolation=cv2.INTER_AREA)
+        hsv = cv2.cvtColor(frame, cv2.COLOR_RGB2HSV if is_rgb else cv2.COLOR_BGR2HSV)
+        hist = cv2.calcHist([hsv], [0, 1], None, self.hist_bins, [0, 180, 0, 256])
+        cv2.normalize(hist, hist, 0, 1, cv2.NORM_MINMAX)
+        return hist
+
+    def compare(self, signature1, signature2):
+        """
+        Returns (is_cut, similarity). Similarity is histogram correlation
+        (1.0 = identical); scene_change_diff 0.3 means a cut below 0.7.
+        """
+        similarity = cv2.compareHist(signature1, signature2, cv2.HISTCMP_CORREL)
+        return similarity < 1.0 - self.scene_change_threshold, similarity
+
+    def scan(self, video_path):
+        """
+        Pre-pass: build the ShotIndex for a whole input (any source
+        open_source accepts; frame rate and size of image sequences and raw
+        pipes come from config.yaml's input section).
+        """
+        source = open_source(video_path, self.config)
+        index = ShotIndex(source.fps)
+
+        prev_sig = None
+        frame_idx = 0
+        for frame in source.frames():
+            sig = self.signature(frame)
+            if prev_sig is not None:
+                index.add_pair(frame_idx - 1, *self.compare(prev_sig, sig))
+            else:
+                index.num_frames = 1
+            prev_sig = sig
+            frame_idx += 1
+        source.release()
+        return index
+
+
+class ShotIndex:
+    """
+    Shot boundaries of one video. A boundary at frame b means there is a cut
+    between frames b-1 and b, i.e. shot k spans [boundaries[k-1], boundaries[k]).
+    """
+    def __init__(self, fps=None):
+        self.fps = fps
+        self.num_frames = 0
+        self.boundaries = []
+        self.cut_similarities = []
+
+    def add_pair(self, pair_index, is_cut, similarity):
+        """Record the scene-cut decision for the pair (pair_index, pair_index + 1)."""
+        self.num_frames = max(self.num_frames, pair_index + 2)
+        if is_cut:
+            self.boundaries.append(pair_index + 1)
+            self.cut_similarities.append(float(similarity))
+
+    def is_cut(self, pair_index):
+        i = bisect.bisect_left(self.boundaries, pair_index + 1)
+        return i < len(self.boundaries) and self.boundaries[i] == pair_index + 1
+
+    def shot_of(self, frame_index):
+        return bisect.bisect_right(self.boundaries, frame_index)
+
+    def shots(self):
+        """List of (start_frame, end_frame_exclusive) per shot."""
+        starts = [0] + self.boundaries
+        ends = self.boundaries + [self.num_frames]
+        return list(zip(starts, ends))
+
+    def to_dict(self):
+        return {
+            "fps": self.fps,
+            "num_frames": self.num_frames,
+            "boundaries": self.boundaries,
+            "cut_similarities": self.cut_similarities,
+            "shots": [
+                {
+                    "shot": k,
+                    "start_frame": start,
+                    "end_frame": end,
+                    "start_time": start / self.fps if self.fps else None,
+                    "end_time": end / self.fps if self.fps else None,
+                }
+                for k, (start, end) in enumerate(self.shots())
+            ],
+        }
+
+    def save(self, path):
+        with open(path, 'w') as f:
+            json.dump(self.to_dict(), f, indent=2)
+
+    @classmethod
+    def load(cls, path):
+        with open(path, 'r') as f:
+            data = json.load(f)
+        index = cls(data.get("fps"))
+        index.num_frames = data["num_frames"]
+        index.boundaries = list(data["boundaries"])
+        index.cut_similarities = list(data.get("cut_similarities", []))
+        return index
+
+
+if __name__ == "__main__":
+    import yaml
+
+    parser = argparse.ArgumentParser(description="Build a shot-boundary index for a video")
+    parser.add_argument("input_video", help="Input video file, image sequence or - for raw bgr24 frames on stdin")
+    parser.add_argument("--output", "-o", default="shots.json", help="Path to output index JSON")
+    parser.add_argument("--config", "-c", default="config.yaml", help="Path to config file")
+    parser.add_argument("--input-fps", type=float, help="Frame rate of image-sequence and raw-pipe input (overrides input.fps)")
+    parser.add_argument("--input-size", help="WxH of raw-pipe input, e.g. 1920x1080 (overrides input.size)")
+    args = parser.parse_args()
+
+    with open(args.config, 'r') as f:
+        config = yaml.safe_load(f)
+    config['input'] = input_cfg = config.get('input') or {}
+    if args.input_fps:
+        input_cfg['fps'] = args.input_fps
+    if args.input_size:
+        input_cfg['size'] = args.input_size
+    index = ShotBoundaryDetector(config).scan(args.input_video)
+    index.save(args.output)
+    print(f"{len(index.shots())} shots, {len(index.boundaries)} cuts -> {args.output}")
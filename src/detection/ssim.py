@@ -0,0 +1,77 @@
+import cv2
+import numpy as np
+
+# OpenCV filters take at most this many channels per call (CV_CN_MAX: 512 in
+# OpenCV 4, 128 in OpenCV 5)
+MAX_CHANNELS = 128
+
+
+def _local_mean(x, window):
+    if window == "gaussian":
+        return cv2.GaussianBlur(x, (11, 11), 1.5, borderType=cv2.BORDER_REFLECT)
+    return cv2.boxFilter(x, -1, (7, 7), normalize=True, borderType=cv2.BORDER_REFLECT)
+
+
+def _ssim_map(x, y, window, data_range):
+    """SSIM map of two float32 (H, W) or (H, W, C) images, one SSIM per channel."""
+    mu_x = _local_mean(x, window)
+    mu_y = _local_mean(y, window)
+    xx = _local_mean(x * x, window)
+    yy = _local_mean(y * y, window)
+    xy = _local_mean(x * y, window)
+
+    # Box window uses the unbiased (sample) covariance, like skimage's default
+    cov_norm = 49.0 / 48.0 if window == "box" else 1.0
+    mu_xx = mu_x * mu_x
+    mu_yy = mu_y * mu_y
+    mu_xy = mu_x * mu_y
+    var_x = cov_norm * (xx - mu_xx)
+    var_y = cov_norm * (yy - mu_yy)
+    cov_xy = cov_norm * (xy - mu_xy)
+
+    c1 = (0.01 * data_range) ** 2
+    c2 = (0.03 * data_range) ** 2
+    return ((2 * mu_xy + c1) * (2 * cov_xy + c2)) / ((mu_xx + mu_yy + c1) * (var_x + var_y + c2))
+
+
+def ssim(img1, img2, full=False, window="box", data_range=255.0):
+    """
+    Structural similarity of grayscale images using separable OpenCV filters.
+
+    img1, img2: (H, W) frames, or (N, H, W) stacks evaluated in one pass
+    (frames become channels of a single filter call).
+    window: "box" (7x7, matches skimage's default structural_similarity) or
+    "gaussian" (11x11, sigma 1.5, as in the original SSIM paper).
+
+    Returns the mean SSIM (float, or (N,) array for stacks); with full=True
+    returns (mean, ssim_map) where the map has the input's shape.
+    """
+    stacked = img1.ndim == 3
+    x = np.asarray(img1, dtype=np.float32)
+    y = np.asarray(img2, dtype=np.float32)
+    if stacked:
+        x = np.moveaxis(x, 0, -1)
+        y = np.moveaxis(y, 0, -1)
+
+    if stacked and x.shape[-1] > MAX_CHANNELS:
+        maps = [
+            _ssim_map(np.ascontiguousarray(x[..., i:i + MAX_CHANNELS]),
+                      np.ascontiguousarray(y[..., i:i + MAX_CHANNELS]), window, data_range)
+            for i in range(0, x.shape[-1], MAX_CHANNELS)
+        ]
+        ssim_map = np.concatenate([m.reshape(m.shape[:2] + (-1,)) for m in maps], axis=-1)
+    else:
+        ssim_map = _ssim_map(np.ascontiguousarray(x), np.ascontiguousarray(y), window, data_range)
+        if stacked and ssim_map.ndim == 2:
+            # cv2 drops the channel axis of single-channel results
+            ssim_map = ssim_map[..., None]
+
+    # Average away from the borders, where the window is incomplete
+    pad = 5 if window == "gaussian" else 3
+    mean = ssim_map[pad:-pad, pad:-pad].mean(axis=(0, 1), dtype=np.float64)
+
+    if stacked:
+        ssim_map = np.moveaxis(ssim_map, -1, 0)
+    else:
+        mean = float(mean)
+    return (mean, ssim_map) if full else mean
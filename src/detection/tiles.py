@@ -0,0 +1,49 @@
+import base64
+
+import cv2
+import numpy as np
+
+# Quantization for the compact report encoding: stored byte = value * scale, clipped to 0-255
+TILE_SCALES = {
+    "motion": 10.0,       # 0.1 px steps, up to 25.5 px
+    "ssim": 255.0,
+    "edge_loss": 255.0,
+    "difference": 1.0,    # mean absolute difference is already 0-255
+    "severity": 255.0,
+}
+
+
+def tile_bounds(length, count):
+    return np.linspace(0, length, count + 1).round().astype(int)
+
+
+def tile_sums(array, rows, cols):
+    """Per-tile sums of an (H, W) or (H, W, C) array, read off its integral image."""
+    integral = cv2.integral(array, sdepth=cv2.CV_64F)
+    if integral.ndim == 3:
+        integral = integral.sum(axis=2)
+    ys = tile_bounds(array.shape[0], rows)
+    xs = tile_bounds(array.shape[1], cols)
+    corners = integral[np.ix_(ys, xs)]
+    return corners[1:, 1:] - corners[:-1, 1:] - corners[1:, :-1] + corners[:-1, :-1]
+
+
+def tile_means(array, rows, cols):
+    ys = tile_bounds(array.shape[0], rows)
+    xs = tile_bounds(array.shape[1], cols)
+    channels = array.shape[2] if array.ndim == 3 else 1
+    area = np.maximum(np.outer(np.diff(ys), np.diff(xs)) * channels, 1)
+    return (tile_sums(array, rows, cols) / area).astype(np.float32)
+
+
+def encode_grid(grid, key):
+    quantized = np.clip(np.round(grid * TILE_SCALES[key]), 0, 255).astype(np.uint8)
+    return base64.b64encode(quantized.tobytes()).decode('ascii')
+
+
+def encode_tiles(tiles):
+    """Report form of a tile dict: {"rows", "cols", <name>: base64 uint8 grid}."""
+    rows, cols = next(iter(tiles.values())).shape
+    encoded = {"rows": rows, "cols": cols}
+    encoded.update({key: encode_grid(grid, key) for key, grid in tiles.items()})
+    return encoded
@@ -1,21 +1,50 @@
 import cv2
 import numpy as np
 
+# Thresholds and severity weights; overridden by explanation.scoring in config.yaml
+DEFAULT_SCORING = {
+    "motion_high": 5.0,
+    "motion_moderate": 2.0,
+    "consistency_low": 0.8,
+    "edge_low": 0.8,
+    "edge_high": 1.2,
+    "occlusion_high": 20.0,     # Mean pixel difference between the source frames
+    "tile_edge_loss": 0.2,
+    "weights": {
+        "motion_high": 0.4,
+        "motion_moderate": 0.1,
+        "consistency_low": 0.5,
+        "edge_low": 0.3,
+        "edge_high": 0.2,
+        "occlusion_high": 0.3,
+    },
+    "verdict_warning": 0.4,
+    "verdict_fail": 0.7,
+}
+
+
 class ExplanationGenerator:
     def __init__(self, config=None):
         self.config = config
+        scoring = ((config or {}).get('explanation', {}) or {}).get('scoring', {}) or {}
+        self.scoring = {**DEFAULT_SCORING, **scoring}
+        self.scoring["weights"] = {**DEFAULT_SCORING["weights"], **scoring.get("weights", {})}
 
-    def generate_heatmap(self, frame, metrics):
+    def generate_heatmap(self, frame, metrics, analysis=None):
         """
         Generate a visual heatmap overlay indicating potential artifact regions.
-        For MVP, we use edge difference as a proxy for artifact location.
+        With the frame's ArtifactAnalysis, heat is its per-pixel SSIM error
+        combined with the tile severity grid; otherwise edge intensity is used
+        as a proxy for artifact location.
         """
-        # Create a dummy heatmap based on edge intensity (placeholder for real uncertainty map)
-        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-        edges = cv2.Canny(gray, 100, 200)
-        
-        # Blur to create a "heat" effect
-        heatmap = cv2.GaussianBlur(edges, (21, 21), 0)
+        if analysis is not None and analysis.ssim_map is not None:
+            tile_severity = self.tile_severity(analysis.tiles) if analysis.tiles else None
+            heatmap = analysis.error_map(frame.shape[1], frame.shape[0], tile_severity)
+        else:
+            gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+            edges = cv2.Canny(gray, 100, 200)
+            # Blur to create a "heat" effect
+            heatmap = cv2.GaussianBlur(edges, (21, 21), 0)
         heatmap = cv2.applyColorMap(heatmap, cv2.COLORMAP_JET)
         
         # Overlay
@@ -23,55 +52,132 @@ class ExplanationGenerator:
         overlay = cv2.addWeighted(frame, 1 - alpha, heatmap, alpha, 0)
         return overlay
 
-    def generate_explanation(self, metrics):
+    def tile_severity(self, tiles):
+        """
+        Per-tile severity from the detector's tile grids, scored with the same
+        thresholds as generate_explanation applies to the frame-level metrics.
+        """
+        s, w = self.scoring, self.scoring["weights"]
+        motion = tiles["motion"]
+        severity = np.where(motion > s["motion_high"], w["motion_high"],
+                            np.where(motion > s["motion_moderate"], w["motion_moderate"], 0.0))
+        severity = severity + np.where(tiles["ssim"] < s["consistency_low"], w["consistency_low"], 0.0)
+        severity = severity + np.where(tiles["edge_loss"] > s["tile_edge_loss"], w["edge_low"], 0.0)
+        severity = severity + np.where(tiles["difference"] > s["occlusion_high"], w["occlusion_high"], 0.0)
+        return np.minimum(severity, 1.0).astype(np.float32)
+
+    def score_columns(self, motion, consistency, edge_preservation, occlusion_risk):
+        """
+        Vectorized severity and verdict for whole metric columns (NumPy
+        arrays), with the same rules as generate_explanation. Used to
+        re-score archived metrics without rebuilding every explanation.
+        """
+        s, w = self.scoring, self.scoring["weights"]
+        severity = np.where(motion > s["motion_high"], w["motion_high"],
+                            np.where(motion > s["motion_moderate"], w["motion_moderate"], 0.0))
+        severity = severity + np.where(consistency < s["consistency_low"], w["consistency_low"], 0.0)
+        severity = severity + np.where(edge_preservation < s["edge_low"], w["edge_low"],
+                                       np.where(edge_preservation > s["edge_high"], w["edge_high"], 0.0))
+        severity = severity + np.where(occlusion_risk > s["occlusion_high"], w["occlusion_high"], 0.0)
+        severity = np.minimum(severity, 1.0)
+        verdicts = np.where(severity > s["verdict_fail"], "FAIL",
+                            np.where(severity > s["verdict_warning"], "WARNING", "PASS"))
+        return severity, verdicts
+
+    def _localize(self, tiles, tile_severity):
+        """One sentence naming where the worst tile is and what flags it."""
+        s = self.scoring
+        rows, cols = tile_severity.shape
+        r, c = np.unravel_index(np.argmax(tile_severity), tile_severity.shape)
+        if tile_severity[r, c] <= s["verdict_warning"]:
+            return None
+
+        vertical = ["top", "middle", "bottom"][min(2, r * 3 // rows)]
+        horizontal = ["left", "center", "right"][min(2, c * 3 // cols)]
+        region = "center" if (vertical, horizontal) == ("middle", "center") else f"{vertical}-{horizontal}"
+
+        evidence = []
+        if tiles["ssim"][r, c] < s["consistency_low"]:
+            evidence.append(f"local SSIM {tiles['ssim'][r, c]:.2f}")
+        if tiles["motion"][r, c] > s["motion_moderate"]:
+            evidence.append(f"motion {tiles['motion'][r, c]:.1f}px")
+        if tiles["edge_loss"][r, c] > s["tile_edge_loss"]:
+            evidence.append(f"{tiles['edge_loss'][r, c]:.0%} edge loss")
+        if tiles["difference"][r, c] > s["occlusion_high"]:
+            evidence.append(f"frame diff {tiles['difference'][r, c]:.1f}")
+        flagged = float(np.mean(tile_severity > s["verdict_warning"]))
+        return (f"Artifact evidence is concentrated in the {region} of the frame (tile row {r}, col {c}: "
+                f"{', '.join(evidence)}); {flagged:.0%} of tiles are flagged.")
+
+    def duplicate_explanation(self):
+        """
+        Explanation for a frame of a duplicate/static pair: it is a copy of
+        its source frame, so it passes whatever its neighbours scored.
+        """
+        return {
+            "verdict": "PASS",
+            "severity": 0.0,
+            "details": ["Duplicate of the source frame (static pair); interpolation and QA were skipped."]
+        }
+
+    def generate_explanation(self, metrics, tiles=None):
         """
         Generate a text explanation based on artifact metrics.
+        With the detector's tile grids, the result also carries the per-tile
+        severity ("tile_severity") and a sentence localizing the worst region.
         """
+        s, w = self.scoring, self.scoring["weights"]
         explanations = []
         severity_score = 0.0
         
         # Motion Analysis
         motion = metrics.get("motion_complexity", 0)
-        if motion > 5.0:
+        if motion > s["motion_high"]:
             explanations.append(f"High motion detected (magnitude: {motion:.2f}). This increases the risk of occlusion artifacts.")
-            severity_score += 0.4
-        elif motion > 2.0:
+            severity_score += w["motion_high"]
+        elif motion > s["motion_moderate"]:
             explanations.append(f"Moderate motion detected (magnitude: {motion:.2f}).")
-            severity_score += 0.1
+            severity_score += w["motion_moderate"]
         else:
             explanations.append("Low motion scene. Interpolation should be reliable.")
 
         # Consistency Analysis
         consistency = metrics.get("temporal_consistency", 1.0)
-        if consistency < 0.8:
+        if consistency < s["consistency_low"]:
             explanations.append(f"Low temporal consistency ({consistency:.2f}). The interpolated frame deviates significantly from its neighbors, suggesting potential warping or structural errors.")
-            severity_score += 0.5
+            severity_score += w["consistency_low"]
         
         # Edge/Blur Analysis
         edge_pres = metrics.get("edge_preservation", 1.0)
-        if edge_pres < 0.8:
+        if edge_pres < s["edge_low"]:
             explanations.append(f"Reduced edge density ({edge_pres:.2f}). The frame may suffer from blurring or ghosting.")
-            severity_score += 0.3
-        elif edge_pres > 1.2:
+            severity_score += w["edge_low"]
+        elif edge_pres > s["edge_high"]:
             explanations.append(f"Increased edge density ({edge_pres:.2f}). Potential high-frequency noise or artifacts introduced.")
-            severity_score += 0.2
+            severity_score += w["edge_high"]
 
         # Occlusion Risk
         occ_risk = metrics.get("occlusion_risk", 0)
-        if occ_risk > 20.0: # Arbitrary threshold for pixel diff
+        if occ_risk > s["occlusion_high"]:
              explanations.append(f"High occlusion risk detected (diff: {occ_risk:.2f}).")
-             severity_score += 0.3
+             severity_score += w["occlusion_high"]
 
         # Final Verdict
         severity_score = min(severity_score, 1.0)
         verdict = "PASS"
-        if severity_score > 0.7:
+        if severity_score > s["verdict_fail"]:
             verdict = "FAIL"
-        elif severity_score > 0.4:
+        elif severity_score > s["verdict_warning"]:
             verdict = "WARNING"
 
-        return {
+        result = {
             "verdict": verdict,
             "severity": severity_score,
             "details": explanations
         }
+        if tiles:
+            result["tile_severity"] = self.tile_severity(tiles)
+            localized = self._localize(tiles, result["tile_severity"])
+            if localized:
+                explanations.append(localized)
+        return result
@@ -0,0 +1,142 @@
+import json
+import os
+
+import numpy as np
+
+from src.detection.tiles import TILE_SCALES
+
+# Per-frame report fields stored as plain numeric columns
+NUMERIC_FIELDS = {
+    "frame_number": np.int64,
+    "stage": np.int16,
+    "source_frame": np.int64,
+    "shot": np.int64,
+    "timestep": np.float64,
+    "timestamp": np.float64,
+    "escalations": np.int16,
+    "severity_score": np.float64,
+}
+# Per-frame string fields stored as codes into a "<field>_names" table
+CATEGORY_FIELDS = ("engine", "qa", "verdict")
+TILE_KEYS = tuple(key for key in TILE_SCALES if key != "severity")
+
+
+def metrics_archive_path(report_path):
+    return os.path.splitext(report_path)[0] + "_metrics.npz"
+
+
+class _StringTable:
+    def __init__(self):
+        self.index = {}
+
+    def code(self, value):
+        return self.index.setdefault(value, len(self.index))
+
+    def array(self):
+        return np.array(list(self.index), dtype=str)
+
+
+def write_metrics_archive(path, metadata, summary, frames):
+    """
+    Columnar copy of a report (.npz) for offline re-scoring: one array per
+    report field and metric, string tables for the categorical fields and
+    the explanation sentences, and the tile grids at full precision (the
+    frames' "tile_grids", not the report's 8-bit encoding), so a rescore with
+    unchanged scoring reproduces the explanations exactly. `frames` is
+    consumed in one pass, so it can be a streaming reader. Frames without
+    metrics (never scored) are skipped.
+    """
+    numeric = {field: [] for field in NUMERIC_FIELDS}
+    categories = {field: _StringTable() for field in CATEGORY_FIELDS}
+    codes = {field: [] for field in CATEGORY_FIELDS}
+    metrics = {}
+    sentences = _StringTable()
+    explanation_ids, explanation_offsets = [], [0]
+    tiles = {key: [] for key in TILE_KEYS}
+    has_tiles = []
+
+    grid = metadata.get("tile_grid") or {}
+    empty_tile = np.zeros((grid.get("rows", 0), grid.get("cols", 0)), dtype=np.float32)
+    for frame in frames:
+        if frame.get("metrics") is None:
+            continue
+        for field in NUMERIC_FIELDS:
+            numeric[field].append(frame[field])
+        for field in CATEGORY_FIELDS:
+            codes[field].append(categories[field].code(frame[field]))
+        for key, value in frame["metrics"].items():
+            metrics.setdefault(key, []).append(value)
+        explanation_ids.extend(sentences.code(sentence) for sentence in frame["explanation"])
+        explanation_offsets.append(len(explanation_ids))
+
+        grids = frame.get("tile_grids")
+        has_tiles.append(grids is not None)
+        for key in TILE_KEYS:
+            tiles[key].append(grids[key] if grids is not None else empty_tile)
+
+    arrays = {
+        "metadata": np.array(json.dumps(metadata)),
+        "summary": np.array(json.dumps(summary)),
+        "explanation_strings": sentences.array(),
+        "explanation_ids": np.array(explanation_ids, dtype=np.int32),
+        "explanation_offsets": np.array(explanation_offsets, dtype=np.int64),
+    }
+    for field, dtype in NUMERIC_FIELDS.items():
+        arrays[field] = np.array(numeric[field], dtype=dtype)
+    for field in CATEGORY_FIELDS:
+        arrays[field] = np.array(codes[field], dtype=np.int16)
+        arrays[f"{field}_names"] = categories[field].array()
+    for key, values in metrics.items():
+        arrays[f"metric_{key}"] = np.array(values, dtype=np.float64)
+    if any(has_tiles):
+        arrays["has_tiles"] = np.array(has_tiles, dtype=bool)
+        for key in TILE_KEYS:
+            arrays[f"tile_{key}"] = np.stack(tiles[key]).astype(np.float32)
+    np.savez_compressed(path, **arrays)
+
+
+class MetricsArchive:
+    """Read side of write_metrics_archive."""
+    def __init__(self, path):
+        self.path = path
+        with np.load(path) as data:
+            self.arrays = {key: data[key] for key in data.files}
+        self.metadata = json.loads(str(self.arrays.pop("metadata")))
+        self.summary = json.loads(str(self.arrays.pop("summary")))
+        self.metric_names = [key[len("metric_"):] for key in self.arrays if key.startswith("metric_")]
+
+    def __len__(self):
+        return len(self.arrays["frame_number"])
+
+    def metric_column(self, name):
+        return self.arrays[f"metric_{name}"]
+
+    def metrics(self, i):
+        return {name: float(self.arrays[f"metric_{name}"][i]) for name in self.metric_names}
+
+    def category(self, field, i):
+        return str(self.arrays[f"{field}_names"][self.arrays[field][i]])
+
+    def explanation(self, i):
+        start, end = self.arrays["explanation_offsets"][i:i + 2]
+        return [str(self.arrays["explanation_strings"][k]) for k in self.arrays["explanation_ids"][start:end]]
+
+    def has_tiles(self, i):
+        return "has_tiles" in self.arrays and bool(self.arrays["has_tiles"][i])
+
+    def tiles(self, i):
+        """Tile grids of frame i as the detector computed them, or None."""
+        if not self.has_tiles(i):
+            return None
+        return {key: self.arrays[f"tile_{key}"][i] for key in TILE_KEYS}
+
+    def frame(self, i):
+        """Frame i as a report entry (stored scores, no tile grids)."""
+        entry = {}
+        for field in NUMERIC_FIELDS:
+            entry[field] = self.arrays[field][i].item()
+        for field in CATEGORY_FIELDS:
+            entry[field] = self.category(field, i)
+        entry["metrics"] = self.metrics(i)
+        entry["explanation"] = self.explanation(i)
+        return entry
@@ -1,33 +1,41 @@
-import json
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import pandas as pd
 import os
 
+from src.explanation.generator import DEFAULT_SCORING
+from src.explanation.report_stream import ReportReader
+
 class ReportGenerator:
     def __init__(self, report_path):
+        # .json or streamed .jsonl; frames are read one at a time
         self.report_path = report_path
-        with open(report_path, 'r') as f:
-            self.data = json.load(f)
+        self.report = ReportReader(report_path)
 
     def generate_html_report(self, output_html_path):
         """
         Generates an interactive HTML report using Plotly.
         """
-        frames = self.data['frames']
-        if not frames:
-            return
-
-        df = pd.DataFrame([
-            {
+        rows = []
+        cards = []
+        # Debug composites are linked relative to the HTML file
+        debug_dir = self.report.metadata.get('debug_dir', 'debug_frames')
+        html_dir = os.path.dirname(os.path.abspath(output_html_path))
+        for f in self.report.frames():
+            rows.append({
                 'frame': f['frame_number'],
                 'severity': f['severity_score'],
                 'motion': f['metrics']['motion_complexity'],
                 'consistency': f['metrics']['temporal_consistency'],
-                'verdict': f['verdict']
-            }
-            for f in frames
-        ])
+                'verdict': f['verdict'],
+                # Frames skipped by sampled QA carry inferred scores
+                'measured': f.get('qa', 'measured') == 'measured'
+            })
+            cards.append(self._gallery_card(f, debug_dir, html_dir))
+        if not rows:
+            return
+
+        df = pd.DataFrame(rows)
 
         # Create Subplots
         fig = make_subplots(rows=3, cols=1, 
@@ -38,12 +46,13 @@ class ReportGenerator:
         # 1. Severity Score
         colors = {'PASS': 'green', 'WARNING': 'orange', 'FAIL': 'red'}
         marker_colors = [colors[v] for v in df['verdict']]
+        marker_symbols = ['circle' if m else 'circle-open' for m in df['measured']]
         
         fig.add_trace(go.Scatter(
             x=df['frame'], y=df['severity'],
             mode='lines+markers',
             name='Severity',
-            marker=dict(color=marker_colors, size=6),
+            marker=dict(color=marker_colors, symbol=marker_symbols, size=6),
             line=dict(color='gray', width=1)
         ), row=1, col=1)
 
@@ -65,15 +74,17 @@ class ReportGenerator:
 
         # Layout Updates
         fig.update_layout(
-            title_text=f"SyntheSight Analysis Report: {self.data['metadata']['input_file']}",
+            title_text=f"SyntheSight Analysis Report: {self.report.metadata['input_file']}",
             height=900,
             showlegend=False
         )
         
-        # Add Verdict Zones to Severity Plot
-        fig.add_hrect(y0=0.0, y1=0.3, row=1, col=1, fillcolor="green", opacity=0.1, layer="below", annotation_text="PASS")
-        fig.add_hrect(y0=0.3, y1=0.7, row=1, col=1, fillcolor="orange", opacity=0.1, layer="below", annotation_text="WARNING")
-        fig.add_hrect(y0=0.7, y1=1.0, row=1, col=1, fillcolor="red", opacity=0.1, layer="below", annotation_text="FAIL")
+        # Add Verdict Zones to Severity Plot, at the thresholds the verdicts were scored with
+        scoring = self.report.metadata.get('scoring') or DEFAULT_SCORING
+        warning, fail = scoring['verdict_warning'], scoring['verdict_fail']
+        fig.add_hrect(y0=0.0, y1=warning, row=1, col=1, fillcolor="green", opacity=0.1, layer="below", annotation_text="PASS")
+        fig.add_hrect(y0=warning, y1=fail, row=1, col=1, fillcolor="orange", opacity=0.1, layer="below", annotation_text="WARNING")
+        fig.add_hrect(y0=fail, y1=1.0, row=1, col=1, fillcolor="red", opacity=0.1, layer="below", annotation_text="FAIL")
 
         # Save to HTML with embedded images script
         html_content = fig.to_html(full_html=False, include_plotlyjs='cdn')
@@ -86,28 +97,7 @@ class ReportGenerator:
             <div style="display: flex; flex-wrap: wrap; gap: 10px; justify-content: center;">
         """
         
-        for f in frames:
-            frame_idx = f['frame_number']
-            verdict = f['verdict']
-            severity = f['severity_score']
-            
-            # Check if image exists
-            img_path = f"debug_frames/frame_{frame_idx}_xai.jpg"
-            if os.path.exists(img_path):
-                border_color = "green" if verdict == "PASS" else "orange" if verdict == "WARNING" else "red"
-                gallery_html += f"""
-                <div style="border: 2px solid {border_color}; padding: 5px; width: 320px; background: #f0f0f0; border-radius: 5px;">
-                    <h4 style="margin: 5px 0;">Frame {frame_idx} <span style="float:right; color:{border_color}">{verdict}</span></h4>
-                    <img src="{img_path}" style="width: 100%; display: block;" loading="lazy" onclick="window.open(this.src, '_blank');"/>
-                    <p style="font-size: 12px; margin: 5px 0;"><b>Severity:</b> {severity:.2f}</p>
-                    <details>
-                        <summary style="font-size: 12px; cursor: pointer;">Explanation</summary>
-                        <ul style="font-size: 11px; padding-left: 15px; margin: 5px 0;">
-                            {''.join(f'<li>{e}</li>' for e in f['explanation'])}
-                        </ul>
-                    </details>
-                </div>
-                """
+        gallery_html += "".join(cards)
         
         gallery_html += """
             </div>
@@ -125,7 +115,7 @@ class ReportGenerator:
         </head>
         <body>
             <h1 style="text-align: center; color: #4facfe;">SyntheSight Analysis Report</h1>
-            <h3 style="text-align: center; color: #aaa;">{self.data['metadata']['input_file']}</h3>
+            <h3 style="text-align: center; color: #aaa;">{self.report.metadata['input_file']}</h3>
             
             <!-- Plotly Graphs -->
             <div style="background: white; padding: 20px; border-radius: 10px; margin-bottom: 30px;">
@@ -144,6 +134,32 @@ class ReportGenerator:
             
         print(f"HTML Report generated: {output_html_path}")
 
+    def _gallery_card(self, f, debug_dir, html_dir):
+        """Gallery HTML for one frame, or "" when it has no debug image."""
+        frame_idx = f['frame_number']
+        verdict = f['verdict']
+        severity = f['severity_score']
+        
+        # Check if image exists
+        debug_path = os.path.join(debug_dir, f"frame_{frame_idx}_xai.jpg")
+        if not os.path.exists(debug_path):
+            return ""
+        img_path = os.path.relpath(os.path.abspath(debug_path), html_dir).replace(os.sep, "/")
+        border_color = "green" if verdict == "PASS" else "orange" if verdict == "WARNING" else "red"
+        return f"""
+                <div style="border: 2px solid {border_color}; padding: 5px; width: 320px; background: #f0f0f0; border-radius: 5px;">
+                    <h4 style="margin: 5px 0;">Frame {frame_idx} <span style="float:right; color:{border_color}">{verdict}</span></h4>
+                    <img src="{img_path}" style="width: 100%; display: block;" loading="lazy" onclick="window.open(this.src, '_blank');"/>
+                    <p style="font-size: 12px; margin: 5px 0;"><b>Severity:</b> {severity:.2f}</p>
+                    <details>
+                        <summary style="font-size: 12px; cursor: pointer;">Explanation</summary>
+                        <ul style="font-size: 11px; padding-left: 15px; margin: 5px 0;">
+                            {''.join(f'<li>{e}</li>' for e in f['explanation'])}
+                        </ul>
+                    </details>
+                </div>
+                """
+
 if __name__ == "__main__":
     # Test
     gen = ReportGenerator("new_report.json")
@@ -0,0 +1,209 @@
+import json
+import logging
+import os
+import textwrap
+from collections import deque
+
+import numpy as np
+
+from src.explanation.metrics_archive import TILE_KEYS, write_metrics_archive
+
+logger = logging.getLogger(__name__)
+
+
+class ReportWriter:
+    """
+    Streaming report sink. Entries are registered in output order with
+    append() and may be completed (their "qa" field set) later and out of
+    order; flush() writes every completed entry at the head as one JSONL
+    record and drops it, so only frames still waiting for QA stay in memory.
+    Summary aggregates are updated as frames are written and close() appends
+    them, with the final metadata, as the last record.
+
+    A report path ending in .jsonl is written directly. Any other path gets
+    the classic single JSON document: frames stream to a sidecar .jsonl
+    during the run (so a crash keeps them) and the JSON is assembled from it,
+    a frame at a time, at close. With archive_path, close() also writes the
+    columnar metrics archive (see metrics_archive.py).
+
+    An entry's full-precision "tile_grids" are not part of the report: they
+    go to a tile sidecar (tile_grids_path) that feeds the archive, and that
+    is kept after close() with keep_tile_grids (segment reports to merge).
+    """
+    def __init__(self, path, metadata, archive_path=None, keep_tile_grids=False):
+        self.path = path
+        self.archive_path = archive_path
+        self.keep_tile_grids = keep_tile_grids
+        self.stream_path = path if path.endswith(".jsonl") else os.path.splitext(path)[0] + ".jsonl"
+        self.tiles_path = tile_grids_path(self.stream_path)
+        self.metadata = metadata
+        self.summary = {
+            "average_severity": 0.0,
+            "verdict_distribution": {"PASS": 0, "WARNING": 0, "FAIL": 0},
+            "engine_distribution": {},
+            "duplicate_fast_path_pairs": 0,
+            "qa_measured_frames": 0,
+            "qa_inferred_frames": 0,
+            "processing_time_seconds": 0
+        }
+        self.count = 0
+        self.written = 0
+        self.last_written = None
+        self._pending = deque()
+        self._severity_total = 0.0
+        # Line buffered: every record is on disk as soon as it is written
+        self._file = open(self.stream_path, 'w', buffering=1)
+        self._tiles_file = open(self.tiles_path, 'wb') if archive_path or keep_tile_grids else None
+        self._write_record({"metadata": metadata})
+
+    def append(self, entry):
+        """Register the next frame entry; it is written once flush() finds it completed."""
+        self._pending.append(entry)
+        self.count += 1
+
+    def flush(self):
+        while self._pending and self._pending[0]["qa"] is not None:
+            self._write_frame(self._pending.popleft())
+
+    def close(self, processing_time=None):
+        # Completed entries still pending are written; ones that never got
+        # metrics (an aborted or partial run) are dropped, not written half-empty
+        unscored = 0
+        while self._pending:
+            entry = self._pending.popleft()
+            if entry["metrics"] is None:
+                unscored += 1
+                continue
+            self._write_frame(entry)
+        if unscored:
+            logger.warning(f"{unscored} frames of {self.path} were never scored; left out of the report")
+        if processing_time is not None:
+            self.summary["processing_time_seconds"] = processing_time
+        if self.written:
+            self.summary["average_severity"] = self._severity_total / self.written
+        self._write_record({"summary": self.summary, "metadata": self.metadata})
+        self._file.close()
+        if self._tiles_file is not None:
+            self._tiles_file.close()
+
+        if self.archive_path:
+            stream = ReportReader(self.stream_path)
+            write_metrics_archive(self.archive_path, stream.metadata, stream.summary, stream.frames(tile_grids=True))
+        if self._tiles_file is not None and not self.keep_tile_grids:
+            os.remove(self.tiles_path)
+
+        if self.stream_path != self.path:
+            write_json_report(self.stream_path, self.path)
+            os.remove(self.stream_path)
+
+    def _write_frame(self, entry):
+        tile_grids = entry.pop("tile_grids", None)
+        if self._tiles_file is not None:
+            # One record per frame, in report order; empty when the frame has no grids
+            record = np.stack([tile_grids[key] for key in TILE_KEYS]) if tile_grids else np.empty(0, dtype=np.float32)
+            np.save(self._tiles_file, record.astype(np.float32, copy=False))
+        if entry["verdict"] is not None:
+            self.summary["verdict_distribution"][entry["verdict"]] += 1
+            self.summary[f"qa_{entry['qa']}_frames"] += 1
+            self._severity_total += entry["severity_score"]
+        engine_counts = self.summary["engine_distribution"]
+        engine_counts[entry["engine"]] = engine_counts.get(entry["engine"], 0) + 1
+        self._write_record({"frame": entry})
+        self.written += 1
+        self.last_written = entry
+
+    def _write_record(self, record):
+        self._file.write(json.dumps(record) + "\n")
+
+
+class ReportReader:
+    """
+    Reads .json reports and streamed .jsonl reports, including ones still
+    being written (no summary record yet: summary is None and metadata is
+    the header's). For JSONL, metadata and summary come from the first and
+    last records and frames() streams the rest, so memory does not grow
+    with the length of the report.
+    """
+    def __init__(self, path):
+        self.path = path
+        self.streamed = path.endswith(".jsonl")
+        if self.streamed:
+            with open(path, 'r') as f:
+                self.metadata = json.loads(f.readline())["metadata"]
+            self.summary = None
+            footer = _last_record(path)
+            if footer is not None and "summary" in footer:
+                self.summary = footer["summary"]
+                self.metadata = footer["metadata"]
+        else:
+            with open(path, 'r') as f:
+                self._data = json.load(f)
+            self.metadata = self._data["metadata"]
+            self.summary = self._data["summary"]
+
+    def frames(self, tile_grids=False):
+        """
+        Frame entries in order. With tile_grids, each also gets its
+        full-precision "tile_grids" (or None) from the writer's tile sidecar,
+        when there is one.
+        """
+        if not self.streamed:
+            yield from self._data["frames"]
+            return
+        tiles_path = tile_grids_path(self.path)
+        tiles_file = open(tiles_path, 'rb') if tile_grids and os.path.exists(tiles_path) else None
+        try:
+            with open(self.path, 'r') as f:
+                for line in f:
+                    if not line.endswith("\n"):
+                        # Record still being written
+                        break
+                    record = json.loads(line)
+                    if "frame" in record:
+                        frame = record["frame"]
+                        if tiles_file is not None:
+                            grids = np.load(tiles_file)
+                            frame["tile_grids"] = dict(zip(TILE_KEYS, grids)) if grids.size else None
+                        yield frame
+        finally:
+            if tiles_file is not None:
+                tiles_file.close()
+
+    def frame(self, frame_number):
+        return next((f for f in self.frames() if f["frame_number"] == frame_number), None)
+
+
+def tile_grids_path(stream_path):
+    return os.path.splitext(stream_path)[0] + "_tiles.npy"
+
+
+def _last_record(path, chunk_size=65536):
+    """Parse the last complete line of a JSONL file by reading backwards from the end."""
+    with open(path, 'rb') as f:
+        f.seek(0, os.SEEK_END)
+        end = f.tell()
+        size = chunk_size
+        while True:
+            start = max(0, end - size)
+            f.seek(start)
+            lines = f.read(end - start).rstrip(b"\n").split(b"\n")
+            if len(lines) > 1 or start == 0:
+                try:
+                    return json.loads(lines[-1])
+                except ValueError:
+                    return None
+            size *= 2
+
+
+def write_json_report(stream_path, json_path):
+    """Assemble the single-document JSON report from a finished JSONL stream."""
+    reader = ReportReader(stream_path)
+
+    def block(key, value):
+        return f'  "{key}": ' + textwrap.indent(json.dumps(value, indent=2), "  ").lstrip()
+
+    with open(json_path, 'w') as f:
+        f.write("{\n" + block("metadata", reader.metadata) + ",\n" + block("summary", reader.summary) + ',\n  "frames": [')
+        for k, frame in enumerate(reader.frames()):
+            f.write(("," if k else "") + "\n" + textwrap.indent(json.dumps(frame, indent=2), "    "))
+        f.write("\n  ]\n}\n")
@@ -3,28 +3,40 @@ import numpy as np
 import matplotlib.pyplot as plt
 import io
 
+from src.detection.feature_cache import FrameFeatureCache
+from src.detection.flow import create_flow_backend
+
 class AdvancedVisualizer:
-    def __init__(self, config=None):
+    def __init__(self, config=None, feature_cache=None):
         self.config = config
+        # Usually ArtifactDetector.feature_cache, so original frames are not re-analyzed
+        self.feature_cache = feature_cache or FrameFeatureCache()
+        # Only used when no ArtifactAnalysis is passed in
+        self.flow_backend = create_flow_backend(((config or {}).get('detection', {}) or {}).get('flow'))
 
-    def generate_composite_debug_frame(self, original, interpolated, metrics, explanation):
+    def generate_composite_debug_frame(self, original, interpolated, metrics, explanation, original_key=None,
+                                       analysis=None, time=0.5):
         """
         Generates a 2x2 composite frame for advanced debugging/XAI.
         Top-Left: Original Frame
         Top-Right: Interpolated Frame
         Bottom-Left: Motion Entropy Map (Optical Flow Magnitude)
         Bottom-Right: Error Confidence Map (Heatmap)
+        `analysis` is the ArtifactAnalysis of this frame; its flow magnitude and
+        SSIM map are reused instead of being recomputed here. `time` is the
+        interpolated frame's timestep between the original and the next frame.
         """
         h, w = original.shape[:2]
         
         # 1. Motion Entropy Map (Visualizing Optical Flow)
-        # We need to re-calculate flow here or pass it in. For efficiency, let's approximate
-        # using the difference between original and interpolated as a proxy for motion/change
-        # Ideally, we should pass the flow field from the detector, but for now:
-        gray_orig = cv2.cvtColor(original, cv2.COLOR_BGR2GRAY)
-        gray_interp = cv2.cvtColor(interpolated, cv2.COLOR_BGR2GRAY)
-        flow = cv2.calcOpticalFlowFarneback(gray_orig, gray_interp, None, 0.5, 3, 15, 3, 5, 1.2, 0)
-        mag, ang = cv2.cartToPolar(flow[..., 0], flow[..., 1])
+        if analysis is not None:
+            # Computed at the detector's analysis resolution
+            mag = cv2.resize(analysis.magnitude, (w, h)) if analysis.scale < 1.0 else analysis.magnitude
+        else:
+            gray_orig = self.feature_cache.get(original_key, original).gray
+            gray_interp = cv2.cvtColor(interpolated, cv2.COLOR_BGR2GRAY)
+            flow = self.flow_backend.calc(gray_orig, gray_interp)
+            mag, ang = cv2.cartToPolar(flow[..., 0], flow[..., 1])
         
         # Normalize magnitude to 0-255 for visualization
         mag_norm = cv2.normalize(mag, None, 0, 255, cv2.NORM_MINMAX)
@@ -36,10 +48,15 @@ class AdvancedVisualizer:
                     cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 255), 2)
 
         # 2. Error Confidence Map (Heatmap)
-        # Re-use the logic from ExplanationGenerator but make it standalone here
-        edges = cv2.Canny(gray_interp, 100, 200)
-        heatmap_blur = cv2.GaussianBlur(edges, (21, 21), 0)
-        error_map = cv2.applyColorMap(heatmap_blur, cv2.COLORMAP_JET)
+        if analysis is not None and analysis.ssim_map is not None:
+            # Local dissimilarity to the time-weighted blend (1 - SSIM map)
+            error_map = cv2.applyColorMap(analysis.error_map(w, h, explanation.get('tile_severity')), cv2.COLORMAP_JET)
+        else:
+            # Without an analysis, fall back to an edge-density proxy
+            gray_interp = cv2.cvtColor(interpolated, cv2.COLOR_BGR2GRAY)
+            edges = cv2.Canny(gray_interp, 100, 200)
+            heatmap_blur = cv2.GaussianBlur(edges, (21, 21), 0)
+            error_map = cv2.applyColorMap(heatmap_blur, cv2.COLORMAP_JET)
         
         # Add label
         cv2.putText(error_map, f"Error Confidence (Severity={explanation['severity']:.2f})", (10, 30), 
@@ -50,7 +67,7 @@ class AdvancedVisualizer:
         cv2.putText(orig_annotated, "Original Frame (t)", (10, 30), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 255, 0), 2)
         
         interp_annotated = interpolated.copy()
-        cv2.putText(interp_annotated, "Interpolated Frame (t+0.5)", (10, 30), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 255, 255), 2)
+        cv2.putText(interp_annotated, f"Interpolated Frame (t+{time:.2g})", (10, 30), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 255, 255), 2)
 
         # Combine into 2x2 Grid
         top_row = np.hstack((orig_annotated, interp_annotated))
@@ -1,8 +1,15 @@
 import numpy as np
 import cv2
 import logging
+import os
 from abc import ABC, abstractmethod
 
+from src.detection.flow import create_flow_backend
+from src.detection.shots import ShotBoundaryDetector
+from src.interpolation import registry
+from src.interpolation.precision import configure_precision, convert_to_tflite_int8, tflite_model_path
+from src.interpolation.tiling import TilePlan, auto_tile_size
+
 # Try importing TensorFlow, but handle failure gracefully
 try:
     import tensorflow as tf
@@ -10,98 +17,409 @@ try:
     TF_AVAILABLE = True
 except ImportError:
     TF_AVAILABLE = False
-    print("Warning: TensorFlow not found. Falling back to linear interpolation.")
+    print("Warning: TensorFlow not found. Falling back to optical-flow interpolation.")
 
 class BaseInterpolator(ABC):
     @abstractmethod
     def interpolate(self, frame1, frame2, time=0.5):
         pass
 
+    def interpolate_batch(self, pairs, times=None):
+        """
+        Interpolate a list of (frame1, frame2) pairs.
+        Engines that can vectorize override this; the default just loops.
+        """
+        if times is None:
+            times = [0.5] * len(pairs)
+        return [self.interpolate(f1, f2, t) for (f1, f2), t in zip(pairs, times)]
+
 class LinearInterpolator(BaseInterpolator):
     """Fallback interpolator using simple linear blending."""
+    name = "linear"
+
     def interpolate(self, frame1, frame2, time=0.5):
         return cv2.addWeighted(frame1, 1.0 - time, frame2, time, 0)
 
+class OpticalFlowInterpolator(BaseInterpolator):
+    """
+    Motion-compensated interpolation with classical optical flow.
+    Bidirectional flow (any FlowBackend) is estimated once per pair, both
+    frames are backward-warped to time t with cv2.remap, and the two warps
+    are blended with weights that drop where forward/backward flow disagree
+    (occlusions). Much cheaper than FILM and far less ghosting than Linear.
+    """
+    name = "flow"
+
+    def __init__(self, flow_config=None):
+        self.logger = logging.getLogger(__name__)
+        flow_config = flow_config or {}
+        self.backend = create_flow_backend(flow_config, default_method='dis')
+        self.scale = float(flow_config.get('scale', 0.5))
+        # Forward/backward mismatch (in pixels) at which a warp loses most of its weight
+        self.occlusion_sigma = float(flow_config.get('occlusion_sigma', 1.0))
+        self._grids = {}
+
+    def _grid(self, h, w):
+        key = (h, w)
+        if key not in self._grids:
+            self._grids[key] = np.dstack(np.meshgrid(np.arange(w, dtype=np.float32), np.arange(h, dtype=np.float32)))
+        return self._grids[key]
+
+    def _remap(self, src, flow, grid):
+        return cv2.remap(src, cv2.add(grid, flow), None, cv2.INTER_LINEAR, borderMode=cv2.BORDER_REPLICATE)
+
+    def _prepare(self, frame1, frame2):
+        """
+        Per-pair state shared by every timestep: bidirectional flow and the
+        forward/backward consistency error of each input frame. All of it is
+        kept at flow resolution; only the final warps run at full resolution.
+        """
+        h, w = frame1.shape[:2]
+        gray1 = cv2.cvtColor(frame1, cv2.COLOR_RGB2GRAY)
+        gray2 = cv2.cvtColor(frame2, cv2.COLOR_RGB2GRAY)
+        if self.scale != 1.0:
+            size = (max(1, int(w * self.scale)), max(1, int(h * self.scale)))
+            gray1 = cv2.resize(gray1, size, interpolation=cv2.INTER_AREA)
+            gray2 = cv2.resize(gray2, size, interpolation=cv2.INTER_AREA)
+
+        flow_fw = self.backend.calc(gray1, gray2)
+        flow_bw = self.backend.calc(gray2, gray1)
+        grid = self._grid(*gray1.shape[:2])
+
+        # Forward/backward consistency: F01(x) + F10(x + F01(x)) ~ 0 where visible
+        err0 = cv2.magnitude(*cv2.split(flow_fw + self._remap(flow_bw, flow_fw, grid)))
+        err1 = cv2.magnitude(*cv2.split(flow_bw + self._remap(flow_fw, flow_bw, grid)))
+        return flow_fw, flow_bw, err0, err1
+
+    def _synthesize(self, frame1, frame2, state, time):
+        flow_fw, flow_bw, err0, err1 = state
+        h, w = frame1.shape[:2]
+        small_grid = self._grid(*flow_fw.shape[:2])
+
+        # Approximate flows from the intermediate frame back to each input
+        flow_t0 = -(1 - time) * time * flow_fw + time * time * flow_bw
+        flow_t1 = (1 - time) * (1 - time) * flow_fw - time * (1 - time) * flow_bw
+
+        # Occlusion-aware weights, also biased towards the temporally closer frame
+        w0 = cv2.exp(self._remap(err0, flow_t0, small_grid) * (-1.0 / self.occlusion_sigma)) * (1 - time) + 1e-6
+        w1 = cv2.exp(self._remap(err1, flow_t1, small_grid) * (-1.0 / self.occlusion_sigma)) * time + 1e-6
+
+        if (h, w) != flow_fw.shape[:2]:
+            # Upsample to full resolution and rescale vectors to full-res pixels
+            flow_t0 = cv2.resize(flow_t0, (w, h), interpolation=cv2.INTER_LINEAR) * (1.0 / self.scale)
+            flow_t1 = cv2.resize(flow_t1, (w, h), interpolation=cv2.INTER_LINEAR) * (1.0 / self.scale)
+            w0 = cv2.resize(w0, (w, h), interpolation=cv2.INTER_LINEAR)
+            w1 = cv2.resize(w1, (w, h), interpolation=cv2.INTER_LINEAR)
+
+        grid = self._grid(h, w)
+        warp0 = self._remap(frame1, flow_t0, grid)
+        warp1 = self._remap(frame2, flow_t1, grid)
+        return cv2.blendLinear(warp0, warp1, w0, w1)
+
+    def interpolate(self, frame1, frame2, time=0.5):
+        return self._synthesize(frame1, frame2, self._prepare(frame1, frame2), time)
+
+    def interpolate_batch(self, pairs, times=None):
+        """
+        Flow is computed once per distinct pair, so multi-timestep jobs
+        (several t for the same pair) only pay for the warps.
+        """
+        if times is None:
+            times = [0.5] * len(pairs)
+        states = {}
+        results = []
+        for (frame1, frame2), time in zip(pairs, times):
+            key = (id(frame1), id(frame2))
+            if key not in states:
+                states[key] = self._prepare(frame1, frame2)
+            results.append(self._synthesize(frame1, frame2, states[key], time))
+        return results
+
 class FILMInterpolator(BaseInterpolator):
-    def __init__(self, model_path):
+    name = "film"
+
+    # Rough peak activation memory of FILM per input pixel at float32,
+    # used by tiling.mode "auto" (overridable via tiling.bytes_per_pixel)
+    DEFAULT_BYTES_PER_PIXEL = 4096
+
+    def __init__(self, model_path, tiling=None, batch_size=1, cache_dir=None, offline=False, precision="float32"):
         self.logger = logging.getLogger(__name__)
         if not TF_AVAILABLE:
             raise ImportError("TensorFlow is not available. Cannot use FILM.")
+
+        self.model_path = model_path
+        self.cache_dir = cache_dir
+        self.precision = self._configure_precision(precision)
+        self.tiling = tiling or {}
+        self.batch_size = max(1, int(batch_size))
+        self._tile_plans = {}
             
         self.logger.info(f"Loading FILM model from {model_path}...")
         try:
-            # Load model
-            self.model = hub.load(model_path)
+            # Loaded once per process and shared by every interpolator instance
+            self.model = registry.load_model(model_path, cache_dir, offline)
             self.logger.info("FILM model loaded successfully.")
         except Exception as e:
             self.logger.error(f"Failed to load FILM model: {e}")
             raise
 
-    def _preprocess_frame(self, frame):
-        frame = tf.image.convert_image_dtype(frame, tf.float32)
-        frame = tf.expand_dims(frame, 0)
-        return frame
+    def _configure_precision(self, precision):
+        effective = configure_precision(precision)
+        self.logger.info(f"FILM precision: {effective}")
+        return effective
+
+    def warm_up(self, width, height):
+        """
+        Run one dummy batch at the given resolution so graph tracing and
+        allocator setup happen before the first real frame.
+        Only the first call per (model, resolution, batch) in a process does work.
+        """
+        def run():
+            frame = np.zeros((height, width, 3), dtype=np.uint8)
+            self.interpolate_batch([(frame, frame)] * self.batch_size, [0.5] * self.batch_size)
+
+        elapsed = registry.warm_up_once((self.model_path, self.precision, width, height, self.batch_size), run)
+        if elapsed is not None:
+            self.logger.info(f"FILM warm-up at {width}x{height} took {elapsed:.2f}s")
 
-    def _postprocess_frame(self, frame):
-        frame = tf.clip_by_value(frame[0], 0.0, 1.0)
-        frame = tf.image.convert_image_dtype(frame, tf.uint8)
-        return frame.numpy()
+    def _preprocess_frames(self, frames):
+        # Stack N frames into a single (N, H, W, 3) float batch
+        return tf.image.convert_image_dtype(np.stack(frames), tf.float32)
 
-    def interpolate(self, frame1, frame2, time=0.5):
-        input_frame1 = self._preprocess_frame(frame1)
-        input_frame2 = self._preprocess_frame(frame2)
-        
+    def _postprocess_frames(self, frames):
+        frames = tf.clip_by_value(frames, 0.0, 1.0)
+        frames = tf.image.convert_image_dtype(frames, tf.uint8)
+        return list(frames.numpy())
+
+    def _run_model(self, frames1, frames2, times):
         inputs = {
-            'x0': input_frame1,
-            'x1': input_frame2,
-            'time': tf.expand_dims(tf.constant([time], dtype=tf.float32), axis=-1)
+            'x0': self._preprocess_frames(frames1),
+            'x1': self._preprocess_frames(frames2),
+            'time': tf.constant(np.asarray(times, dtype=np.float32).reshape(-1, 1))
         }
         
         result = self.model(inputs, training=False)
-        return self._postprocess_frame(result['image'])
+        return result['image'].numpy()
+
+    def _tile_plan(self, height, width):
+        """
+        Returns the TilePlan for this resolution, or None to run whole frames.
+        Plans are cached per resolution since every frame of a video shares one.
+        """
+        key = (height, width)
+        if key not in self._tile_plans:
+            mode = self.tiling.get('mode', 'off')
+            overlap = int(self.tiling.get('overlap', 64))
+            tile_size = None
+            if mode == 'fixed':
+                tile_size = int(self.tiling.get('tile_size', 512))
+                if height <= tile_size and width <= tile_size:
+                    tile_size = None
+            elif mode == 'auto':
+                tile_size = auto_tile_size(
+                    height, width,
+                    self.tiling.get('memory_budget_mb', 2048),
+                    self.tiling.get('bytes_per_pixel', self.DEFAULT_BYTES_PER_PIXEL),
+                    tiles_per_call=self.batch_size,
+                    overlap=overlap
+                )
+
+            plan = TilePlan(height, width, tile_size, overlap) if tile_size else None
+            if plan:
+                self.logger.info(f"Tiled FILM inference for {width}x{height}: "
+                                 f"{len(plan.tiles)} tiles of {plan.tile_w}x{plan.tile_h} (overlap {overlap}px)")
+            self._tile_plans[key] = plan
+        return self._tile_plans[key]
+
+    def interpolate(self, frame1, frame2, time=0.5):
+        return self.interpolate_batch([(frame1, frame2)], [time])[0]
+
+    def interpolate_batch(self, pairs, times=None):
+        """
+        Run N frame pairs through FILM in a single model call.
+        All pairs must share the same resolution. With tiling enabled, large
+        frames are split into overlapping tiles that go through the model in
+        batches of batch_size and are feathered back together.
+        """
+        if not pairs:
+            return []
+        if times is None:
+            times = [0.5] * len(pairs)
+
+        height, width = pairs[0][0].shape[:2]
+        plan = self._tile_plan(height, width)
+        if plan is None:
+            result = self._run_model([f1 for f1, _ in pairs], [f2 for _, f2 in pairs], times)
+            return self._postprocess_frames(result)
+        return self._interpolate_tiled(pairs, times, plan)
+
+    def _interpolate_tiled(self, pairs, times, plan):
+        jobs = [(i, k) for i in range(len(pairs)) for k in range(len(plan.tiles))]
+        tiles = [[None] * len(plan.tiles) for _ in pairs]
+
+        for start in range(0, len(jobs), self.batch_size):
+            chunk = jobs[start:start + self.batch_size]
+            result = self._run_model(
+                [plan.crop(pairs[i][0], k) for i, k in chunk],
+                [plan.crop(pairs[i][1], k) for i, k in chunk],
+                [times[i] for i, _ in chunk]
+            )
+            for (i, k), tile in zip(chunk, result):
+                tiles[i][k] = tile
+
+        return self._postprocess_frames(np.stack([plan.merge(pair_tiles) for pair_tiles in tiles]))
+
+class TFLiteFILMInterpolator(FILMInterpolator):
+    """
+    FILM with int8-quantized weights, run through the TFLite interpreter.
+    The converted model is cached next to the SavedModel, one file per
+    input resolution and batch size (TFLite needs static shapes).
+    """
+    name = "film-int8"
+
+    def __init__(self, model_path, tiling=None, batch_size=1, cache_dir=None, offline=False, num_threads=None):
+        super().__init__(model_path, tiling, batch_size, cache_dir, offline)
+        self.tflite_dir = cache_dir or "models"
+        self.num_threads = num_threads or os.cpu_count()
+        self._runners = {}
+
+    def _configure_precision(self, precision):
+        self.logger.info("FILM precision: int8 (TFLite)")
+        return "int8"
+
+    def _runner(self, height, width):
+        key = (height, width)
+        if key not in self._runners:
+            path = tflite_model_path(self.tflite_dir, width, height, self.batch_size)
+            if not os.path.exists(path):
+                convert_to_tflite_int8(self.model, width, height, self.batch_size, path)
+            interpreter = tf.lite.Interpreter(model_path=path, num_threads=self.num_threads)
+            self._runners[key] = interpreter.get_signature_runner()
+        return self._runners[key]
+
+    def _run_model(self, frames1, frames2, times):
+        height, width = frames1[0].shape[:2]
+        runner = self._runner(height, width)
+        x0 = np.stack(frames1).astype(np.float32) / 255.0
+        x1 = np.stack(frames2).astype(np.float32) / 255.0
+        t = np.asarray(times, dtype=np.float32).reshape(-1, 1)
+
+        # The interpreter has a fixed batch dimension: run in chunks, padding the last one
+        outputs = []
+        for start in range(0, len(x0), self.batch_size):
+            stop = start + self.batch_size
+            chunk = [x0[start:stop], x1[start:stop], t[start:stop]]
+            count = len(chunk[0])
+            if count < self.batch_size:
+                chunk = [np.concatenate([c, np.repeat(c[-1:], self.batch_size - count, axis=0)]) for c in chunk]
+            result = runner(x0=chunk[0], x1=chunk[1], time=chunk[2])
+            outputs.append(result['image'][:count])
+        return np.concatenate(outputs)
+
+def create_film_engine(interp_cfg):
+    engine_args = dict(
+        tiling=interp_cfg.get('tiling'),
+        batch_size=interp_cfg.get('batch_size', 1),
+        cache_dir=interp_cfg.get('model_cache_dir'),
+        offline=interp_cfg.get('offline', False)
+    )
+    precision = interp_cfg.get('precision', 'float32')
+    if precision == 'int8':
+        engine = TFLiteFILMInterpolator(
+            interp_cfg['model_path'],
+            num_threads=interp_cfg.get('tflite', {}).get('num_threads'),
+            **engine_args
+        )
+    else:
+        engine = FILMInterpolator(interp_cfg['model_path'], precision=precision, **engine_args)
+
+    warmup_cfg = interp_cfg.get('warmup', {})
+    if warmup_cfg.get('enabled', False):
+        width, height = warmup_cfg.get('resolution', [640, 360])
+        engine.warm_up(width, height)
+    return engine
+
+def create_engine(name, interp_cfg):
+    """
+    Build an interpolation engine by name: film, flow or linear.
+    'auto' means FILM (callers fall back to flow if it is unavailable).
+    """
+    if name in ('auto', 'film'):
+        return create_film_engine(interp_cfg)
+    if name == 'flow':
+        return OpticalFlowInterpolator(interp_cfg.get('flow'))
+    if name == 'linear':
+        return LinearInterpolator()
+    raise ValueError(f"Unknown interpolation engine: {name}")
 
 class SmartInterpolator(BaseInterpolator):
-    def __init__(self, config):
+    def __init__(self, config, scorer=None):
+        """
+        scorer(frame1, frame2, interpolated, time, originals) -> (metrics, explanation, analysis)
+        is the QA hook used by the engine cascade to decide escalation;
+        originals is the caller's per-pair value (see interpolate_timesteps_with_info).
+        """
         self.logger = logging.getLogger(__name__)
         self.config = config
+        self.scorer = scorer
         
-        # Try to initialize FILM, fallback to Linear if fails
-        try:
-            self.engine = FILMInterpolator(config['interpolation']['model_path'])
-            self.logger.info("Using FILM Interpolation Engine")
-        except Exception as e:
-            self.logger.warning(f"Could not initialize FILM engine ({e}). Using Linear Fallback.")
-            self.engine = LinearInterpolator()
+        interp_cfg = config['interpolation']
+        engine_name = interp_cfg.get('engine', 'auto')
+
+        cascade_cfg = interp_cfg.get('cascade', {})
+        self.escalate_severity = cascade_cfg.get('escalate_severity', 0.4)
+        self.cascade = []
+        if cascade_cfg.get('enabled', False):
+            if scorer is None:
+                self.logger.warning("Engine cascade needs a QA scorer; running a single engine instead.")
+            else:
+                self.cascade = self._build_cascade(cascade_cfg.get('engines', ['flow', 'film']), interp_cfg)
+        
+        if self.cascade:
+            # The most expensive engine serves single-frame interpolate() calls
+            self.engine = self.cascade[-1]
+            self.logger.info(f"Using engine cascade: {' > '.join(e.name for e in self.cascade)}")
+        else:
+            # Try to initialize the configured engine; FILM falls back to Optical Flow if it fails
+            try:
+                self.engine = create_engine(engine_name, interp_cfg)
+                self.logger.info(f"Using {type(self.engine).__name__} Interpolation Engine")
+            except Exception as e:
+                self.logger.warning(f"Could not initialize {engine_name} engine ({e}). Using Optical Flow Fallback.")
+                self.engine = OpticalFlowInterpolator(interp_cfg.get('flow'))
             
-        self.scene_change_threshold = config['detection']['thresholds']['scene_change_diff']
+        self.shot_detector = ShotBoundaryDetector(config)
+
+    def _build_cascade(self, names, interp_cfg):
+        engines = []
+        for level, name in enumerate(names):
+            if name == 'linear' and level < len(names) - 1:
+                # QA consistency is SSIM against the linear blend, so linear output always
+                # scores ~1.0 and would be accepted for every frame, ghosting included
+                self.logger.warning("Dropping linear from the engine cascade: QA cannot reject the linear blend.")
+                continue
+            try:
+                engines.append(create_engine(name, interp_cfg))
+            except Exception as e:
+                self.logger.warning(f"Dropping {name} from the engine cascade ({e}).")
+        return engines
+
+    @property
+    def engine_description(self):
+        if self.cascade:
+            return "cascade(" + " > ".join(e.name for e in self.cascade) + ")"
+        return self.engine.name
 
     def _detect_scene_change(self, frame1, frame2):
         """
-        Detect if there is a scene cut between frame1 and frame2.
-        Uses histogram comparison.
+        Detect if there is a scene cut between frame1 and frame2 (RGB).
+        Uses compact histogram signatures; streaming callers should compute
+        signatures once per frame with self.shot_detector and pass `cuts`.
         """
-        # Convert to HSV for better color comparison
-        hsv1 = cv2.cvtColor(frame1, cv2.COLOR_RGB2HSV)
-        hsv2 = cv2.cvtColor(frame2, cv2.COLOR_RGB2HSV)
-        
-        # Calculate histograms (H and S channels)
-        hist1 = cv2.calcHist([hsv1], [0, 1], None, [180, 256], [0, 180, 0, 256])
-        hist2 = cv2.calcHist([hsv2], [0, 1], None, [180, 256], [0, 180, 0, 256])
-        
-        cv2.normalize(hist1, hist1, 0, 1, cv2.NORM_MINMAX)
-        cv2.normalize(hist2, hist2, 0, 1, cv2.NORM_MINMAX)
-        
-        # Compare histograms (Correlation)
-        # 1.0 is perfect match, < 0.5 usually means different scene
-        similarity = cv2.compareHist(hist1, hist2, cv2.HISTCMP_CORREL)
-        
-        # If similarity is low, it's a scene change
-        # We invert logic: return True if change detected
-        # scene_change_diff is typically 0.3, so threshold is 0.7
-        # If similarity < 0.7, it is a cut.
-        threshold = 1.0 - self.scene_change_threshold
-        is_cut = similarity < threshold
-        return is_cut, similarity
+        return self.shot_detector.compare(
+            self.shot_detector.signature(frame1, is_rgb=True),
+            self.shot_detector.signature(frame2, is_rgb=True)
+        )
 
     def interpolate(self, frame1, frame2, time=0.5):
         """
@@ -111,30 +429,96 @@ class SmartInterpolator(BaseInterpolator):
         
         if is_cut:
             self.logger.warning(f"Scene cut detected (similarity: {score:.2f}). Skipping interpolation to avoid morphing.")
-            # Return frame1 or frame2 (duplicate) instead of morphing
-            # For t=0.5, we can just return frame1 or frame2. Let's return frame1 for first half, frame2 for second.
-            if time < 0.5:
-                return frame1
-            else:
-                return frame2
+            return self._cut_fallback(frame1, frame2, time)
         
         # If no cut, proceed with heavy interpolation
         return self.engine.interpolate(frame1, frame2, time)
 
-    def interpolate(self, frame1, frame2, time=0.5):
+    def _cut_fallback(self, frame1, frame2, time):
+        # Return frame1 or frame2 (duplicate) instead of morphing
+        # For t=0.5, we can just return frame1 or frame2. Let's return frame1 for first half, frame2 for second.
+        if time < 0.5:
+            return frame1
+        return frame2
+
+    def interpolate_batch(self, pairs, times=None):
         """
-        Smart interpolation that checks for scene cuts.
+        Batched smart interpolation. Scene-cut pairs are routed around the
+        model; the remaining pairs go to the engine in a single call.
         """
-        is_cut, score = self._detect_scene_change(frame1, frame2)
-        
-        if is_cut:
-            self.logger.warning(f"Scene cut detected (similarity: {score:.2f}). Skipping interpolation to avoid morphing.")
-            # Return frame1 or frame2 (duplicate) instead of morphing
-            # For t=0.5, we can just return frame1 or frame2. Let's return frame1 for first half, frame2 for second.
-            if time < 0.5:
-                return frame1
+        if times is None:
+            times = [0.5] * len(pairs)
+        results = self.interpolate_timesteps(pairs, [[t] for t in times])
+        return [frames[0] for frames in results]
+
+    def interpolate_timesteps(self, pairs, timesteps, cuts=None):
+        """
+        Interpolate several timesteps per pair (e.g. [0.25, 0.5, 0.75] for 4x).
+        The scene-cut check runs once per pair, and every (pair, t) job that
+        needs the model is sent to the engine in a single batched call.
+        `cuts` optionally supplies precomputed (is_cut, similarity) per pair.
+        Returns one list of frames per pair, in the order of its timesteps.
+        """
+        results, _ = self.interpolate_timesteps_with_info(pairs, timesteps, cuts)
+        return results
+
+    def interpolate_timesteps_with_info(self, pairs, timesteps, cuts=None, originals=None):
+        """
+        Same as interpolate_timesteps, plus one info dict per frame:
+        {"engine": name, "qa": (metrics, explanation, analysis) or None, "escalations": n}.
+        "qa" is filled when the cascade already scored the accepted frame.
+        `originals` optionally gives one value per pair that is passed on to
+        the scorer, so it can reuse its own copies of the frames and cache keys.
+        """
+        results = [[None] * len(times) for times in timesteps]
+        infos = [[None] * len(times) for times in timesteps]
+        jobs = []
+        for i, ((frame1, frame2), times) in enumerate(zip(pairs, timesteps)):
+            if not times:
+                continue
+            is_cut, score = cuts[i] if cuts is not None else self._detect_scene_change(frame1, frame2)
+            if is_cut:
+                self.logger.warning(f"Scene cut detected (similarity: {score:.2f}). Skipping interpolation to avoid morphing.")
+                results[i] = [self._cut_fallback(frame1, frame2, t) for t in times]
+                infos[i] = [{"engine": "scene_cut", "qa": None, "escalations": 0} for _ in times]
             else:
-                return frame2
-        
-        # If no cut, proceed with heavy interpolation
-        return self.engine.interpolate(frame1, frame2, time)
+                jobs.extend((i, j) for j in range(len(times)))
+
+        if jobs and self.cascade:
+            self._run_cascade(pairs, timesteps, jobs, results, infos, originals)
+        elif jobs:
+            outputs = self.engine.interpolate_batch(
+                [pairs[i] for i, _ in jobs],
+                [timesteps[i][j] for i, j in jobs]
+            )
+            for (i, j), output in zip(jobs, outputs):
+                results[i][j] = output
+                infos[i][j] = {"engine": self.engine.name, "qa": None, "escalations": 0}
+
+        return results, infos
+
+    def _run_cascade(self, pairs, timesteps, jobs, results, infos, originals=None):
+        """
+        Run every job through the cheapest engine, score it, and re-run only
+        the jobs whose severity exceeds escalate_severity on the next engine.
+        The last engine's output is accepted unconditionally.
+        """
+        for level, engine in enumerate(self.cascade):
+            outputs = engine.interpolate_batch(
+                [pairs[i] for i, _ in jobs],
+                [timesteps[i][j] for i, j in jobs]
+            )
+            is_last = level == len(self.cascade) - 1
+            escalated = []
+            for (i, j), output in zip(jobs, outputs):
+                qa = self.scorer(pairs[i][0], pairs[i][1], output, timesteps[i][j],
+                                 originals[i] if originals is not None else None)
+                if not is_last and qa[1]['severity'] > self.escalate_severity:
+                    escalated.append((i, j))
+                    continue
+                results[i][j] = output
+                infos[i][j] = {"engine": engine.name, "qa": qa, "escalations": level}
+
+            jobs = escalated
+            if not jobs:
+                break
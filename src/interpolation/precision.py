@@ -0,0 +1,86 @@
+import logging
+import os
+
+try:
+    import tensorflow as tf
+    TF_AVAILABLE = True
+except ImportError:
+    TF_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# /proc/cpuinfo flags that give native reduced-precision matmuls on x86
+CPU_PRECISION_FLAGS = {
+    "bfloat16": ("avx512_bf16", "amx_bf16"),
+    "float16": ("avx512_fp16", "amx_fp16"),
+}
+
+
+def cpu_flags():
+    try:
+        with open("/proc/cpuinfo", 'r') as f:
+            for line in f:
+                if line.startswith("flags"):
+                    return set(line.split(":", 1)[1].split())
+    except OSError:
+        pass
+    return set()
+
+
+def configure_precision(precision):
+    """
+    Enable grappler's automatic mixed precision for float16/bfloat16.
+    The rewrite casts eligible ops of the loaded SavedModel graph, so it works
+    on the FILM hub model without retraining. Returns the precision that is
+    actually in effect (float32 when the hardware has no fast path).
+    """
+    if precision in (None, "float32"):
+        return "float32"
+    if precision not in CPU_PRECISION_FLAGS:
+        raise ValueError(f"Unsupported precision for the TensorFlow backend: {precision}")
+
+    if precision == "float16" and tf.config.list_physical_devices('GPU'):
+        tf.config.optimizer.set_experimental_options({'auto_mixed_precision': True})
+        return "float16"
+
+    if not cpu_flags() & set(CPU_PRECISION_FLAGS[precision]):
+        logger.warning(f"CPU has no native {precision} support ({'/'.join(CPU_PRECISION_FLAGS[precision])}). "
+                       f"Running in float32.")
+        return "float32"
+
+    option = 'auto_mixed_precision_onednn_bfloat16' if precision == "bfloat16" else 'auto_mixed_precision_cpu'
+    tf.config.optimizer.set_experimental_options({option: True})
+    return precision
+
+
+def tflite_model_path(cache_dir, width, height, batch_size):
+    return os.path.join(cache_dir, f"film_int8_{width}x{height}_b{batch_size}.tflite")
+
+
+def convert_to_tflite_int8(model, width, height, batch_size, output_path):
+    """
+    Convert the FILM SavedModel to TFLite with int8 weight quantization
+    (dynamic range: activations are quantized on the fly at run time).
+    TFLite needs static shapes, so one file is built per (resolution, batch).
+    """
+    image_spec = tf.TensorSpec([batch_size, height, width, 3], tf.float32)
+    time_spec = tf.TensorSpec([batch_size, 1], tf.float32)
+
+    @tf.function(input_signature=[image_spec, image_spec, time_spec])
+    def film(x0, x1, time):
+        return {'image': model({'x0': x0, 'x1': x1, 'time': time}, training=False)['image']}
+
+    converter = tf.lite.TFLiteConverter.from_concrete_functions([film.get_concrete_function()], model)
+    converter.optimizations = [tf.lite.Optimize.DEFAULT]
+    # FILM's warping ops have no builtin TFLite kernels
+    converter.target_spec.supported_ops = [
+        tf.lite.OpsSet.TFLITE_BUILTINS,
+        tf.lite.OpsSet.SELECT_TF_OPS,
+    ]
+
+    logger.info(f"Converting FILM to int8 TFLite for {width}x{height} (batch {batch_size})...")
+    tflite_model = converter.convert()
+    os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
+    with open(output_path, 'wb') as f:
+        f.write(tflite_model)
+    return output_path
@@ -0,0 +1,138 @@
+import argparse
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+
+try:
+    import tensorflow_hub as hub
+    TF_AVAILABLE = True
+except ImportError:
+    TF_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# Process-wide state: every PipelineOrchestrator / SmartInterpolator shares these
+_lock = threading.RLock()
+_models = {}
+_warmed = set()
+
+INDEX_FILE = "index.json"
+
+
+def _is_remote(model_path):
+    return model_path.startswith(("http://", "https://", "gs://"))
+
+
+def _is_saved_model(path):
+    return os.path.exists(os.path.join(path, "saved_model.pb"))
+
+
+def _read_index(cache_dir):
+    index_path = os.path.join(cache_dir, INDEX_FILE)
+    if not os.path.exists(index_path):
+        return {}
+    with open(index_path, 'r') as f:
+        return json.load(f)
+
+
+def _write_index(cache_dir, index):
+    with open(os.path.join(cache_dir, INDEX_FILE), 'w') as f:
+        json.dump(index, f, indent=2)
+
+
+def cached_model_dir(model_path, cache_dir):
+    """Local SavedModel directory for a remote handle, or None if not cached yet."""
+    if not cache_dir:
+        return None
+    local_path = _read_index(cache_dir).get(model_path)
+    if local_path is None:
+        local_path = os.path.join(cache_dir, hashlib.sha1(model_path.encode("utf8")).hexdigest())
+    return local_path if _is_saved_model(local_path) else None
+
+
+def resolve_model_path(model_path, cache_dir=None, offline=False):
+    """
+    Map interpolation.model_path to a local SavedModel directory.
+    Local paths are returned as-is. Remote handles are served from cache_dir
+    when present, otherwise downloaded into it (unless offline is set).
+    """
+    if not _is_remote(model_path):
+        return model_path
+
+    local_path = cached_model_dir(model_path, cache_dir)
+    if local_path:
+        return local_path
+
+    if offline:
+        raise FileNotFoundError(
+            f"Model '{model_path}' is not in the local cache '{cache_dir}' and offline mode is on. "
+            f"Populate it with: python -m src.interpolation.registry --cache-dir {cache_dir}"
+        )
+    if not TF_AVAILABLE:
+        raise ImportError("tensorflow_hub is not available. Cannot download models.")
+    if not cache_dir:
+        return model_path
+
+    # tensorflow_hub downloads and unpacks into TFHUB_CACHE_DIR
+    os.makedirs(cache_dir, exist_ok=True)
+    os.environ["TFHUB_CACHE_DIR"] = os.path.abspath(cache_dir)
+    logger.info(f"Downloading {model_path} into model cache {cache_dir}...")
+    local_path = hub.resolve(model_path)
+
+    index = _read_index(cache_dir)
+    index[model_path] = local_path
+    _write_index(cache_dir, index)
+    return local_path
+
+
+def load_model(model_path, cache_dir=None, offline=False):
+    """Load a SavedModel once per process; later calls return the same object."""
+    with _lock:
+        local_path = resolve_model_path(model_path, cache_dir, offline)
+        if local_path not in _models:
+            logger.info(f"Loading model from {local_path}...")
+            _models[local_path] = hub.load(local_path)
+        else:
+            logger.info(f"Reusing loaded model {local_path}")
+        return _models[local_path]
+
+
+def warm_up_once(key, warm_up_fn):
+    """
+    Run warm_up_fn the first time key is seen in this process.
+    Returns the warm-up time in seconds, or None if it was already warm.
+    """
+    with _lock:
+        if key in _warmed:
+            return None
+        start = time.time()
+        warm_up_fn()
+        _warmed.add(key)
+        return time.time() - start
+
+
+def clear():
+    """Drop all loaded models (mainly for freeing memory in long-lived processes)."""
+    with _lock:
+        _models.clear()
+        _warmed.clear()
+
+
+if __name__ == "__main__":
+    import yaml
+
+    parser = argparse.ArgumentParser(description="Prefetch interpolation models into the local SavedModel cache")
+    parser.add_argument("--config", "-c", default="config.yaml", help="Path to config file")
+    parser.add_argument("--cache-dir", help="Override interpolation.model_cache_dir")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    with open(args.config, 'r') as f:
+        config = yaml.safe_load(f)
+    interp_cfg = config['interpolation']
+    cache_dir = args.cache_dir or interp_cfg.get('model_cache_dir', 'models')
+    path = resolve_model_path(interp_cfg['model_path'], cache_dir)
+    print(f"Cached {interp_cfg['model_path']} at {path}")
@@ -0,0 +1,69 @@
+import math
+import numpy as np
+
+
+def _tile_starts(length, tile, stride):
+    """Tile origins along one axis. The last tile is shifted to end on the border."""
+    if length <= tile:
+        return [0]
+    starts = list(range(0, length - tile, stride))
+    starts.append(length - tile)
+    return starts
+
+
+def auto_tile_size(height, width, memory_budget_mb, bytes_per_pixel, tiles_per_call=1, overlap=0, multiple=64):
+    """
+    Pick the largest square tile whose model call fits the memory budget.
+    Returns None when whole frames already fit (no tiling needed).
+    """
+    budget_pixels = memory_budget_mb * 1024 * 1024 / bytes_per_pixel / max(1, tiles_per_call)
+    if height * width <= budget_pixels:
+        return None
+    side = int(math.sqrt(budget_pixels)) // multiple * multiple
+    # Tiles must leave room for the overlap on both sides
+    return max(side, 2 * overlap + multiple)
+
+
+class TilePlan:
+    """
+    Splits frames of a fixed resolution into overlapping tiles of identical
+    shape (so they can be stacked into one batch) and feathers the processed
+    tiles back together with linear ramps across the overlap.
+    """
+    def __init__(self, height, width, tile_size, overlap):
+        self.height = height
+        self.width = width
+        self.tile_h = min(tile_size, height)
+        self.tile_w = min(tile_size, width)
+        overlap = max(0, min(overlap, (min(self.tile_h, self.tile_w) - 1) // 2))
+
+        ys = _tile_starts(height, self.tile_h, self.tile_h - overlap)
+        xs = _tile_starts(width, self.tile_w, self.tile_w - overlap)
+        self.tiles = [(y, x) for y in ys for x in xs]
+        self.weights = self._feather_mask(self.tile_h, self.tile_w, overlap)
+
+    @staticmethod
+    def _feather_mask(tile_h, tile_w, overlap):
+        def ramp(n):
+            r = np.ones(n, dtype=np.float32)
+            if overlap > 0:
+                edge = np.arange(1, overlap + 1, dtype=np.float32) / (overlap + 1)
+                r[:overlap] = edge
+                r[-overlap:] = np.minimum(r[-overlap:], edge[::-1])
+            return r
+        # Strictly positive everywhere, so border pixels covered by one tile still normalize
+        return np.outer(ramp(tile_h), ramp(tile_w))[..., None]
+
+    def crop(self, frame, index):
+        y, x = self.tiles[index]
+        return frame[y:y + self.tile_h, x:x + self.tile_w]
+
+    def merge(self, tiles):
+        """Blend one processed tile per plan entry back into a full float frame."""
+        channels = tiles[0].shape[-1]
+        canvas = np.zeros((self.height, self.width, channels), dtype=np.float32)
+        weight_sum = np.zeros((self.height, self.width, 1), dtype=np.float32)
+        for (y, x), tile in zip(self.tiles, tiles):
+            canvas[y:y + self.tile_h, x:x + self.tile_w] += tile * self.weights
+            weight_sum[y:y + self.tile_h, x:x + self.tile_w] += self.weights
+        return canvas / weight_sum
@@ -0,0 +1,111 @@
+import copy
+import json
+import logging
+import os
+import shutil
+import time
+
+from src.explanation.report_stream import ReportReader
+from src.pipeline.segments import Segment, concat_videos, merge_segment_reports, range_frames, segment_work_dir
+
+logger = logging.getLogger(__name__)
+
+
+def plan_chunks(total_frames, interval, start=0, end=None):
+    """Consecutive segments of `interval` source pairs from `start`; the last one ends at `end`."""
+    starts = list(range(start, start + max(total_frames - 1, 1), max(1, int(interval))))
+    return [
+        Segment(k, first, starts[k + 1] if k + 1 < len(starts) else end, k + 1 == len(starts))
+        for k, first in enumerate(starts)
+    ]
+
+
+def load_checkpoint(path):
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+def save_checkpoint(path, checkpoint):
+    # Written aside and renamed, so a crash mid-write leaves the previous checkpoint intact
+    temp_path = path + ".tmp"
+    with open(temp_path, 'w') as f:
+        json.dump(checkpoint, f, indent=2)
+    os.replace(temp_path, path)
+
+
+def run_checkpointed(config, input_path, output_path, report_path, stage_rates, interval, resume=False,
+                     frame_range=None):
+    """
+    Process the video in consecutive chunks of `interval` source frames with
+    a single PipelineOrchestrator (the model is loaded once), checkpointing
+    after each chunk: the last committed source frame, the finished segment
+    videos and reports, and the report position. With resume, the chunks of
+    an interrupted run are kept and processing continues from the first
+    unfinished one. The chunks are stitched like parallel segments at the end.
+    frame_range limits the job to part of the input, as for single runs.
+    """
+    # Imported here, as in segments.py: the orchestrator pulls in the interpolation engines
+    from src.pipeline.orchestrator import PipelineOrchestrator
+
+    work_dir = segment_work_dir(output_path)
+    checkpoint_path = os.path.join(work_dir, "checkpoint.json")
+    job = {
+        "input_file": input_path,
+        "output_file": output_path,
+        "report_file": report_path,
+        "stage_rates": [list(rate) for rate in stage_rates],
+        "frame_range": list(frame_range) if frame_range else None,
+    }
+    if resume:
+        if not os.path.exists(checkpoint_path):
+            raise ValueError(f"No checkpoint to resume from: {checkpoint_path}")
+        checkpoint = load_checkpoint(checkpoint_path)
+        if checkpoint["job"] != job:
+            raise ValueError(f"Checkpoint {checkpoint_path} belongs to a different job: {checkpoint['job']}")
+        logger.info(f"Resuming at source frame {checkpoint['next_frame']} "
+                    f"({len(checkpoint['chunks'])} chunks, {checkpoint['report_frames']} report frames done)")
+    else:
+        # A fresh run discards whatever an earlier one left behind
+        shutil.rmtree(work_dir, ignore_errors=True)
+        checkpoint = {
+            "job": job,
+            "interval": int(interval),
+            "chunks": [],
+            "next_frame": frame_range[0] if frame_range else 0,
+            "report_frames": 0,
+            "processing_seconds": 0.0,
+        }
+    os.makedirs(work_dir, exist_ok=True)
+
+    source, start, end, total_frames = range_frames(input_path, config, frame_range)
+    chunks = plan_chunks(total_frames, checkpoint["interval"], start, end)
+    extension = os.path.splitext(output_path)[1] or ".mp4"
+    orchestrator = PipelineOrchestrator(copy.deepcopy(config))
+    debug_dir = config['explanation'].get('debug_dir', 'debug_frames')
+    for chunk in chunks[len(checkpoint["chunks"]):]:
+        video = os.path.join(work_dir, f"segment_{chunk.index}{extension}")
+        report = os.path.join(work_dir, f"segment_{chunk.index}.jsonl")
+        # Debug frames are renamed to global frame numbers when the reports are merged
+        orchestrator.config['explanation']['debug_dir'] = os.path.join(debug_dir, f"segment_{chunk.index}")
+
+        start_time = time.time()
+        orchestrator.process_segment(input_path, video, report, stage_rates, chunk)
+        summary = ReportReader(report).summary
+        checkpoint["chunks"].append({
+            "index": chunk.index,
+            "start_frame": chunk.start,
+            "end_frame": chunk.end,
+            "video": video,
+            "report": report,
+        })
+        checkpoint["next_frame"] = chunk.end
+        checkpoint["report_frames"] += sum(summary["engine_distribution"].values())
+        checkpoint["processing_seconds"] += time.time() - start_time
+        save_checkpoint(checkpoint_path, checkpoint)
+
+    videos = [chunk["video"] for chunk in checkpoint["chunks"]]
+    reports = [chunk["report"] for chunk in checkpoint["chunks"]]
+    start_time = time.time() - checkpoint["processing_seconds"]
+    concat_videos(videos, input_path if source.has_audio else None, output_path, config, audio_offset=start / source.fps)
+    merge_segment_reports(reports, input_path, output_path, report_path, config, start_time, frame_range)
+    shutil.rmtree(work_dir, ignore_errors=True)
@@ -0,0 +1,108 @@
+import logging
+import shutil
+import subprocess
+
+import cv2
+
+logger = logging.getLogger(__name__)
+
+# Encoder settings used when config.yaml's output.ffmpeg leaves them out
+DEFAULT_FFMPEG = {
+    "codec": "libx264",
+    "preset": "medium",
+    "crf": 18,
+    "threads": 0,
+    "pix_fmt": "yuv420p",
+}
+
+# cv2.VideoWriter codecs tried when output.video_codec is not available (pip
+# OpenCV builds usually lack avc1)
+FALLBACK_CODECS = ("mp4v",)
+
+
+class FFmpegWriter:
+    """
+    cv2.VideoWriter-compatible writer that streams raw BGR frames into one
+    ffmpeg process over stdin. With audio_source, the first audio stream of
+    that file (if it has one), from audio_offset seconds on, is muxed into
+    the output in the same invocation, so no second pass over the encoded
+    video is needed. audio_duration (seconds, when known) caps the audio at
+    the length of the source range; the video is never cut to the audio, so
+    a short audio track ends early instead of stopping the encode.
+    """
+    def __init__(self, path, fps, size, settings=None, audio_source=None, audio_offset=0.0, audio_duration=None):
+        self.path = path
+        self.settings = dict(DEFAULT_FFMPEG, **(settings or {}))
+        self.audio = audio_source is not None
+        width, height = size
+        cmd = [
+            "ffmpeg", "-y", "-loglevel", "error",
+            "-f", "rawvideo", "-pix_fmt", "bgr24",
+            "-s", f"{width}x{height}", "-r", str(fps),
+            "-i", "-",
+        ]
+        if self.audio:
+            # Not -shortest: with the video on stdin, ffmpeg would exit when the audio
+            # ends and every further write() would fail
+            cmd += ["-ss", str(audio_offset)]
+            if audio_duration is not None:
+                cmd += ["-t", str(audio_duration)]
+            cmd += ["-i", audio_source, "-map", "0:v:0", "-map", "1:a:0?", "-c:a", "aac"]
+        cmd += [
+            "-c:v", self.settings["codec"],
+            "-preset", str(self.settings["preset"]),
+            "-crf", str(self.settings["crf"]),
+            "-threads", str(self.settings["threads"]),
+            "-pix_fmt", self.settings["pix_fmt"],
+            path
+        ]
+        self._process = subprocess.Popen(cmd, stdin=subprocess.PIPE, stderr=subprocess.PIPE)
+        self._stderr = ""
+
+    def write(self, frame):
+        try:
+            self._process.stdin.write(frame.tobytes())
+        except (BrokenPipeError, ValueError):
+            # ffmpeg exited early (or was released); fail with its own error message
+            self._finish()
+            raise RuntimeError(f"ffmpeg stopped accepting frames for {self.path}: {self._stderr}")
+
+    def release(self):
+        self._finish()
+        if self._process.returncode != 0:
+            raise RuntimeError(f"ffmpeg failed writing {self.path}: {self._stderr}")
+
+    def _finish(self):
+        if self._process.returncode is None:
+            _, stderr = self._process.communicate()
+            self._stderr = stderr.decode(errors='replace').strip()
+
+
+def open_video_writer(path, fps, size, config, audio_source=None, audio_offset=0.0, audio_duration=None):
+    """
+    Writer for `path` per config.yaml's output.encoder: "ffmpeg" (the
+    default) pipes frames to ffmpeg with the output.ffmpeg settings and
+    muxes audio_source's audio (see FFmpegWriter); "opencv", or ffmpeg not being installed,
+    falls back to cv2.VideoWriter with output.video_codec (mp4v if this
+    OpenCV build cannot encode it) and no audio.
+    """
+    output_cfg = config['output']
+    if output_cfg.get('encoder', 'ffmpeg') == 'ffmpeg':
+        if shutil.which("ffmpeg"):
+            return FFmpegWriter(path, fps, size, output_cfg.get('ffmpeg'), audio_source, audio_offset, audio_duration)
+        logger.warning("ffmpeg not found; encoding with cv2.VideoWriter")
+
+    return opencv_writer(path, fps, size, output_cfg['video_codec'])
+
+
+def opencv_writer(path, fps, size, codec):
+    """cv2.VideoWriter for `codec`, falling back to FALLBACK_CODECS; raises if none can be opened."""
+    codecs = [codec] + [fallback for fallback in FALLBACK_CODECS if fallback != codec]
+    for candidate in codecs:
+        writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*candidate), fps, size)
+        if writer.isOpened():
+            if candidate != codec:
+                logger.warning(f"cv2.VideoWriter cannot encode {codec}; using {candidate}")
+            return writer
+        writer.release()
+    raise RuntimeError(f"cv2.VideoWriter could not open {path} with any of: {', '.join(codecs)}")
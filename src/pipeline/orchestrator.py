@@ -1,10 +1,12 @@
 import cv2
 import numpy as np
 import time
-import json
 import logging
+import math
 import os
 import subprocess
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from rich.progress import Progress, SpinnerColumn, BarColumn, TextColumn, TimeRemainingColumn
 from rich.console import Console
@@ -15,9 +17,27 @@ from rich.panel import Panel
 
 from src.interpolation.engine import SmartInterpolator
 from src.detection.metrics import ArtifactDetector
+from src.detection.fingerprint import FrameFingerprinter
+from src.detection.shots import ShotBoundaryDetector, ShotIndex
+from src.detection.tiles import TILE_SCALES
 from src.explanation.generator import ExplanationGenerator
 from src.explanation.visualizer import AdvancedVisualizer
+from src.explanation.metrics_archive import metrics_archive_path
 from src.explanation.report_generator import ReportGenerator
+from src.explanation.report_stream import ReportWriter
+from src.pipeline.encoder import FFmpegWriter, open_video_writer
+from src.pipeline.qa_pool import ProcessQAPool, QAScorer
+from src.pipeline.sampling import AdaptiveQASampler
+from src.pipeline.segments import Segment
+from src.pipeline.sources import open_source
+from src.pipeline.stages import BackgroundIterator, OrderedExecutor, ThreadedWriter
+from src.pipeline.timing import FrameRateConverter
+
+# One source pair waiting for interpolation. `cut` is (is_cut, similarity).
+PendingPair = namedtuple("PendingPair", ["index", "prev", "next", "duplicate", "cut", "shot"])
+
+# Metrics of a frame copied from its source (duplicate/static pairs)
+DUPLICATE_METRICS = {"motion_complexity": 0.0, "temporal_consistency": 1.0, "edge_preservation": 1.0, "occlusion_risk": 0.0}
 
 class PipelineOrchestrator:
     def __init__(self, config):
@@ -26,52 +46,125 @@ class PipelineOrchestrator:
         self.console = Console()
         
         with self.console.status("[bold green]Initializing AI Models..."):
-            self.interpolator = SmartInterpolator(config)
             self.detector = ArtifactDetector(config)
+            self.fingerprinter = FrameFingerprinter(config)
+            self.shot_detector = ShotBoundaryDetector(config)
             self.explainer = ExplanationGenerator(config)
-            self.visualizer = AdvancedVisualizer(config)
+            self.visualizer = AdvancedVisualizer(config, feature_cache=self.detector.feature_cache)
+            self.qa_scorer = QAScorer(config, self.detector, self.explainer, self.visualizer)
+            # QA scorer lets the engine cascade escalate only the pairs that need it
+            self.interpolator = SmartInterpolator(config, scorer=self._score_rgb)
+
+    def process_video(self, input_path, output_path, report_path, target_fps=None, factor=None, progress_callback=None,
+                      frame_range=None):
+        """
+        Interpolate a video to target_fps, or to factor x the source rate.
+        Both default to the values under 'interpolation' in config.yaml.
+        frame_range=(start, end) limits the run to source frames start..end
+        (end None = to the end); report timestamps stay absolute.
+        """
+        self._run_pipeline(input_path, output_path, report_path, [(target_fps, factor)],
+                           progress_callback=progress_callback, frame_range=frame_range)
+
+    def process_multipass(self, input_path, output_path, report_path, factors, intermediate_outputs=None, progress_callback=None,
+                          frame_range=None):
+        """
+        Run several interpolation passes in one invocation (e.g. factors=[2, 2]
+        for 10 -> 20 -> 40 FPS). Frames from each pass are streamed straight into
+        the next one in memory, so nothing is re-encoded or re-decoded between
+        passes, and a single merged report tags every frame with its stage.
+
+        intermediate_outputs optionally names a video file per intermediate
+        pass (None entries are skipped) for inspection.
+        """
+        self._run_pipeline(input_path, output_path, report_path, [(None, f) for f in factors],
+                           intermediate_outputs=intermediate_outputs, progress_callback=progress_callback,
+                           frame_range=frame_range)
+
+    def process_segment(self, input_path, output_path, report_path, stage_rates, segment):
+        """
+        Process one time range of the input for segment-parallel runs (see
+        src/pipeline/segments.py). Frame indices, timestamps and shot
+        boundaries in the report are global; frame numbers, debug frame names
+        and shot ids are segment-local until the reports are merged. Only the
+        report JSON is written: no HTML, shot index file or audio.
+        """
+        self._run_pipeline(input_path, output_path, report_path, stage_rates, segment=segment)
 
-    def process_video(self, input_path, output_path, report_path):
+    def _run_pipeline(self, input_path, output_path, report_path, stage_rates, intermediate_outputs=None, progress_callback=None,
+                      segment=None, frame_range=None):
         self.console.print(f"[bold blue]SYNTHESIGHT[/bold blue] Processing: [underline]{input_path}[/underline]")
         
-        cap = cv2.VideoCapture(input_path)
-        if not cap.isOpened():
-            raise ValueError(f"Could not open video: {input_path}")
-
-        fps = cap.get(cv2.CAP_PROP_FPS)
-        width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
-        height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
-        total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
-
-        # Output video writer (2x FPS for 2x interpolation)
-        fourcc = cv2.VideoWriter_fourcc(*self.config['output']['video_codec'])
-        out = cv2.VideoWriter(output_path, fourcc, fps * 2, (width, height))
-
-        # Initialize Report Structure
-        report_data = {
-            "metadata": {
+        source = open_source(input_path, self.config)
+        fps = source.fps
+        width, height = source.width, source.height
+
+        # Source frames to process: a segment's, the requested range, or all of them
+        span = segment
+        if span is None:
+            start, end = frame_range or (0, None)
+            span = Segment(None, start or 0, end, True)
+        if source.frame_count is not None:
+            if span.start >= source.frame_count:
+                raise ValueError(f"Start frame {span.start} is past the end of {input_path} ({source.frame_count} frames)")
+            if span.end is not None and span.end >= source.frame_count:
+                span = span._replace(end=None)
+        if span.start > 0:
+            source.seek(span.start)
+        frame_limit = span.end - span.start + 1 if span.end is not None else None
+        # Unknown for pipes until the input ends
+        total_frames = frame_limit or (source.frame_count - span.start if source.frame_count is not None else None)
+
+        # One rate converter per pass, each fed by the previous pass's output rate
+        converters = []
+        stage_fps = fps
+        for target_fps, factor in stage_rates:
+            converters.append(self._build_rate_converter(stage_fps, target_fps, factor))
+            stage_fps = converters[-1].target_fps
+        output_fps = stage_fps
+
+        intermediate_outputs = list(intermediate_outputs or [])
+        writers = []
+
+        # Streaming report: frames are written as their QA completes
+        archive_path = None
+        keep_tile_grids = False
+        if self.config['output'].get('metrics_archive', True):
+            if segment is None:
+                archive_path = metrics_archive_path(report_path)
+            else:
+                # The merged report's archive is built from the segments' tile grids
+                keep_tile_grids = True
+        report = ReportWriter(report_path, {
                 "input_file": input_path,
                 "output_file": output_path,
                 "processing_date": datetime.now().isoformat(),
-                "model_used": "FILM",
+                "model_used": self.interpolator.engine_description,
                 "frame_rate_original": fps,
-                "frame_rate_output": fps * 2,
-                "total_frames_processed": total_frames
-            },
-            "summary": {
-                "average_severity": 0.0,
-                "verdict_distribution": {"PASS": 0, "WARNING": 0, "FAIL": 0},
-                "processing_time_seconds": 0
-            },
-            "frames": []
-        }
-        
-        ret, prev_frame = cap.read()
-        if not ret:
-            return
-
-        # Write first frame
-        out.write(prev_frame)
+                "frame_rate_output": output_fps,
+                "total_frames_processed": total_frames,
+                # Debug composites (frame_<n>_xai.jpg) linked from the HTML report
+                "debug_dir": self.config['explanation'].get('debug_dir', 'debug_frames'),
+                "tile_grid": {
+                    "rows": self.detector.tile_rows,
+                    "cols": self.detector.tile_cols,
+                    "encoding": "base64 uint8, row-major; value = byte / scale",
+                    "scales": TILE_SCALES,
+                } if self.detector.tiles_enabled else None,
+                "stages": [
+                    {
+                        "stage": stage,
+                        "frame_rate_input": converter.source_fps,
+                        "frame_rate_output": converter.target_fps,
+                        "intermediate_file": intermediate_outputs[stage - 1] if stage <= len(intermediate_outputs) else None
+                    }
+                    for stage, converter in enumerate(converters, start=1)
+                ],
+                # Thresholds behind the verdicts; rescore.py re-applies new ones to the archive
+                "scoring": self.explainer.scoring
+        }, archive_path, keep_tile_grids)
+        if segment is None and (span.start > 0 or span.end is not None):
+            report.metadata["frame_range"] = {"start_frame": span.start, "end_frame": span.end}
         
         # Setup Rich Progress
         progress = Progress(
@@ -82,110 +175,445 @@ class PipelineOrchestrator:
             TimeRemainingColumn(),
         )
         
-        task_id = progress.add_task("[cyan]Interpolating...", total=total_frames-1)
-        
-        frame_idx = 0
-        start_process_time = time.time()
-        
         # Live Dashboard
         layout = Layout()
         layout.split_column(
-            Layout(name="progress", size=3),
+            Layout(name="progress", size=3 + len(converters) - 1),
             Layout(name="metrics")
         )
         layout["progress"].update(Panel(progress, title="Progress", border_style="green"))
         
         # Create debug directory for dashboard
-        os.makedirs("debug_frames", exist_ok=True)
-
-        with Live(layout, refresh_per_second=4) as live:
-            while True:
-                ret, curr_frame = cap.read()
-                if not ret:
-                    break
-
-                # Interpolate
-                start_time = time.time()
-                prev_rgb = cv2.cvtColor(prev_frame, cv2.COLOR_BGR2RGB)
-                curr_rgb = cv2.cvtColor(curr_frame, cv2.COLOR_BGR2RGB)
-                
-                # Smart Interpolator handles scene detection internally now
-                interp_rgb = self.interpolator.interpolate(prev_rgb, curr_rgb, 0.5)
-                interp_bgr = cv2.cvtColor(interp_rgb, cv2.COLOR_RGB2BGR)
-                inference_time = time.time() - start_time
-
-                # Detect Artifacts
-                metrics = self.detector.detect_artifacts(prev_frame, curr_frame, interp_bgr)
-                
-                # Explain
-                explanation = self.explainer.generate_explanation(metrics)
-                
-                # LLM Explanation (Advanced XAI)
-                
-                # Update Report
-                frame_entry = {
-                    "frame_number": frame_idx,
-                    "timestamp": frame_idx / fps,
-                    "metrics": metrics,
-                    "severity_score": explanation['severity'],
-                    "verdict": explanation['verdict'],
-                    "explanation": explanation['details'],
-                }
-                report_data["frames"].append(frame_entry)
-                report_data["summary"]["verdict_distribution"][explanation['verdict']] += 1
-                
-                # Save debug frames for dashboard (Optimized)
-                save_debug = self.config['explanation'].get('save_debug_frames', False)
-                if save_debug and explanation['verdict'] != "PASS":
-                     # Use Advanced Visualizer for Composite XAI Frame
-                     composite = self.visualizer.generate_composite_debug_frame(prev_frame, interp_bgr, metrics, explanation)
-                     cv2.imwrite(f"debug_frames/frame_{frame_idx}_xai.jpg", composite)
-
-                # Write frames (Interpolated + Next)
-                out.write(interp_bgr)
-                out.write(curr_frame)
-                
-                # Update Dashboard
-                progress.update(task_id, advance=1)
-                
-                # Prepare next iteration
-                prev_frame = curr_frame
-                frame_idx += 1
+        os.makedirs(self.config['explanation'].get('debug_dir', 'debug_frames'), exist_ok=True)
+
+        start_process_time = time.time()
+        self.detector.clear_cache()
+
+        # Threaded mode: decode and encode get their own threads and QA runs on a
+        # worker pool, all joined by bounded queues (their sizes set the backpressure)
+        pipeline_cfg = self.config.get('pipeline', {})
+        threaded = pipeline_cfg.get('threaded', False)
+        qa_workers = int(pipeline_cfg.get('qa_workers', 4)) if threaded else 0
+        qa_executor = qa_pool = None
+        if qa_workers > 0 and pipeline_cfg.get('qa_executor', 'thread') == 'process':
+            # Shared-memory slots for every frame a queued or running QA job can reference
+            frames_per_pair = 1 + max(math.ceil(c.target_fps / c.source_fps) for c in converters)
+            slots = (int(pipeline_cfg.get('qa_queue', 16)) + qa_workers + 1) * frames_per_pair
+            qa_pool = ProcessQAPool(self.config, qa_workers, (height, width, 3), slots)
+        elif qa_workers > 0:
+            qa_executor = ThreadPoolExecutor(qa_workers, thread_name_prefix="qa")
+
+        # Chain the passes as generators: decode -> pass 1 -> pass 2 -> ... -> encode
+        shot_indexes = []
+        frames = source.frames(frame_limit)
+        if threaded:
+            frames = iter(BackgroundIterator(frames, pipeline_cfg.get('decode_queue', 32), name="decode"))
+        stage_frames = total_frames
+        # Global index of each pass's first input frame; a segment's trailing
+        # frame is the next segment's first, so only the last segment emits it
+        first_index = span.start
+        for stage, converter in enumerate(converters, start=1):
+            description = "[cyan]Interpolating..." if len(converters) == 1 else f"[cyan]Pass {stage} ({converter.source_fps:.2f} -> {converter.target_fps:.2f} FPS)..."
+            stage_pairs = max(stage_frames - 1, 0) if stage_frames is not None else None
+            task_id = progress.add_task(description, total=stage_pairs)
+            on_advance = self._make_progress_hook(progress, task_id, stage_pairs, report, progress_callback)
+            shot_indexes.append(ShotIndex(converter.source_fps))
+            emit_last = span.last or stage < len(converters)
+            frames = self._run_stage(frames, converter, stage, report, on_advance, shot_indexes[-1], qa_executor, qa_pool,
+                                     first_index, emit_last)
+            first_index = converter.output_index(first_index)
+
+            intermediate_path = intermediate_outputs[stage - 1] if stage <= len(intermediate_outputs) else None
+            if stage < len(converters) and intermediate_path:
+                writer = open_video_writer(intermediate_path, converter.target_fps, (width, height), self.config)
+                if threaded:
+                    writer = ThreadedWriter(writer, pipeline_cfg.get('encode_queue', 32), name=f"encode-{stage}")
+                writers.append(writer)
+                frames = self._tee_frames(frames, writer)
+
+            if stage_frames is not None:
+                stage_frames = int(round(stage_frames * converter.target_fps / converter.source_fps))
+
+        # Output video writer at the target frame rate; the ffmpeg encoder muxes
+        # the source audio as it goes (segments get theirs when concatenated)
+        transfer_audio = segment is None and source.has_audio
+        audio_offset = span.start / fps
+        audio_duration = total_frames / fps if total_frames is not None else None
+        out = open_video_writer(output_path, output_fps, (width, height), self.config,
+                                audio_source=input_path if transfer_audio else None, audio_offset=audio_offset,
+                                audio_duration=audio_duration)
+        audio_muxed = isinstance(out, FFmpegWriter)
+        if threaded:
+            out = ThreadedWriter(out, pipeline_cfg.get('encode_queue', 32), name="encode")
+        writers.append(out)
+
+        try:
+            with Live(layout, refresh_per_second=4) as live:
+                for frame in frames:
+                    out.write(frame)
+        finally:
+            if qa_executor is not None:
+                qa_executor.shutdown(wait=True)
+            if qa_pool is not None:
+                qa_pool.shutdown()
 
         # Finalize Report
         end_process_time = time.time()
-        report_data["summary"]["processing_time_seconds"] = end_process_time - start_process_time
-        total_severity = sum(f["severity_score"] for f in report_data["frames"])
-        if len(report_data["frames"]) > 0:
-            report_data["summary"]["average_severity"] = total_severity / len(report_data["frames"])
-
-        # Save Report
-        with open(report_path, 'w') as f:
-            json.dump(report_data, f, indent=2)
+
+        # Frames actually decoded (pipes and short reads included)
+        total_frames = source.position - span.start
+        report.metadata["total_frames_processed"] = total_frames
+        if "frame_range" in report.metadata:
+            report.metadata["frame_range"]["end_frame"] = span.start + total_frames - 1
+
+        # Shot boundaries of the source video (pass 1 input)
+        source_shots = shot_indexes[0]
+        report.metadata["shot_count"] = len(source_shots.shots())
+        report.metadata["shot_boundaries"] = source_shots.boundaries
+        if segment is not None:
+            # What merge_segment_reports needs to renumber shots and rebuild the index
+            report.metadata["segment"] = {
+                "index": segment.index,
+                "start_frame": segment.start,
+                "end_frame": segment.start + total_frames - 1,
+                "stage_cuts": [len(index.boundaries) for index in shot_indexes],
+                "cut_similarities": source_shots.cut_similarities,
+            }
+        elif self.config['detection'].get('shots', {}).get('save_index', True):
+            shots_path = os.path.splitext(report_path)[0] + "_shots.json"
+            source_shots.save(shots_path)
+            report.metadata["shot_index_file"] = shots_path
+
+        # Save Report (summary record; JSON reports are assembled here)
+        report.close(end_process_time - start_process_time)
             
         # Generate HTML Report
-        html_path = report_path.replace(".json", ".html")
-        try:
-            gen = ReportGenerator(report_path)
-            gen.generate_html_report(html_path)
-            self.console.print(f"[bold green]HTML Report Generated: {html_path}[/bold green]")
-        except Exception as e:
-            self.logger.error(f"Failed to generate HTML report: {e}")
+        if segment is None:
+            html_path = os.path.splitext(report_path)[0] + ".html"
+            try:
+                gen = ReportGenerator(report_path)
+                gen.generate_html_report(html_path)
+                self.console.print(f"[bold green]HTML Report Generated: {html_path}[/bold green]")
+            except Exception as e:
+                self.logger.error(f"Failed to generate HTML report: {e}")
             
-        out.release()
-        cap.release()
+        for writer in writers:
+            writer.release()
+        source.release()
         
         self.console.print("[bold green]Video Processing Complete![/bold green]")
         
-        # Audio Transfer (if ffmpeg is available)
-        self._transfer_audio(input_path, output_path)
+        # Audio Transfer for the cv2.VideoWriter fallback (if ffmpeg is available)
+        if transfer_audio and not audio_muxed:
+            self._transfer_audio(input_path, output_path, audio_offset)
+
+    def _tee_frames(self, frames, writer):
+        for frame in frames:
+            writer.write(frame)
+            yield frame
+
+    def _make_progress_hook(self, progress, task_id, total, report, progress_callback):
+        state = {"done": 0}
+
+        def on_advance(count):
+            # Update Dashboard
+            progress.update(task_id, advance=count)
+            state["done"] += count
+            if progress_callback:
+                metrics = report.last_written["metrics"] if report.last_written else None
+                progress_callback(state["done"], total, metrics)
+
+        return on_advance
+
+    def _run_stage(self, frames, converter, stage, report, on_advance, shot_index, qa_executor=None, qa_pool=None,
+                   first_index=0, emit_last=True):
+        """
+        One interpolation pass over a stream of BGR frames.
+        Yields the pass's output frames in timestamp order and fills
+        shot_index with the scene cuts of this pass's input. QA runs on
+        qa_executor or on the worker processes of qa_pool when given,
+        inline otherwise. first_index is the global index of the first
+        frame; emit_last=False holds back the final frame (segment overlap).
+        """
+        prev_frame = next(frames, None)
+        if prev_frame is None:
+            return
+
+        # Pairs are buffered so FILM sees interpolation.batch_size pairs per call
+        batch_size = max(1, int(self.config['interpolation'].get('batch_size', 1)))
+        pending = []
+        frame_idx = first_index
+
+        # Fingerprints and shot signatures are computed once per frame;
+        # "curr" becomes the next pair's "prev"
+        use_fingerprints = self.fingerprinter.enabled
+        prev_fp = self.fingerprinter.compute(prev_frame) if use_fingerprints else None
+        prev_sig = self.shot_detector.signature(prev_frame)
+        shot_index.num_frames = first_index + 1
+        sampler = AdaptiveQASampler(self.config)
+        # QA results are consumed in output order; at most qa_queue pairs wait for a worker
+        qa = OrderedExecutor(qa_executor, self.config.get('pipeline', {}).get('qa_queue', 16))
+
+        for curr_frame in frames:
+            curr_fp = self.fingerprinter.compute(curr_frame) if use_fingerprints else None
+            curr_sig = self.shot_detector.signature(curr_frame)
+            cut = self.shot_detector.compare(prev_sig, curr_sig)
+            shot_index.add_pair(frame_idx, *cut)
+            pending.append(PendingPair(
+                frame_idx, prev_frame, curr_frame,
+                self.fingerprinter.is_duplicate(prev_fp, curr_fp),
+                cut, shot_index.shot_of(frame_idx)
+            ))
+            # Prepare next iteration
+            prev_frame, prev_fp, prev_sig = curr_frame, curr_fp, curr_sig
+            frame_idx += 1
+
+            if len(pending) >= batch_size:
+                yield from self._process_batch(pending, converter, stage, report, sampler, qa, qa_pool)
+                on_advance(len(pending))
+                pending = []
+
+        # Flush the partial batch left when the stream is exhausted
+        if pending:
+            yield from self._process_batch(pending, converter, stage, report, sampler, qa, qa_pool)
+            on_advance(len(pending))
+        self._finish_sampling(sampler, qa, stage, report)
+
+        # The last source frame has no pair of its own
+        if emit_last and converter.includes_source_frame(frame_idx):
+            yield prev_frame
+
+    def _build_rate_converter(self, fps, target_fps=None, factor=None):
+        interp_cfg = self.config['interpolation']
+        target_fps = target_fps or interp_cfg.get('target_fps')
+        if target_fps:
+            return FrameRateConverter(fps, target_fps)
+        return FrameRateConverter.from_factor(fps, factor or interp_cfg.get('factor', 2))
+
+    def _process_batch(self, pending, converter, stage, report, sampler, qa, qa_pool=None):
+        """
+        Interpolate a batch of PendingPairs in one engine call, queue their QA
+        and yield the output frames in timestamp order. Duplicate pairs skip
+        scene detection, interpolation and QA. Report entries are created here,
+        in output order, and filled in as QA results come back.
+        """
+        # t == 0 is the source frame itself; only t > 0 needs synthesis
+        timesteps = [converter.timesteps(pair.index) for pair in pending]
+        synth_times = [[t for t in times if t > 0] for times in timesteps]
+
+        work = [k for k, pair in enumerate(pending) if not pair.duplicate]
+        pairs = [
+            (cv2.cvtColor(pending[k].prev, cv2.COLOR_BGR2RGB), cv2.cvtColor(pending[k].next, cv2.COLOR_BGR2RGB))
+            for k in work
+        ]
+        
+        # Scene cuts were already decided from the per-frame signatures; cascade
+        # QA scores the BGR originals under their frame keys, as _qa_job does
+        interp_rgbs, interp_infos = self.interpolator.interpolate_timesteps_with_info(
+            pairs, [synth_times[k] for k in work], cuts=[pending[k].cut for k in work],
+            originals=[(pending[k].prev, pending[k].next, self._frame_keys(pending[k], stage)) for k in work]
+        )
+        interpolated = dict(zip(work, zip(interp_rgbs, interp_infos)))
+
+        for k, pair in enumerate(pending):
+            if timesteps[k] and timesteps[k][0] == 0:
+                yield pair.prev
+
+            if pair.duplicate:
+                # Static content: the "interpolated" frame is the frame itself
+                if synth_times[k]:
+                    report.summary["duplicate_fast_path_pairs"] += 1
+                    info = {"engine": "duplicate", "qa": None, "escalations": 0}
+                    entries = [self._record_frame(pair, t, converter, stage, report, info) for t in synth_times[k]]
+                    qa.submit(self._duplicate_job, entries)
+                for t in synth_times[k]:
+                    yield pair.prev
+                continue
+
+            interp_frames, infos = interpolated[k]
+            frames = []
+            for t, interp_rgb, info in zip(synth_times[k], interp_frames, infos):
+                interp_bgr = cv2.cvtColor(interp_rgb, cv2.COLOR_RGB2BGR)
+                entry = self._record_frame(pair, t, converter, stage, report, info)
+                frames.append((t, interp_bgr, info, entry))
+
+            if frames:
+                scored = any(info["qa"] is not None for _, _, info, _ in frames)
+                if scored or sampler.should_measure(pair.index):
+                    # Frames skipped since the previous sample are resolved with this one
+                    deferred, sampler.deferred = sampler.deferred, []
+                    if qa_pool is not None and not scored:
+                        future = qa_pool.submit(
+                            pair.prev, pair.next,
+                            [(t, interp_bgr, entry["frame_number"]) for t, interp_bgr, _, entry in frames],
+                            self._frame_keys(pair, stage)
+                        )
+                        qa.add(future, lambda scores, pair=pair, frames=frames, deferred=deferred:
+                               ("measured", pair, frames, scores, deferred))
+                    else:
+                        qa.submit(self._qa_job, pair, frames, stage, deferred)
+                else:
+                    # Off-sample: scored or inferred once the next sample is measured
+                    sampler.deferred.extend((pair, frame) for frame in frames)
+
+            for _, interp_bgr, _, _ in frames:
+                yield interp_bgr
+            self._collect_qa(qa.ready(), stage, report, sampler)
+
+    def _duplicate_job(self, entries):
+        return "duplicate", entries
+
+    def _qa_job(self, pair, frames, stage, deferred=None):
+        """
+        Full QA for the frames of one pair; safe to run on a worker thread.
+        Only computes results (and debug images); report entries are filled
+        by _collect_qa on the pipeline thread, in order.
+        """
+        results = self.qa_scorer.score(
+            pair.prev, pair.next,
+            [(t, interp_bgr, info["qa"], entry["frame_number"]) for t, interp_bgr, info, entry in frames],
+            self._frame_keys(pair, stage)
+        )
+        return "measured", pair, frames, results, deferred or []
+
+    def _collect_qa(self, results, stage, report, sampler):
+        """Fill report entries from QA results, which arrive in output order."""
+        for kind, *payload in results:
+            if kind == "duplicate":
+                for entry in payload[0]:
+                    self._fill_duplicate(entry, report)
+                continue
+
+            pair, frames, scores, deferred = payload
+            entries = [entry for _, _, _, entry in frames]
+            self._fill_measured(entries, scores, report)
+            if not sampler.enabled:
+                continue
+
+            if any(sampler.crosses_threshold(entry) for entry in entries):
+                # Densify: every pair ahead of this sample, and the skipped ones behind it
+                sampler.densify(pair.index)
+                for d_pair, frame in deferred:
+                    self._measure_deferred(d_pair, frame, stage, report)
+            else:
+                self._resolve_deferred(deferred, stage, report, sampler, entries[0])
+            sampler.last_measured = entries[-1]
+
+    def _fill_measured(self, entries, scores, report):
+        for entry, (metrics, explanation, tiles, tile_grids) in zip(entries, scores):
+            if tiles is not None:
+                entry["tiles"] = tiles
+            if tile_grids:
+                # Not part of the report; ReportWriter sets them aside for the metrics archive
+                entry["tile_grids"] = tile_grids
+            self._fill_entry(entry, metrics, explanation, report, "measured")
+
+    def _measure_deferred(self, pair, frame, stage, report):
+        _, _, _, scores, _ = self._qa_job(pair, [frame], stage)
+        self._fill_measured([frame[3]], scores, report)
+        return frame[3]
+
+    def _resolve_deferred(self, deferred, stage, report, sampler, next_measured=None):
+        """
+        Measure deferred frames inside a densified window and infer the rest.
+        With a QA pool, a pair can be deferred before the sample that
+        densifies over it has been scored; this catches those.
+        """
+        run = []
+        for d_pair, frame in deferred:
+            if d_pair.index > sampler.dense_until:
+                run.append((d_pair, frame))
+                continue
+            entry = self._measure_deferred(d_pair, frame, stage, report)
+            if sampler.crosses_threshold(entry):
+                sampler.densify(d_pair.index)
+            self._infer_frames(run, report, sampler, entry)
+            run = []
+            sampler.last_measured = entry
+        self._infer_frames(run, report, sampler, next_measured)
+
+    def _fill_duplicate(self, entry, report):
+        """
+        Duplicate-pair entry: a copy of the source frame, with static-pair
+        metrics and its own PASS verdict (never its neighbours', which may
+        be a scene cut's FAIL).
+        """
+        self._fill_entry(entry, dict(DUPLICATE_METRICS), self.explainer.duplicate_explanation(), report, "inferred")
+
+    def _score_rgb(self, prev_rgb, next_rgb, interp_rgb, t, originals=None):
+        """
+        QA for RGB frames, as used by the interpolator's engine cascade.
+        originals = (prev_bgr, next_bgr, frame_keys) lets the pair's flow and
+        frame features be computed once for all timesteps and cascade levels.
+        """
+        if originals is not None:
+            prev_bgr, next_bgr, frame_keys = originals
+        else:
+            prev_bgr, next_bgr, frame_keys = (cv2.cvtColor(prev_rgb, cv2.COLOR_RGB2BGR),
+                                              cv2.cvtColor(next_rgb, cv2.COLOR_RGB2BGR), None)
+        analysis = self.detector.analyze(
+            prev_bgr, next_bgr, cv2.cvtColor(interp_rgb, cv2.COLOR_RGB2BGR), t, frame_keys=frame_keys
+        )
+        return analysis.metrics, self.explainer.generate_explanation(analysis.metrics, analysis.tiles), analysis
+
+    def _finish_sampling(self, sampler, qa, stage, report):
+        """Collect outstanding QA and resolve frames still deferred at the end of a pass."""
+        self._collect_qa(qa.drain(), stage, report, sampler)
+        deferred, sampler.deferred = sampler.deferred, []
+        if sampler.last_measured is None:
+            for d_pair, frame in deferred:
+                self._measure_deferred(d_pair, frame, stage, report)
+        else:
+            self._resolve_deferred(deferred, stage, report, sampler)
+
+    def _infer_frames(self, deferred, report, sampler, next_measured=None):
+        for position, (_, (_, _, _, entry)) in enumerate(deferred):
+            metrics = sampler.inferred_metrics(position, len(deferred), next_measured)
+            self._fill_entry(entry, metrics, self.explainer.generate_explanation(metrics), report, "inferred")
+
+    def _frame_keys(self, pair, stage):
+        # Feature-cache keys of the pair's original frames
+        return (stage, pair.index), (stage, pair.index + 1)
+
+    def _record_frame(self, pair, t, converter, stage, report, info):
+        # Update Report (one entry per synthesized frame); scores come from _fill_entry
+        output_idx = report.count
+        frame_entry = {
+            "frame_number": output_idx,
+            "stage": stage,
+            "source_frame": pair.index,
+            "shot": pair.shot,
+            "timestep": t,
+            "timestamp": (pair.index + t) / converter.source_fps,
+            "engine": info["engine"],
+            "escalations": info["escalations"],
+            "qa": None,
+            "metrics": None,
+            "severity_score": None,
+            "verdict": None,
+            "explanation": None,
+        }
+        report.append(frame_entry)
+        return frame_entry
+
+    def _fill_entry(self, entry, metrics, explanation, report, qa):
+        # qa: "measured" (full QA ran on this frame) or "inferred" (reused / interpolated)
+        entry["qa"] = qa
+        entry["metrics"] = metrics
+        entry["severity_score"] = explanation['severity']
+        entry["verdict"] = explanation['verdict']
+        entry["explanation"] = explanation['details']
+        # Written out (and counted in the summary) once every earlier frame is filled too
+        report.flush()
 
-    def _transfer_audio(self, input_path, output_path):
+    def _transfer_audio(self, input_path, output_path, offset=0.0):
         """
-        Transfers audio from input to output using ffmpeg.
+        Transfers audio from input to output using ffmpeg, starting `offset`
+        seconds into the input (for frame-range runs).
         """
         try:
-            temp_output = output_path.replace(".mp4", "_temp.mp4")
+            base, extension = os.path.splitext(output_path)
+            temp_output = f"{base}_temp{extension}"
             os.rename(output_path, temp_output)
             
             # Use ffmpeg to copy video stream and audio stream
@@ -194,6 +622,7 @@ class PipelineOrchestrator:
             cmd = [
                 "ffmpeg", "-y",
                 "-i", temp_output,
+                "-ss", str(offset),
                 "-i", input_path,
                 "-c:v", "copy",
                 "-c:a", "aac",
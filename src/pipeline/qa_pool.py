@@ -0,0 +1,188 @@
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import cv2
+import numpy as np
+
+from src.detection.metrics import ArtifactDetector
+from src.detection.tiles import encode_tiles
+from src.explanation.generator import ExplanationGenerator
+from src.explanation.visualizer import AdvancedVisualizer
+
+
+class QAScorer:
+    """
+    Full QA for the synthesized frames of one source pair: metrics,
+    explanation, report tiles and the debug composite. The pipeline keeps one
+    in-process; ProcessQAPool builds one per worker process.
+    """
+    def __init__(self, config, detector=None, explainer=None, visualizer=None):
+        self.config = config
+        self.detector = detector or ArtifactDetector(config)
+        self.explainer = explainer or ExplanationGenerator(config)
+        self.visualizer = visualizer or AdvancedVisualizer(config, feature_cache=self.detector.feature_cache)
+
+    def score(self, prev, next, frames, frame_keys):
+        """
+        frames holds (t, interp_bgr, prescored, frame_number) per synthesized
+        frame, where prescored is the engine cascade's (metrics, explanation,
+        analysis) or None. Returns (metrics, explanation, tiles, tile_grids)
+        per frame: tiles is the report encoding, or None, and tile_grids the
+        full-precision grids behind it (for the metrics archive), or None.
+        """
+        # Detect Artifacts for all frames the cascade left unscored in one batch
+        # (flow field and edge maps are kept for the visualizer)
+        unscored = [k for k, frame in enumerate(frames) if frame[2] is None]
+        analyses = dict(zip(unscored, self.detector.analyze_batch(
+            prev, next, [frames[k][1] for k in unscored], [frames[k][0] for k in unscored], frame_keys=frame_keys
+        )))
+
+        results = []
+        for k, (t, interp_bgr, prescored, frame_number) in enumerate(frames):
+            if prescored is not None:
+                # Already scored by the engine cascade
+                metrics, explanation, analysis = prescored
+            else:
+                analysis = analyses[k]
+                metrics = analysis.metrics
+
+                # Explain
+                explanation = self.explainer.generate_explanation(metrics, analysis.tiles)
+
+            tiles = None
+            if analysis is not None and analysis.tiles and self.config['detection'].get('tiles', {}).get('save_in_report', True):
+                # Compact base64 uint8 grids; see metadata["tile_grid"] for decoding
+                tiles = encode_tiles({**analysis.tiles, "severity": explanation["tile_severity"]})
+            results.append((metrics, explanation, tiles, analysis.tiles if analysis is not None else None))
+
+            # Save debug frames for dashboard (Optimized)
+            save_debug = self.config['explanation'].get('save_debug_frames', False)
+            if save_debug and explanation['verdict'] != "PASS":
+                # Use Advanced Visualizer for Composite XAI Frame
+                composite = self.visualizer.generate_composite_debug_frame(
+                    prev, interp_bgr, metrics, explanation, original_key=frame_keys[0], analysis=analysis,
+                    time=t
+                )
+                debug_dir = self.config['explanation'].get('debug_dir', 'debug_frames')
+                cv2.imwrite(os.path.join(debug_dir, f"frame_{frame_number}_xai.jpg"), composite)
+        return results
+
+
+class SharedFrameStore:
+    """
+    Fixed number of frame-sized slots in one shared-memory block. The
+    pipeline copies a frame in once and workers read it in place, so only
+    slot numbers cross the process boundary. Slots are reference counted by
+    key, which lets consecutive pairs share their common source frame.
+    """
+    def __init__(self, frame_shape, slots):
+        self.frame_shape = tuple(frame_shape)
+        self.slots = max(1, int(slots))
+        self.shm = shared_memory.SharedMemory(create=True, size=int(np.prod(self.frame_shape)) * self.slots)
+        self.frames = np.ndarray((self.slots, *self.frame_shape), dtype=np.uint8, buffer=self.shm.buf)
+        self._lock = threading.Lock()
+        self._free = list(range(self.slots - 1, -1, -1))
+        self._by_key = {}
+        self._keys = {}
+        self._refs = {}
+
+    def acquire(self, key, frame):
+        """Slot holding `frame` under `key`, or None if it cannot be shared (store full, other shape)."""
+        if frame.shape != self.frame_shape or frame.dtype != np.uint8:
+            return None
+        with self._lock:
+            slot = self._by_key.get(key)
+            if slot is None:
+                if not self._free:
+                    return None
+                slot = self._free.pop()
+                self.frames[slot] = frame
+                self._by_key[key] = slot
+                self._keys[slot] = key
+                self._refs[slot] = 0
+            self._refs[slot] += 1
+        return slot
+
+    def release(self, slots):
+        with self._lock:
+            for slot in slots:
+                self._refs[slot] -= 1
+                if self._refs[slot] == 0:
+                    del self._refs[slot]
+                    del self._by_key[self._keys.pop(slot)]
+                    self._free.append(slot)
+
+    def close(self):
+        # The array view must go before the mapping can be closed
+        del self.frames
+        self.shm.close()
+        self.shm.unlink()
+
+
+# Per-process state of a QA worker, set up once by _init_worker
+_worker = {}
+
+
+def _init_worker(config, shm_name, frame_shape, slots):
+    shm = shared_memory.SharedMemory(name=shm_name)
+    _worker["shm"] = shm
+    _worker["frames"] = np.ndarray((slots, *frame_shape), dtype=np.uint8, buffer=shm.buf)
+    _worker["scorer"] = QAScorer(config)
+    # Parallelism comes from the pool; one OpenCV thread per worker avoids oversubscription
+    cv2.setNumThreads(1)
+
+
+def _resolve(ref):
+    # Slot number in the shared store, or the array itself when it did not fit
+    return _worker["frames"][ref] if isinstance(ref, int) else ref
+
+
+def _score_job(prev_ref, next_ref, frames, frame_keys):
+    frames = [(t, _resolve(ref), None, frame_number) for t, ref, frame_number in frames]
+    return _worker["scorer"].score(_resolve(prev_ref), _resolve(next_ref), frames, frame_keys)
+
+
+class ProcessQAPool:
+    """
+    Runs QA on worker processes, so the pure-Python and skimage parts of the
+    detector and explainer do not contend for the GIL. Frames travel through
+    a SharedFrameStore; a frame that finds no free slot is pickled instead.
+    """
+    def __init__(self, config, workers, frame_shape, slots):
+        self.store = SharedFrameStore(frame_shape, slots)
+        # spawn, not fork: the parent may already be running TensorFlow threads
+        self.executor = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(config, self.store.shm.name, self.store.frame_shape, self.store.slots),
+        )
+
+    def submit(self, prev, next, frames, frame_keys):
+        """
+        QA for one pair; frames holds (t, interp_bgr, frame_number).
+        Returns a Future of QAScorer.score's results.
+        """
+        acquired = []
+
+        def share(key, frame):
+            slot = self.store.acquire(key, frame)
+            if slot is None:
+                return frame
+            acquired.append(slot)
+            return slot
+
+        prev_ref = share(frame_keys[0], prev)
+        next_ref = share(frame_keys[1], next)
+        refs = [(t, share((*frame_keys[0], t), interp_bgr), frame_number) for t, interp_bgr, frame_number in frames]
+        future = self.executor.submit(_score_job, prev_ref, next_ref, refs, frame_keys)
+        # Workers are done with the slots once the job finishes, collected or not
+        future.add_done_callback(lambda _: self.store.release(acquired))
+        return future
+
+    def shutdown(self):
+        self.executor.shutdown(wait=True)
+        self.store.close()
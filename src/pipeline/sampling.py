@@ -0,0 +1,47 @@
+class AdaptiveQASampler:
+    """
+    Decides which source pairs of one pass get the full QA suite.
+    Every `interval`-th pair is measured; a measured pair whose severity or
+    motion crosses a threshold switches to measuring every pair for the next
+    `densify_radius` pairs, and the pairs skipped since the previous sample
+    are measured retroactively. Frames that are never measured get metrics
+    interpolated from the surrounding samples.
+    """
+    def __init__(self, config=None):
+        sampling_cfg = ((config or {}).get('detection', {}) or {}).get('sampling', {}) or {}
+        self.enabled = sampling_cfg.get('enabled', False)
+        self.interval = max(1, int(sampling_cfg.get('interval', 10)))
+        self.densify_radius = int(sampling_cfg.get('densify_radius', 10))
+        self.severity_threshold = float(sampling_cfg.get('severity_threshold', 0.4))
+        self.motion_threshold = float(sampling_cfg.get('motion_threshold', 5.0))
+
+        self.dense_until = -1
+        # Frames awaiting a decision: (pair, (t, interp_bgr, info, report entry))
+        self.deferred = []
+        # Report entry of the most recent measured frame
+        self.last_measured = None
+
+    def should_measure(self, pair_index):
+        if not self.enabled:
+            return True
+        return pair_index % self.interval == 0 or pair_index <= self.dense_until
+
+    def crosses_threshold(self, entry):
+        return (entry["severity_score"] >= self.severity_threshold
+                or entry["metrics"]["motion_complexity"] >= self.motion_threshold)
+
+    def densify(self, pair_index):
+        self.dense_until = max(self.dense_until, pair_index + self.densify_radius)
+
+    def inferred_metrics(self, position, count, next_measured=None):
+        """
+        Metrics for the position-th of `count` skipped frames, linearly
+        interpolated between the last measured frame and next_measured
+        (the previous/next sample alone at the stream ends).
+        """
+        before = self.last_measured["metrics"] if self.last_measured else None
+        after = next_measured["metrics"] if next_measured else None
+        if before is None or after is None:
+            return dict(before or after)
+        w = (position + 1) / (count + 1)
+        return {key: (1.0 - w) * before[key] + w * after[key] for key in before}
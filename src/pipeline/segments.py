@@ -0,0 +1,210 @@
+import copy
+import logging
+import multiprocessing
+import os
+import shutil
+import subprocess
+import time
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+
+import cv2
+
+from src.detection.shots import ShotIndex
+from src.explanation.metrics_archive import metrics_archive_path
+from src.explanation.report_generator import ReportGenerator
+from src.explanation.report_stream import ReportReader, ReportWriter
+from src.pipeline.encoder import opencv_writer
+from src.pipeline.sources import open_source
+
+logger = logging.getLogger(__name__)
+
+# Source frames [start, end] of one time range (end None = to the end of the
+# video). Consecutive segments share their boundary frame, so the pair that
+# straddles it is interpolated by the earlier segment.
+Segment = namedtuple("Segment", ["index", "start", "end", "last"])
+
+
+def plan_segments(total_frames, workers, start=0, end=None):
+    """Split total_frames from `start` on into up to `workers` segments of roughly equal length."""
+    workers = max(1, min(int(workers), (total_frames - 1) // 2))
+    bounds = [start + round(k * (total_frames - 1) / workers) for k in range(workers + 1)]
+    return [
+        Segment(k, bounds[k], bounds[k + 1] if k < workers - 1 else end, k == workers - 1)
+        for k in range(workers)
+    ]
+
+
+def range_frames(input_path, config, frame_range=None):
+    """
+    (source, start, end, frame count) of the source frames a run covers,
+    with end None when it runs to the end. The source is already released.
+    """
+    source = open_source(input_path, config)
+    source.release()
+    if not source.seekable:
+        raise ValueError(f"Segmented and checkpointed runs need a seekable input, not {input_path}")
+    start, end = frame_range or (0, None)
+    start = start or 0
+    last = source.frame_count - 1 if end is None else min(end, source.frame_count - 1)
+    if last <= start:
+        raise ValueError(f"Frame range {start}-{end} of {input_path} has no frame pairs ({source.frame_count} frames)")
+    return source, start, last if end is not None else None, last - start + 1
+
+
+def segment_work_dir(output_path):
+    """Directory holding the segment videos and reports until they are stitched."""
+    return os.path.splitext(output_path)[0] + "_segments"
+
+
+def _run_segment(config, input_path, output_path, report_path, stage_rates, segment):
+    # Imported here so only the segment processes load the interpolation models
+    from src.pipeline.orchestrator import PipelineOrchestrator
+
+    PipelineOrchestrator(config).process_segment(input_path, output_path, report_path, stage_rates, segment)
+    return report_path
+
+
+def run_segmented(config, input_path, output_path, report_path, stage_rates, workers, frame_range=None):
+    """
+    Process one video (or its frame_range) as `workers` time ranges in
+    parallel processes, each with its own PipelineOrchestrator, then
+    concatenate the segment videos and merge their reports into one.
+    """
+    start_time = time.time()
+    source, start, end, total_frames = range_frames(input_path, config, frame_range)
+    segments = plan_segments(total_frames, workers, start, end)
+    work_dir = segment_work_dir(output_path)
+    os.makedirs(work_dir, exist_ok=True)
+    extension = os.path.splitext(output_path)[1] or ".mp4"
+    debug_dir = config['explanation'].get('debug_dir', 'debug_frames')
+
+    videos, reports, futures = [], [], []
+    logger.info(f"Processing {input_path} as {len(segments)} segments")
+    # spawn: every segment loads its own models; forked TensorFlow state is not safe to share
+    with ProcessPoolExecutor(len(segments), mp_context=multiprocessing.get_context("spawn")) as pool:
+        for segment in segments:
+            segment_config = copy.deepcopy(config)
+            # Debug frames are named by segment-local frame number until the merge renames them
+            segment_config['explanation']['debug_dir'] = os.path.join(debug_dir, f"segment_{segment.index}")
+            videos.append(os.path.join(work_dir, f"segment_{segment.index}{extension}"))
+            reports.append(os.path.join(work_dir, f"segment_{segment.index}.jsonl"))
+            futures.append(pool.submit(
+                _run_segment, segment_config, input_path, videos[-1], reports[-1], stage_rates, segment
+            ))
+        for future in futures:
+            future.result()
+
+    concat_videos(videos, input_path if source.has_audio else None, output_path, config, audio_offset=start / source.fps)
+    merge_segment_reports(reports, input_path, output_path, report_path, config, start_time, frame_range)
+    shutil.rmtree(work_dir, ignore_errors=True)
+
+
+def concat_videos(paths, audio_source, output_path, config, audio_offset=0.0):
+    """
+    Join segment videos with ffmpeg's concat demuxer (stream copy, so the
+    video is not re-encoded) and take the audio, if any, from audio_source,
+    starting audio_offset seconds in. Without ffmpeg the segments are
+    re-encoded with OpenCV and the audio is dropped.
+    """
+    list_path = os.path.join(os.path.dirname(paths[0]), "segments.txt")
+    with open(list_path, 'w') as f:
+        for path in paths:
+            f.write(f"file '{os.path.abspath(path)}'\n")
+    cmd = ["ffmpeg", "-y", "-f", "concat", "-safe", "0", "-i", list_path]
+    if audio_source is not None:
+        cmd += ["-ss", str(audio_offset), "-i", audio_source, "-map", "0:v:0", "-map", "1:a:0?", "-c:a", "aac", "-shortest"]
+    cmd += ["-c:v", "copy", output_path]
+    try:
+        subprocess.run(cmd, check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        return
+    except (OSError, subprocess.CalledProcessError) as e:
+        logger.warning(f"ffmpeg concat failed ({e}); re-encoding the segments with OpenCV, without audio")
+
+    writer = None
+    for path in paths:
+        cap = cv2.VideoCapture(path)
+        if writer is None:
+            size = (int(cap.get(cv2.CAP_PROP_FRAME_WIDTH)), int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT)))
+            writer = opencv_writer(output_path, cap.get(cv2.CAP_PROP_FPS), size, config['output']['video_codec'])
+        while True:
+            ret, frame = cap.read()
+            if not ret:
+                break
+            writer.write(frame)
+        cap.release()
+    if writer is not None:
+        writer.release()
+
+
+def merge_segment_reports(paths, input_path, output_path, report_path, config, start_time, frame_range=None):
+    """
+    Stream the per-segment reports, in segment order, into one report at
+    report_path (plus its shot index file and HTML). Frame numbers and shot
+    ids become global and each segment's debug frames are moved into the
+    debug directory under their global frame number. frame_range, when the
+    segments cover only part of the input, is recorded as in single runs.
+    """
+    readers = [ReportReader(path) for path in paths]
+    metadata = {key: value for key, value in readers[0].metadata.items() if key != "segment"}
+    metadata.update({
+        "input_file": input_path,
+        "output_file": output_path,
+        "processing_date": datetime.now().isoformat(),
+        "segments": len(paths),
+        "debug_dir": config['explanation'].get('debug_dir', 'debug_frames'),
+    })
+    if frame_range:
+        metadata["frame_range"] = {
+            "start_frame": readers[0].metadata["segment"]["start_frame"],
+            "end_frame": readers[-1].metadata["segment"]["end_frame"],
+        }
+    archive_path = metrics_archive_path(report_path) if config['output'].get('metrics_archive', True) else None
+    report = ReportWriter(report_path, metadata, archive_path)
+    debug_dir = config['explanation'].get('debug_dir', 'debug_frames')
+
+    stage_shots = [0] * len(readers[0].metadata["segment"]["stage_cuts"])
+    boundaries, similarities = [], []
+    total_frames = 0
+    for k, reader in enumerate(readers):
+        segment = reader.metadata["segment"]
+        segment_debug_dir = os.path.join(debug_dir, f"segment_{segment['index']}")
+        offset = report.count
+        for frame in reader.frames(tile_grids=archive_path is not None):
+            local = frame["frame_number"]
+            frame["frame_number"] = local + offset
+            # Shot 0 of a segment continues the previous segment's last shot
+            frame["shot"] += stage_shots[frame["stage"] - 1]
+            debug_path = os.path.join(segment_debug_dir, f"frame_{local}_xai.jpg")
+            if os.path.exists(debug_path):
+                os.replace(debug_path, os.path.join(debug_dir, f"frame_{frame['frame_number']}_xai.jpg"))
+            report.append(frame)
+            report.flush()
+        shutil.rmtree(segment_debug_dir, ignore_errors=True)
+
+        stage_shots = [total + cuts for total, cuts in zip(stage_shots, segment["stage_cuts"])]
+        boundaries.extend(reader.metadata["shot_boundaries"])
+        similarities.extend(segment["cut_similarities"])
+        report.summary["duplicate_fast_path_pairs"] += reader.summary["duplicate_fast_path_pairs"]
+        # The boundary frame is counted by both neighbours
+        total_frames += segment["end_frame"] - segment["start_frame"] + (1 if k == 0 else 0)
+
+    shots = ShotIndex(metadata["frame_rate_original"])
+    shots.num_frames = total_frames
+    shots.boundaries = boundaries
+    shots.cut_similarities = similarities
+    metadata["total_frames_processed"] = total_frames
+    metadata["shot_count"] = len(shots.shots())
+    metadata["shot_boundaries"] = boundaries
+    if config['detection'].get('shots', {}).get('save_index', True):
+        shots_path = os.path.splitext(report_path)[0] + "_shots.json"
+        shots.save(shots_path)
+        metadata["shot_index_file"] = shots_path
+    report.close(time.time() - start_time)
+
+    html_path = os.path.splitext(report_path)[0] + ".html"
+    try:
+        ReportGenerator(report_path).generate_html_report(html_path)
+    except Exception as e:
+        logger.error(f"Failed to generate HTML report: {e}")
@@ -0,0 +1,213 @@
+import glob
+import logging
+import os
+import re
+import sys
+from abc import ABC, abstractmethod
+
+import cv2
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg", ".bmp", ".tif", ".tiff", ".exr", ".webp")
+
+
+class FrameSource(ABC):
+    """
+    Sequential BGR frame reader with random access where the input allows
+    it. Subclasses set fps, width, height and frame_count (None when the
+    length is unknown until the end, as for pipes) and implement read().
+    """
+    has_audio = False
+    seekable = True
+
+    def __init__(self, path):
+        self.path = path
+        self.fps = None
+        self.width = None
+        self.height = None
+        self.frame_count = None
+        self.position = 0
+
+    @abstractmethod
+    def read(self):
+        """Next frame as (True, frame), or (False, None) at the end."""
+        pass
+
+    def seek(self, index):
+        """Position the source so the next read() returns frame `index`."""
+        while self.position < index:
+            ok, _ = self.read()
+            if not ok:
+                break
+
+    def frames(self, limit=None):
+        count = 0
+        while limit is None or count < limit:
+            ok, frame = self.read()
+            if not ok:
+                break
+            count += 1
+            yield frame
+
+    def release(self):
+        pass
+
+
+class VideoFileSource(FrameSource):
+    has_audio = True
+
+    def __init__(self, path):
+        super().__init__(path)
+        self.cap = cv2.VideoCapture(path)
+        if not self.cap.isOpened():
+            raise ValueError(f"Could not open video: {path}")
+        self.fps = self.cap.get(cv2.CAP_PROP_FPS)
+        self.width = int(self.cap.get(cv2.CAP_PROP_FRAME_WIDTH))
+        self.height = int(self.cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+        self.frame_count = int(self.cap.get(cv2.CAP_PROP_FRAME_COUNT))
+
+    def read(self):
+        ok, frame = self.cap.read()
+        if ok:
+            self.position += 1
+        return ok, frame
+
+    def seek(self, index):
+        if index == self.position:
+            return
+        # The FFmpeg backend seeks to the preceding keyframe and decodes forward
+        # to the requested frame; only the frames after the keyframe are decoded
+        self.cap.set(cv2.CAP_PROP_POS_FRAMES, index)
+        if int(self.cap.get(cv2.CAP_PROP_POS_FRAMES)) == index:
+            self.position = index
+            return
+        # Backends/containers that cannot seek: restart and skip forward
+        # with grab(), which decodes without converting the frames
+        logger.warning(f"Seek to frame {index} not supported for {self.path}; decoding forward")
+        self.cap.release()
+        self.cap = cv2.VideoCapture(self.path)
+        self.position = 0
+        while self.position < index and self.cap.grab():
+            self.position += 1
+
+    def release(self):
+        self.cap.release()
+
+
+class ImageSequenceSource(FrameSource):
+    """
+    Numbered images, given as a directory, a glob ("shots/*.png") or a
+    printf pattern ("shots/frame_%05d.png"), read in sorted order at `fps`.
+    """
+    def __init__(self, path, fps):
+        super().__init__(path)
+        if os.path.isdir(path):
+            files = [os.path.join(path, name) for name in os.listdir(path) if name.lower().endswith(IMAGE_EXTENSIONS)]
+        else:
+            files = glob.glob(re.sub(r"%0?\d*d", "*", path))
+        self.files = sorted(files, key=_natural_key)
+        if not self.files:
+            raise ValueError(f"No images found for: {path}")
+        if not fps:
+            raise ValueError("Image sequences need a frame rate (input.fps or --input-fps)")
+        first = cv2.imread(self.files[0])
+        if first is None:
+            raise ValueError(f"Could not read image: {self.files[0]}")
+        self.fps = float(fps)
+        self.height, self.width = first.shape[:2]
+        self.frame_count = len(self.files)
+
+    def read(self):
+        if self.position >= len(self.files):
+            return False, None
+        frame = cv2.imread(self.files[self.position])
+        if frame is None:
+            raise ValueError(f"Could not read image: {self.files[self.position]}")
+        self.position += 1
+        return True, frame
+
+    def seek(self, index):
+        self.position = min(index, len(self.files))
+
+
+class RawPipeSource(FrameSource):
+    """Raw bgr24 frames of a known size on a binary stream (stdin for "-")."""
+    seekable = False
+
+    def __init__(self, path, fps, size, stream=None):
+        super().__init__(path)
+        if not fps or not size:
+            raise ValueError("Raw pipe input needs a frame rate and size (input.fps/input.size or --input-fps/--input-size)")
+        self.stream = stream if stream is not None else sys.stdin.buffer
+        self.fps = float(fps)
+        self.width, self.height = size
+        self._frame_bytes = self.width * self.height * 3
+
+    def read(self):
+        data = self.stream.read(self._frame_bytes)
+        if len(data) < self._frame_bytes:
+            return False, None
+        self.position += 1
+        return True, np.frombuffer(data, dtype=np.uint8).reshape(self.height, self.width, 3).copy()
+
+
+def _natural_key(path):
+    return [int(part) if part.isdigit() else part for part in re.split(r"(\d+)", path)]
+
+
+def parse_size(value):
+    """'1920x1080' (or [1920, 1080]) -> (1920, 1080); None passes through."""
+    if value is None or isinstance(value, (list, tuple)):
+        return tuple(value) if value else None
+    width, height = str(value).lower().split("x")
+    return int(width), int(height)
+
+
+def is_image_sequence(path):
+    return os.path.isdir(path) or "*" in path or re.search(r"%0?\d*d", path) is not None or \
+        path.lower().endswith(IMAGE_EXTENSIONS)
+
+
+def input_exists(path):
+    if path == "-":
+        return True
+    if is_image_sequence(path) and not os.path.isdir(path):
+        return bool(glob.glob(re.sub(r"%0?\d*d", "*", path)))
+    return os.path.exists(path)
+
+
+def open_source(path, config):
+    """
+    FrameSource for an input path: "-" reads raw frames from stdin,
+    directories and image patterns are image sequences, anything else is a
+    video file. Frame rate and size for the first two come from config.yaml's
+    input section (main.py copies --input-fps/--input-size there).
+    """
+    input_cfg = config.get('input') or {}
+    if path == "-":
+        return RawPipeSource(path, input_cfg.get('fps'), parse_size(input_cfg.get('size')))
+    if is_image_sequence(path):
+        return ImageSequenceSource(path, input_cfg.get('fps'))
+    return VideoFileSource(path)
+
+
+def parse_position(value, fps):
+    """
+    Frame index for a --start/--end value: plain integers are frame numbers,
+    "12.5s" is seconds and "[hh:]mm:ss[.ms]" is a timecode. Negative
+    positions, in any form, raise ValueError.
+    """
+    value = str(value).strip()
+    if "-" in value:
+        raise ValueError(f"position must not be negative ({value})")
+    if value.endswith("s"):
+        seconds = float(value[:-1])
+    elif ":" in value:
+        seconds = 0.0
+        for part in value.split(":"):
+            seconds = seconds * 60 + float(part)
+    else:
+        return int(value)
+    return int(round(seconds * fps))
@@ -0,0 +1,137 @@
+import queue
+import threading
+from collections import deque
+from concurrent.futures import Future
+
+# End-of-stream marker passed through the queues
+_DONE = object()
+
+
+class _Failure:
+    def __init__(self, exception):
+        self.exception = exception
+
+
+class BackgroundIterator:
+    """
+    Runs an iterator (e.g. the decoder) on a daemon thread and hands its
+    items over through a bounded queue. The bound is the backpressure: the
+    producer blocks once the consumer is `maxsize` items behind. Exceptions
+    raised by the producer are re-raised in the consumer.
+    """
+    def __init__(self, iterable, maxsize=32, name=None):
+        self._queue = queue.Queue(maxsize=max(1, int(maxsize)))
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, args=(iter(iterable),), name=name, daemon=True)
+        self._thread.start()
+
+    def _put(self, item):
+        # Time out periodically so an abandoned consumer does not pin the thread
+        while not self._stop.is_set():
+            try:
+                self._queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _run(self, iterator):
+        try:
+            for item in iterator:
+                if not self._put(item):
+                    return
+        except Exception as e:
+            self._put(_Failure(e))
+            return
+        self._put(_DONE)
+
+    def __iter__(self):
+        try:
+            while True:
+                item = self._queue.get()
+                if item is _DONE:
+                    return
+                if isinstance(item, _Failure):
+                    raise item.exception
+                yield item
+        finally:
+            self._stop.set()
+
+
+class ThreadedWriter:
+    """
+    cv2.VideoWriter front-end that encodes on its own thread. write() only
+    enqueues (blocking when `maxsize` frames are waiting); release() drains
+    the queue before releasing the underlying writer.
+    """
+    def __init__(self, writer, maxsize=32, name=None):
+        self.writer = writer
+        self._queue = queue.Queue(maxsize=max(1, int(maxsize)))
+        self._error = None
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        while True:
+            frame = self._queue.get()
+            if frame is _DONE:
+                return
+            if self._error is None:
+                try:
+                    self.writer.write(frame)
+                except Exception as e:
+                    self._error = e
+
+    def write(self, frame):
+        if self._error is not None:
+            raise self._error
+        self._queue.put(frame)
+
+    def release(self):
+        self._queue.put(_DONE)
+        self._thread.join()
+        self.writer.release()
+        if self._error is not None:
+            raise self._error
+
+
+class OrderedExecutor:
+    """
+    Submits jobs to a shared executor and returns their results strictly in
+    submission order. At most `max_pending` jobs are in flight; past that,
+    ready() blocks on the oldest job, which throttles the submitting stage.
+    With no executor, jobs run inline at submission.
+    """
+    def __init__(self, executor=None, max_pending=16):
+        self.executor = executor
+        self.max_pending = max(1, int(max_pending))
+        self._pending = deque()
+
+    def submit(self, fn, *args):
+        if self.executor is not None:
+            self.add(self.executor.submit(fn, *args))
+            return
+        future = Future()
+        try:
+            future.set_result(fn(*args))
+        except Exception as e:
+            future.set_exception(e)
+        self.add(future)
+
+    def add(self, future, finish=None):
+        """Queue a future submitted elsewhere; finish(result) is applied when it is collected."""
+        self._pending.append((future, finish))
+
+    def _pop(self):
+        future, finish = self._pending.popleft()
+        result = future.result()
+        return finish(result) if finish is not None else result
+
+    def ready(self):
+        """Results of the finished jobs at the head of the queue, in order."""
+        while self._pending and (self._pending[0][0].done() or len(self._pending) > self.max_pending):
+            yield self._pop()
+
+    def drain(self):
+        while self._pending:
+            yield self._pop()
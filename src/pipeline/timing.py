@@ -0,0 +1,45 @@
+import math
+from fractions import Fraction
+
+
+def _as_fraction(fps):
+    # NTSC-style rates (29.97, 23.976) come back from OpenCV as floats
+    return Fraction(fps).limit_denominator(1001)
+
+
+class FrameRateConverter:
+    """
+    Maps output frames of a target frame rate onto source frame pairs.
+
+    Output frame k lands at source position k * source_fps / target_fps.
+    For the pair (i, i+1) the converter returns every timestep t in [0, 1)
+    that an output frame falls on; t == 0 is the source frame itself.
+    """
+    def __init__(self, source_fps, target_fps):
+        if source_fps <= 0 or target_fps <= 0:
+            raise ValueError(f"Frame rates must be positive (source={source_fps}, target={target_fps})")
+        self.source_fps = source_fps
+        self.target_fps = target_fps
+        # Source frames advanced per output frame
+        self.step = _as_fraction(source_fps) / _as_fraction(target_fps)
+
+    @classmethod
+    def from_factor(cls, source_fps, factor):
+        return cls(source_fps, source_fps * factor)
+
+    def _first_tick_at_or_after(self, position):
+        return math.ceil(Fraction(position) / self.step)
+
+    def timesteps(self, pair_index):
+        """Return the sorted timesteps of all output frames within a source pair."""
+        first = self._first_tick_at_or_after(pair_index)
+        stop = self._first_tick_at_or_after(pair_index + 1)
+        return [float(k * self.step - pair_index) for k in range(first, stop)]
+
+    def output_index(self, frame_index):
+        """Index of the first output frame at or after the given source frame."""
+        return self._first_tick_at_or_after(frame_index)
+
+    def includes_source_frame(self, frame_index):
+        """True if an output frame lands exactly on the given source frame."""
+        return (Fraction(frame_index) / self.step).denominator == 1
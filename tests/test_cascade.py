@@ -0,0 +1,78 @@
+import numpy as np
+
+from src.interpolation.engine import LinearInterpolator, OpticalFlowInterpolator, SmartInterpolator
+from tests.helpers import pipeline_config, run_pipeline, scene_frame, write_clip
+
+
+def cascade_config(engines=("flow", "linear"), escalate_severity=0.4):
+    return {
+        "interpolation": {
+            "engine": "flow",
+            "cascade": {"enabled": True, "engines": list(engines), "escalate_severity": escalate_severity},
+            "flow": {"method": "dis", "preset": "ultrafast"},
+        },
+        "detection": {},
+    }
+
+
+class Scorer:
+    """QA hook that fails the pairs listed in `bad` (by original index) on the flow engine."""
+    def __init__(self, bad=()):
+        self.bad = set(bad)
+        self.calls = []
+
+    def __call__(self, frame1, frame2, interpolated, time, original):
+        linear = np.array_equal(interpolated, LinearInterpolator().interpolate(frame1, frame2, time))
+        self.calls.append((original, "linear" if linear else "flow"))
+        severity = 0.9 if original in self.bad and not linear else 0.1
+        return {}, {"severity": severity}, None
+
+
+def rgb_pairs(count):
+    frames = [scene_frame(0, k)[..., ::-1].copy() for k in range(count + 1)]
+    return list(zip(frames, frames[1:]))
+
+
+def test_only_failing_pairs_escalate():
+    scorer = Scorer(bad=[1])
+    interpolator = SmartInterpolator(cascade_config(), scorer=scorer)
+    pairs = rgb_pairs(3)
+
+    results, infos = interpolator.interpolate_timesteps_with_info(pairs, [[0.5]] * 3, originals=[0, 1, 2])
+
+    assert [info[0]["engine"] for info in infos] == ["flow", "linear", "flow"]
+    assert [info[0]["escalations"] for info in infos] == [0, 1, 0]
+    # Each accepted frame carries the score it was accepted with
+    assert all(info[0]["qa"][1]["severity"] == 0.1 for info in infos)
+    assert sorted(scorer.calls) == [(0, "flow"), (1, "flow"), (1, "linear"), (2, "flow")]
+    np.testing.assert_array_equal(results[1][0], LinearInterpolator().interpolate(*pairs[1], 0.5))
+
+
+def test_last_engine_is_accepted_unconditionally():
+    interpolator = SmartInterpolator(cascade_config(escalate_severity=-1.0), scorer=Scorer())
+
+    _, infos = interpolator.interpolate_timesteps_with_info(rgb_pairs(2), [[0.25, 0.75]] * 2)
+
+    assert {(info["engine"], info["escalations"]) for pair in infos for info in pair} == {("linear", 1)}
+
+
+def test_cascade_setup():
+    interpolator = SmartInterpolator(cascade_config(("linear", "flow")), scorer=Scorer())
+    # linear before the last level can never be rejected by QA, so it is dropped
+    assert [engine.name for engine in interpolator.cascade] == ["flow"]
+    assert interpolator.engine_description == "cascade(flow)"
+
+    single = SmartInterpolator(cascade_config())
+    assert single.cascade == [] and isinstance(single.engine, OpticalFlowInterpolator)
+
+
+def test_pipeline_reports_escalations(tmp_path):
+    config = pipeline_config(tmp_path, engine="flow")
+    config["interpolation"]["cascade"].update(enabled=True, engines=["flow", "linear"], escalate_severity=-1.0)
+    clip = write_clip(tmp_path / "in.avi", [scene_frame(0, k) for k in range(6)])
+
+    report = run_pipeline(config, clip, tmp_path)
+
+    assert len(report) == 5
+    assert all(entry["engine"] == "linear" and entry["escalations"] == 1 for entry in report)
+    assert all(entry["qa"] == "measured" and entry["verdict"] == "PASS" for entry in report)
@@ -0,0 +1,87 @@
+import cv2
+import pytest
+
+from src.explanation.report_stream import ReportReader
+from src.pipeline.checkpoint import load_checkpoint, plan_chunks, run_checkpointed
+from src.pipeline.orchestrator import PipelineOrchestrator
+from src.pipeline.segments import Segment
+from tests.helpers import pipeline_config, run_pipeline, scene_frame, write_clip
+
+
+PROCESS_SEGMENT = PipelineOrchestrator.process_segment
+
+
+class Interrupted(Exception):
+    pass
+
+
+def test_chunks_cover_the_range():
+    assert plan_chunks(12, 4) == [Segment(0, 0, 4, False), Segment(1, 4, 8, False), Segment(2, 8, None, True)]
+    assert plan_chunks(9, 4, start=3, end=11) == [Segment(0, 3, 7, False), Segment(1, 7, 11, True)]
+
+
+def frame_count(path):
+    cap = cv2.VideoCapture(str(path))
+    count = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+    cap.release()
+    return count
+
+
+@pytest.fixture
+def clip(tmp_path):
+    frames = [scene_frame(0, k) for k in range(7)] + [scene_frame(1, k) for k in range(7, 14)]
+    return write_clip(tmp_path / "in.avi", frames)
+
+
+def count_segments(monkeypatch, fail_at=None):
+    """Record the chunks process_segment runs; raise Interrupted on chunk fail_at."""
+    calls = []
+
+    def recording(self, input_path, output_path, report_path, stage_rates, segment):
+        if segment.index == fail_at:
+            raise Interrupted()
+        calls.append(segment.index)
+        return PROCESS_SEGMENT(self, input_path, output_path, report_path, stage_rates, segment)
+
+    monkeypatch.setattr(PipelineOrchestrator, "process_segment", recording)
+    return calls
+
+
+def test_resume_matches_an_uninterrupted_run(tmp_path, clip, monkeypatch):
+    config = pipeline_config(tmp_path)
+    output, report = str(tmp_path / "out.avi"), str(tmp_path / "out.json")
+
+    calls = count_segments(monkeypatch, fail_at=2)
+    with pytest.raises(Interrupted):
+        run_checkpointed(config, clip, output, report, [(None, 2)], 4)
+    checkpoint = load_checkpoint(str(tmp_path / "out_segments" / "checkpoint.json"))
+    assert calls == [0, 1] and checkpoint["next_frame"] == 8 and checkpoint["report_frames"] == 8
+
+    calls = count_segments(monkeypatch)
+    run_checkpointed(config, clip, output, report, [(None, 2)], 4, resume=True)
+    assert calls == [2, 3]
+
+    reference = run_pipeline(config, clip, tmp_path, name="single")
+    resumed = ReportReader(report)
+    assert resumed.metadata["shot_boundaries"] == [7]
+    frames = list(resumed.frames())
+    assert len(frames) == len(reference) == 13
+    for entry, expected in zip(frames, reference):
+        metrics, expected_metrics = entry.pop("metrics"), expected.pop("metrics")
+        assert metrics == pytest.approx(expected_metrics)
+        assert entry == expected
+    assert frame_count(output) == frame_count(tmp_path / "single.avi") == 27
+    assert not (tmp_path / "out_segments").exists()
+
+
+def test_resume_checks_the_checkpoint(tmp_path, clip, monkeypatch):
+    config = pipeline_config(tmp_path)
+    output, report = str(tmp_path / "out.avi"), str(tmp_path / "out.json")
+    with pytest.raises(ValueError, match="No checkpoint"):
+        run_checkpointed(config, clip, output, report, [(None, 2)], 4, resume=True)
+
+    count_segments(monkeypatch, fail_at=1)
+    with pytest.raises(Interrupted):
+        run_checkpointed(config, clip, output, report, [(None, 2)], 4)
+    with pytest.raises(ValueError, match="different job"):
+        run_checkpointed(config, clip, output, report, [(None, 4)], 4, resume=True)
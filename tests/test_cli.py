@@ -0,0 +1,70 @@
+import cv2
+import numpy as np
+import pytest
+import yaml
+
+import main
+
+
+class RecordingOrchestrator:
+    """Stands in for PipelineOrchestrator; records what main() asked it to do."""
+    calls = []
+
+    def __init__(self, config):
+        self.config = config
+
+    def process_video(self, input_path, output_path, report_path, **kwargs):
+        self.calls.append((input_path, kwargs))
+
+
+@pytest.fixture
+def clip(tmp_path):
+    path = str(tmp_path / "clip.avi")
+    writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*"MJPG"), 10, (32, 24))
+    for k in range(10):
+        writer.write(np.full((24, 32, 3), 20 * k, dtype=np.uint8))
+    writer.release()
+    return path
+
+
+@pytest.fixture
+def run_main(monkeypatch, tmp_path):
+    RecordingOrchestrator.calls = []
+    monkeypatch.setattr(main, "PipelineOrchestrator", RecordingOrchestrator)
+
+    def run(*args, config=None):
+        config_path = tmp_path / "config.yaml"
+        with open("config.yaml") as f:
+            config_path.write_text(yaml.safe_dump(config if config is not None else yaml.safe_load(f)))
+        monkeypatch.setattr("sys.argv", ["main.py", *args, "-c", str(config_path),
+                                         "-o", str(tmp_path / "out.mp4"), "-r", str(tmp_path / "report.json")])
+        main.main()
+        return RecordingOrchestrator.calls
+
+    return run
+
+
+@pytest.mark.parametrize("option, value", [("--start", "-5"), ("--start", "-1.5s"), ("--end", "-00:01")])
+def test_negative_positions_are_rejected(run_main, clip, capsys, option, value):
+    with pytest.raises(SystemExit) as exit_info:
+        run_main(clip, f"{option}={value}")
+    assert exit_info.value.code == 2
+    assert f"{option}: position must not be negative" in capsys.readouterr().err
+
+
+def test_end_must_come_after_start(run_main, clip, capsys):
+    with pytest.raises(SystemExit):
+        run_main(clip, "--start", "5", "--end", "3")
+    assert "--end must come after --start" in capsys.readouterr().err
+
+
+def test_frame_range_reaches_the_pipeline(run_main, clip):
+    calls = run_main(clip, "--start", "0.2s", "--end", "7", "--factor", "2")
+    assert calls == [(clip, {"target_fps": None, "factor": 2, "frame_range": (2, 7)})]
+
+
+def test_config_without_pipeline_section(run_main, clip):
+    with open("config.yaml") as f:
+        config = yaml.safe_load(f)
+    del config["pipeline"]
+    assert len(run_main(clip, config=config)) == 1
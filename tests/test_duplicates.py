@@ -0,0 +1,17 @@
+from tests.helpers import pipeline_config, run_pipeline, scene_frame, write_clip
+
+
+def test_duplicate_after_a_failed_cut_gets_its_own_verdict(tmp_path):
+    # Source pair 4 is a scene cut, pair 5 a held (identical) frame right after it
+    frames = [scene_frame(0, k) for k in range(5)] + [scene_frame(1, 5)] * 2 + [scene_frame(1, k) for k in (7, 8)]
+    config = pipeline_config(tmp_path)
+    # Strict enough that the cut pair fails
+    config["explanation"]["scoring"].update(verdict_warning=0.2, verdict_fail=0.25)
+
+    report = run_pipeline(config, write_clip(tmp_path / "in.avi", frames), tmp_path)
+
+    cut, duplicate = report[4], report[5]
+    assert cut["engine"] == "scene_cut" and cut["verdict"] == "FAIL"
+    assert duplicate["engine"] == "duplicate" and duplicate["qa"] == "inferred"
+    assert duplicate["verdict"] == "PASS" and duplicate["severity_score"] == 0.0
+    assert duplicate["metrics"]["temporal_consistency"] == 1.0
@@ -0,0 +1,122 @@
+import shutil
+import wave
+
+import cv2
+import numpy as np
+import pytest
+
+from src.pipeline import encoder
+from src.pipeline.encoder import FFmpegWriter, opencv_writer
+
+requires_ffmpeg = pytest.mark.skipif(shutil.which("ffmpeg") is None, reason="ffmpeg not installed")
+
+
+class FakeStdin:
+    def __init__(self, broken=False):
+        self.broken = broken
+        self.written = 0
+
+    def write(self, data):
+        if self.broken:
+            raise BrokenPipeError()
+        self.written += len(data)
+
+
+class FakeProcess:
+    """Stands in for the ffmpeg subprocess; records its command line."""
+    def __init__(self, cmd, returncode=0, stderr=b"", broken=False):
+        self.cmd = cmd
+        self.stdin = FakeStdin(broken)
+        self.returncode = None
+        self._final = (returncode, stderr)
+
+    def communicate(self):
+        self.returncode, stderr = self._final
+        return b"", stderr
+
+
+def fake_ffmpeg(monkeypatch, **kwargs):
+    processes = []
+
+    def popen(cmd, **_):
+        processes.append(FakeProcess(cmd, **kwargs))
+        return processes[-1]
+
+    monkeypatch.setattr(encoder.subprocess, "Popen", popen)
+    return processes
+
+
+def frames(count, size=(64, 48)):
+    width, height = size
+    for k in range(count):
+        frame = np.zeros((height, width, 3), dtype=np.uint8)
+        frame[:, (2 * k) % width] = 255
+        yield frame
+
+
+def write_silence(path, seconds, rate=8000):
+    with wave.open(str(path), 'wb') as f:
+        f.setnchannels(1)
+        f.setsampwidth(2)
+        f.setframerate(rate)
+        f.writeframes(b"\0\0" * int(seconds * rate))
+
+
+def test_audio_is_capped_to_the_video_not_the_other_way_round(monkeypatch):
+    processes = fake_ffmpeg(monkeypatch)
+
+    writer = FFmpegWriter("out.mp4", 30, (64, 48), audio_source="in.mp4", audio_offset=2.0, audio_duration=4.0)
+    for frame in frames(3):
+        writer.write(frame)
+    writer.release()
+
+    cmd = processes[0].cmd
+    assert "-shortest" not in cmd
+    audio_input = cmd.index("in.mp4")
+    assert cmd[audio_input - 5:audio_input + 1] == ["-ss", "2.0", "-t", "4.0", "-i", "in.mp4"]
+    assert processes[0].stdin.written == 3 * 64 * 48 * 3
+
+
+def test_unknown_audio_duration_is_not_capped(monkeypatch):
+    processes = fake_ffmpeg(monkeypatch)
+    FFmpegWriter("out.mp4", 30, (64, 48), audio_source="in.mp4").release()
+    assert "-t" not in processes[0].cmd and "-shortest" not in processes[0].cmd
+
+
+def test_broken_pipe_raises_with_ffmpeg_stderr(monkeypatch):
+    fake_ffmpeg(monkeypatch, returncode=1, stderr=b"Unknown encoder 'libx999'", broken=True)
+    writer = FFmpegWriter("out.mp4", 30, (64, 48), {"codec": "libx999"})
+    with pytest.raises(RuntimeError, match="libx999"):
+        writer.write(next(frames(1)))
+
+
+@requires_ffmpeg
+def test_more_frames_than_the_audio_covers(tmp_path):
+    audio = tmp_path / "short.wav"
+    write_silence(audio, 0.5)
+    output = tmp_path / "out.mp4"
+
+    # 10 s of video over 0.5 s of audio (more than the pipe buffers)
+    writer = FFmpegWriter(str(output), 30, (64, 48), {"preset": "ultrafast"}, audio_source=str(audio),
+                          audio_duration=10.0)
+    for frame in frames(300):
+        writer.write(frame)
+    writer.release()
+
+    cap = cv2.VideoCapture(str(output))
+    assert int(cap.get(cv2.CAP_PROP_FRAME_COUNT)) == 300
+    cap.release()
+
+
+def test_opencv_writer_falls_back_to_a_working_codec(tmp_path):
+    path = tmp_path / "out.mp4"
+    # No OpenCV build encodes this fourcc
+    writer = opencv_writer(str(path), 10, (64, 48), "zzzz")
+    assert writer.isOpened()
+    for frame in frames(5):
+        writer.write(frame)
+    writer.release()
+
+    cap = cv2.VideoCapture(str(path))
+    assert int(cap.get(cv2.CAP_PROP_FRAME_COUNT)) == 5
+    cap.release()
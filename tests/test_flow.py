@@ -0,0 +1,92 @@
+import threading
+
+import cv2
+import numpy as np
+import pytest
+
+from src.detection import flow as flow_module
+from src.detection.flow import DISFlow, FarnebackFlow, PyramidFlow, create_flow_backend
+
+
+def shifted_texture(dx, dy, shape=(128, 160), seed=0):
+    """A smooth random texture and a copy translated by (dx, dy) pixels."""
+    rng = np.random.default_rng(seed)
+    texture = cv2.GaussianBlur(rng.uniform(0, 255, shape).astype(np.float32), (0, 0), 2)
+    texture = cv2.normalize(texture, None, 0, 255, cv2.NORM_MINMAX).astype(np.uint8)
+    return texture, np.roll(texture, (dy, dx), axis=(0, 1))
+
+
+def median_interior_flow(flow, margin=16):
+    interior = flow[margin:-margin, margin:-margin].reshape(-1, 2)
+    return np.median(interior, axis=0)
+
+
+@pytest.mark.parametrize("backend", [FarnebackFlow(), DISFlow({"preset": "medium"})], ids=["farneback", "dis"])
+@pytest.mark.parametrize("dx, dy", [(3, 0), (0, -2), (2, 3)])
+def test_recovers_integer_shift(backend, dx, dy):
+    gray1, gray2 = shifted_texture(dx, dy)
+
+    flow = backend.calc(gray1, gray2)
+
+    assert flow.shape == gray1.shape + (2,) and flow.dtype == np.float32
+    np.testing.assert_allclose(median_interior_flow(flow), [dx, dy], atol=0.25)
+
+
+def test_pyramid_recovers_a_large_shift():
+    gray1, gray2 = shifted_texture(8, 4, shape=(256, 320))
+
+    flow = PyramidFlow({"pyramid_levels": 2}).calc(gray1, gray2)
+
+    assert flow.shape == gray1.shape + (2,)
+    np.testing.assert_allclose(median_interior_flow(flow, margin=32), [8, 4], atol=1.0)
+
+
+@pytest.mark.parametrize("levels, factor", [(0, 1.0), (1, 2.0), (2, 4.0), (3, 8.0)])
+def test_pyramid_scales_vectors_by_the_downscale_factor(monkeypatch, levels, factor):
+    solved_shapes = []
+
+    def unit_flow(gray1, gray2, *args):
+        solved_shapes.append(gray1.shape)
+        return np.ones(gray1.shape + (2,), dtype=np.float32)
+
+    monkeypatch.setattr(flow_module.cv2, "calcOpticalFlowFarneback", unit_flow)
+    gray = np.zeros((96, 128), dtype=np.uint8)
+
+    flow = PyramidFlow({"pyramid_levels": levels}).calc(gray, gray)
+
+    assert solved_shapes == [(96 // 2 ** levels, 128 // 2 ** levels)]
+    assert flow.shape == (96, 128, 2)
+    np.testing.assert_allclose(flow, factor)
+
+
+def test_dis_keeps_one_solver_per_thread():
+    backend = DISFlow()
+    gray1, gray2 = shifted_texture(2, 1)
+    solvers, results = {}, {}
+
+    def run(name):
+        results[name] = backend.calc(gray1, gray2)
+        solvers[name] = backend._local.dis
+
+    threads = [threading.Thread(target=run, args=(name,)) for name in ("a", "b")]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert solvers["a"] is not solvers["b"]
+    np.testing.assert_array_equal(results["a"], results["b"])
+
+
+def test_create_flow_backend_picks_method_and_settings():
+    assert isinstance(create_flow_backend(), FarnebackFlow)
+    assert isinstance(create_flow_backend({}, default_method="dis"), DISFlow)
+    backend = create_flow_backend({"method": "pyramid", "pyramid_levels": 3})
+    assert isinstance(backend, PyramidFlow) and backend.describe() == "pyramid-3"
+    assert create_flow_backend({"method": "dis", "preset": "ultrafast"}).describe() == "dis-ultrafast"
+
+
+@pytest.mark.parametrize("flow_config", [{"method": "horn-schunck"}, {"method": "dis", "preset": "slow"}])
+def test_create_flow_backend_rejects_unknown_names(flow_config):
+    with pytest.raises(ValueError):
+        create_flow_backend(flow_config)
@@ -0,0 +1,48 @@
+import os
+
+import numpy as np
+
+from src.explanation.metrics_archive import TILE_KEYS, MetricsArchive
+from src.explanation.report_stream import ReportReader, ReportWriter, tile_grids_path
+from tests.helpers import METADATA, make_entry, score, tile_grids
+
+
+def test_tile_grids_round_trip_at_full_precision(tmp_path):
+    path = tmp_path / "report.jsonl"
+    archive_path = tmp_path / "metrics.npz"
+    grids = [tile_grids(0), None, tile_grids(2)]
+    writer = ReportWriter(str(path), METADATA, archive_path=str(archive_path), keep_tile_grids=True)
+    for k, frame_grids in enumerate(grids):
+        entry = score(make_entry(k), 0.1)
+        entry["tile_grids"] = frame_grids
+        writer.append(entry)
+    writer.close()
+
+    # The grids stay out of the report itself
+    assert all("tile_grids" not in frame for frame in ReportReader(str(path)).frames())
+    assert os.path.exists(tile_grids_path(str(path)))
+
+    for frame, expected in zip(ReportReader(str(path)).frames(tile_grids=True), grids):
+        if expected is None:
+            assert frame["tile_grids"] is None
+        else:
+            for key in TILE_KEYS:
+                np.testing.assert_array_equal(frame["tile_grids"][key], expected[key])
+
+    archive = MetricsArchive(str(archive_path))
+    assert archive.tiles(1) is None
+    for key in TILE_KEYS:
+        np.testing.assert_array_equal(archive.tiles(2)[key], grids[2][key])
+    assert archive.frame(0)["explanation"] == ["Frame 0 looks fine."]
+
+
+def test_tile_sidecar_is_removed_after_archiving(tmp_path):
+    path = tmp_path / "report.jsonl"
+    writer = ReportWriter(str(path), METADATA, archive_path=str(tmp_path / "metrics.npz"))
+    entry = score(make_entry(0), 0.1)
+    entry["tile_grids"] = tile_grids(0)
+    writer.append(entry)
+    writer.close()
+
+    assert not os.path.exists(tile_grids_path(str(path)))
+    assert MetricsArchive(str(tmp_path / "metrics.npz")).has_tiles(0)
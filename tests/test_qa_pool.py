@@ -0,0 +1,61 @@
+import numpy as np
+import pytest
+
+from src.interpolation.engine import LinearInterpolator
+from src.pipeline.qa_pool import ProcessQAPool, QAScorer, SharedFrameStore
+from tests.helpers import pipeline_config, run_pipeline, scene_frame, write_clip
+
+
+def test_shared_store_counts_references_per_key():
+    store = SharedFrameStore((4, 4, 3), 2)
+    try:
+        frame = np.full((4, 4, 3), 7, dtype=np.uint8)
+        slot = store.acquire("a", frame)
+        assert store.acquire("a", frame) == slot
+        other = store.acquire("b", frame + 1)
+        np.testing.assert_array_equal(store.frames[other], frame + 1)
+
+        # Full, or not a frame of the store's shape: the caller sends the array itself
+        assert store.acquire("c", frame) is None
+        assert store.acquire("d", np.zeros((2, 2, 3), dtype=np.uint8)) is None
+
+        store.release([slot])
+        assert store.acquire("c", frame) is None
+        store.release([slot])
+        assert store.acquire("c", frame) == slot
+    finally:
+        store.close()
+
+
+@pytest.mark.parametrize("slots", [8, 1], ids=["shared", "pickled"])
+def test_process_pool_scores_like_the_pipeline(tmp_path, slots):
+    config = pipeline_config(tmp_path)
+    prev, next = scene_frame(0, 2), scene_frame(0, 3)
+    frames = [(t, LinearInterpolator().interpolate(prev, next, t), k) for k, t in enumerate((0.25, 0.5, 0.75))]
+    expected = QAScorer(config).score(prev, next, [(t, f, None, k) for t, f, k in frames], ((0, 2), (0, 3)))
+
+    pool = ProcessQAPool(config, 1, prev.shape, slots)
+    try:
+        results = pool.submit(prev, next, frames, ((0, 2), (0, 3))).result()
+    finally:
+        pool.shutdown()
+
+    for (metrics, explanation, tiles, _), (ref_metrics, ref_explanation, ref_tiles, _) in zip(results, expected):
+        assert metrics == pytest.approx(ref_metrics)
+        assert explanation["verdict"] == ref_explanation["verdict"]
+        assert tiles == ref_tiles
+
+
+def test_pipeline_with_process_pool_matches_serial_run(tmp_path):
+    clip = write_clip(tmp_path / "in.avi", [scene_frame(0, k) for k in range(8)] + [scene_frame(1, k) for k in range(8, 12)])
+    config = pipeline_config(tmp_path)
+    config["pipeline"].update(threaded=True, qa_workers=2, qa_executor="process", qa_queue=2)
+
+    pooled = run_pipeline(config, clip, tmp_path, name="pooled", factor=4)
+    serial = run_pipeline(pipeline_config(tmp_path), clip, tmp_path, name="serial", factor=4)
+
+    assert len(pooled) == len(serial) == 33
+    for entry, reference in zip(pooled, serial):
+        metrics, ref_metrics = entry.pop("metrics"), reference.pop("metrics")
+        assert metrics == pytest.approx(ref_metrics)
+        assert entry == reference
@@ -0,0 +1,79 @@
+import json
+import os
+
+import pytest
+
+from src.explanation.metrics_archive import MetricsArchive
+from src.explanation.report_stream import ReportReader, ReportWriter
+from tests.helpers import METADATA, make_entry, score
+
+
+def write_report(path, **kwargs):
+    writer = ReportWriter(str(path), METADATA, **kwargs)
+    entries = [make_entry(k, engine="linear" if k == 3 else "flow") for k in range(4)]
+    for entry in entries:
+        writer.append(entry)
+    # QA completes out of order; frames are written in output order
+    score(entries[1], 0.4, "WARNING")
+    writer.flush()
+    assert writer.written == 0
+    score(entries[0], 0.1)
+    score(entries[2], 0.2, qa="inferred")
+    writer.flush()
+    assert writer.written == 3
+    score(entries[3], 0.3)
+    writer.close(processing_time=1.5)
+    return entries
+
+
+@pytest.mark.parametrize("name", ["report.jsonl", "report.json"])
+def test_round_trip(tmp_path, name):
+    path = tmp_path / name
+    entries = write_report(path)
+
+    reader = ReportReader(str(path))
+    assert reader.metadata == METADATA
+    assert list(reader.frames()) == entries
+    assert reader.frame(2) == entries[2]
+    assert reader.summary["verdict_distribution"] == {"PASS": 3, "WARNING": 1, "FAIL": 0}
+    assert reader.summary["engine_distribution"] == {"flow": 3, "linear": 1}
+    assert reader.summary["qa_measured_frames"] == 3 and reader.summary["qa_inferred_frames"] == 1
+    assert reader.summary["average_severity"] == pytest.approx(0.25)
+    assert reader.summary["processing_time_seconds"] == 1.5
+    # Only the requested report is left behind
+    assert os.listdir(tmp_path) == [name]
+
+
+def test_json_report_is_one_document(tmp_path):
+    path = tmp_path / "report.json"
+    entries = write_report(path)
+    with open(path) as f:
+        data = json.load(f)
+    assert data["frames"] == entries
+    assert set(data) == {"metadata", "summary", "frames"}
+
+
+def test_report_in_progress_has_no_summary(tmp_path):
+    path = tmp_path / "report.jsonl"
+    writer = ReportWriter(str(path), METADATA)
+    entry = score(make_entry(0), 0.1)
+    writer.append(entry)
+    writer.flush()
+
+    reader = ReportReader(str(path))
+    assert reader.summary is None
+    assert reader.metadata == METADATA
+    assert list(reader.frames()) == [entry]
+    writer.close()
+
+
+def test_unscored_entries_are_left_out(tmp_path):
+    path = tmp_path / "report.jsonl"
+    writer = ReportWriter(str(path), METADATA, archive_path=str(tmp_path / "metrics.npz"))
+    scored = score(make_entry(0), 0.1)
+    writer.append(scored)
+    writer.append(make_entry(1))
+    writer.close()
+
+    assert list(ReportReader(str(path)).frames()) == [scored]
+    assert len(MetricsArchive(str(tmp_path / "metrics.npz"))) == 1
@@ -0,0 +1,75 @@
+import itertools
+
+import pytest
+
+from src.pipeline.sampling import AdaptiveQASampler
+from tests.helpers import pipeline_config, run_pipeline, scene_frame, write_clip
+
+
+def sampler(**sampling):
+    return AdaptiveQASampler({"detection": {"sampling": {"enabled": True, **sampling}}})
+
+
+def measured_entry(severity, motion=1.0, consistency=0.9):
+    return {"severity_score": severity,
+            "metrics": {"motion_complexity": motion, "temporal_consistency": consistency}}
+
+
+def test_disabled_sampler_measures_every_pair():
+    assert all(AdaptiveQASampler({}).should_measure(k) for k in range(25))
+
+
+def test_samples_every_interval_and_densifies():
+    qa = sampler(interval=5, densify_radius=3)
+    assert [k for k in range(12) if qa.should_measure(k)] == [0, 5, 10]
+
+    qa.densify(5)
+    assert [k for k in range(5, 12) if qa.should_measure(k)] == [5, 6, 7, 8, 10]
+
+
+def test_threshold_on_severity_or_motion():
+    qa = sampler(severity_threshold=0.4, motion_threshold=5.0)
+    assert not qa.crosses_threshold(measured_entry(0.2, motion=1.0))
+    assert qa.crosses_threshold(measured_entry(0.4, motion=1.0))
+    assert qa.crosses_threshold(measured_entry(0.0, motion=6.0))
+
+
+def test_inferred_metrics_interpolate_between_samples():
+    qa = sampler()
+    qa.last_measured = measured_entry(0.0, motion=1.0, consistency=0.9)
+    after = measured_entry(0.0, motion=4.0, consistency=0.6)
+
+    inferred = [qa.inferred_metrics(k, 2, after) for k in range(2)]
+
+    assert [m["motion_complexity"] for m in inferred] == pytest.approx([2.0, 3.0])
+    assert [m["temporal_consistency"] for m in inferred] == pytest.approx([0.8, 0.7])
+    # At the end of the stream the last sample is carried forward
+    assert qa.inferred_metrics(0, 1) == qa.last_measured["metrics"]
+
+
+@pytest.fixture
+def burst_clip(tmp_path):
+    # Slow pan, with fast motion on source pairs 15-17
+    steps = [1] * 15 + [6] * 3 + [1] * 7
+    positions = [0] + list(itertools.accumulate(steps))
+    return write_clip(tmp_path / "in.avi", [scene_frame(0, k, size=(320, 96)) for k in positions])
+
+
+def test_pipeline_measures_around_a_flagged_sample(tmp_path, burst_clip):
+    config = pipeline_config(tmp_path)
+    config["detection"]["sampling"].update(enabled=True, interval=5, densify_radius=2, motion_threshold=0.5)
+
+    report = run_pipeline(config, burst_clip, tmp_path, name="sampled")
+    full = run_pipeline(pipeline_config(tmp_path), burst_clip, tmp_path, name="full")
+
+    measured = [entry["source_frame"] for entry in report if entry["qa"] == "measured"]
+    # Samples 0, 5, 10, 15, 20; the flagged sample 15 re-measures the gap behind it
+    # (11-14), and 16-17 (flagged too) keep densifying up to pair 19
+    assert measured == [0, 5, 10] + list(range(11, 21))
+    for entry, reference in zip(report, full):
+        assert entry["frame_number"] == reference["frame_number"]
+        if entry["qa"] == "measured":
+            assert entry["metrics"] == pytest.approx(reference["metrics"])
+        else:
+            assert entry["verdict"] in ("PASS", "WARNING", "FAIL")
+            assert entry["metrics"]["motion_complexity"] == pytest.approx(reference["metrics"]["motion_complexity"], abs=0.1)
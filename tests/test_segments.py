@@ -0,0 +1,53 @@
+import cv2
+import pytest
+
+from src.explanation.report_stream import ReportReader
+from src.pipeline.segments import Segment, plan_segments, run_segmented
+from tests.helpers import pipeline_config, run_pipeline, scene_frame, write_clip
+
+
+def test_segments_share_their_boundary_frame():
+    assert plan_segments(11, 2) == [Segment(0, 0, 5, False), Segment(1, 5, None, True)]
+    assert plan_segments(101, 4, start=20, end=120) == [
+        Segment(0, 20, 45, False), Segment(1, 45, 70, False), Segment(2, 70, 95, False), Segment(3, 95, 120, True)
+    ]
+    # Every segment keeps at least two pairs
+    assert len(plan_segments(5, 8)) == 2
+
+
+def frame_count(path):
+    cap = cv2.VideoCapture(str(path))
+    count = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+    cap.release()
+    return count
+
+
+def assert_same_frames(report, reference):
+    assert len(report) == len(reference)
+    for entry, expected in zip(report, reference):
+        metrics, expected_metrics = entry.pop("metrics"), expected.pop("metrics")
+        assert metrics == pytest.approx(expected_metrics)
+        assert entry == expected
+
+
+@pytest.mark.parametrize("frame_range", [None, (2, 13)])
+def test_two_workers_match_a_single_run(tmp_path, frame_range):
+    # A cut in each half, so shot ids have to continue across the segment boundary
+    frames = ([scene_frame(0, k) for k in range(4)] + [scene_frame(1, k) for k in range(4, 10)]
+              + [scene_frame(0, k) for k in range(10, 16)])
+    clip = write_clip(tmp_path / "in.avi", frames)
+    config = pipeline_config(tmp_path)
+
+    reference = run_pipeline(config, clip, tmp_path, name="single", frame_range=frame_range)
+    run_segmented(config, clip, str(tmp_path / "parallel.avi"), str(tmp_path / "parallel.json"), [(None, 2)], 2,
+                  frame_range=frame_range)
+
+    merged = ReportReader(str(tmp_path / "parallel.json"))
+    single = ReportReader(str(tmp_path / "single.json"))
+    assert merged.metadata["segments"] == 2
+    assert merged.metadata["shot_boundaries"] == single.metadata["shot_boundaries"] == [4, 10]
+    assert merged.metadata["total_frames_processed"] == single.metadata["total_frames_processed"]
+    assert merged.summary["verdict_distribution"] == single.summary["verdict_distribution"]
+    assert_same_frames(list(merged.frames()), reference)
+    assert frame_count(tmp_path / "parallel.avi") == frame_count(tmp_path / "single.avi")
+    assert not (tmp_path / "parallel_segments").exists()
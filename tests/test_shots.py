@@ -0,0 +1,93 @@
+import cv2
+import numpy as np
+import pytest
+
+from src.detection.shots import ShotBoundaryDetector, ShotIndex
+
+
+def scene_frame(scene, k, size=(640, 360)):
+    """Frame k of one of two colour scenes; a small square moves across it."""
+    width, height = size
+    background = [(40, 120, 200), (200, 60, 30)][scene]
+    frame = np.empty((height, width, 3), dtype=np.uint8)
+    frame[:] = background
+    frame[height // 2:, :] = (background[0] // 2, background[1] // 2, background[2] // 2)
+    x = 20 + 12 * k
+    frame[100:140, x:x + 40] = (255, 255, 255)
+    return frame
+
+
+def detector(signature_width=None):
+    shots = {} if signature_width is None else {"signature_width": signature_width}
+    return ShotBoundaryDetector({"detection": {"shots": shots}})
+
+
+@pytest.fixture
+def two_scenes():
+    # A cut between frames 5 and 6
+    return [scene_frame(0, k) for k in range(6)] + [scene_frame(1, k) for k in range(6, 10)]
+
+
+def test_compact_signature_keeps_the_cut_decisions(two_scenes):
+    full, compact = detector(0), detector()
+    assert compact.signature_width == 320
+    for prev, nxt in zip(two_scenes, two_scenes[1:]):
+        is_cut, similarity = compact.compare(compact.signature(prev), compact.signature(nxt))
+        full_cut, full_similarity = full.compare(full.signature(prev), full.signature(nxt))
+        assert is_cut == full_cut
+        assert similarity == pytest.approx(full_similarity, abs=0.03)
+
+
+def test_downscale_is_an_exact_integer_reduction():
+    # Uniform 6x6 blocks survive any reduction by 2 or 3 unchanged, so the
+    # histogram must match the full-resolution one exactly
+    rng = np.random.default_rng(0)
+    blocks = rng.integers(0, 256, (60, 107, 3), dtype=np.uint8)
+    frame = np.repeat(np.repeat(blocks, 6, axis=0), 6, axis=1)   # 360x642
+    for width in (321, 214):  # factors 2 and 3
+        np.testing.assert_array_equal(detector(width).signature(frame), detector(0).signature(frame))
+
+
+def test_signature_of_rgb_frames_matches_bgr():
+    frame = scene_frame(0, 3)
+    shots = detector()
+    np.testing.assert_array_equal(shots.signature(frame[..., ::-1].copy(), is_rgb=True), shots.signature(frame))
+
+
+def test_scan_video_file(tmp_path, two_scenes):
+    path = str(tmp_path / "clip.avi")
+    writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*"MJPG"), 12, (640, 360))
+    for frame in two_scenes:
+        writer.write(frame)
+    writer.release()
+
+    index = detector().scan(path)
+
+    assert index.fps == 12 and index.num_frames == 10
+    assert index.boundaries == [6]
+
+
+def test_scan_image_sequence(tmp_path, two_scenes):
+    for k, frame in enumerate(two_scenes):
+        cv2.imwrite(str(tmp_path / f"frame_{k:03d}.png"), frame)
+
+    shots = ShotBoundaryDetector({"input": {"fps": 24}, "detection": {}})
+    index = shots.scan(str(tmp_path / "frame_%03d.png"))
+
+    assert index.fps == 24 and index.shots() == [(0, 6), (6, 10)]
+
+
+def test_shot_index_lookup_and_round_trip(tmp_path):
+    index = ShotIndex(10)
+    for pair in range(9):
+        index.add_pair(pair, pair in (2, 6), 0.1 if pair in (2, 6) else 0.99)
+
+    assert index.boundaries == [3, 7] and index.num_frames == 10
+    assert [index.is_cut(pair) for pair in range(9)] == [pair in (2, 6) for pair in range(9)]
+    assert [index.shot_of(frame) for frame in (0, 2, 3, 6, 7, 9)] == [0, 0, 1, 1, 2, 2]
+    assert index.shots() == [(0, 3), (3, 7), (7, 10)]
+
+    path = str(tmp_path / "shots.json")
+    index.save(path)
+    loaded = ShotIndex.load(path)
+    assert loaded.to_dict() == index.to_dict()
@@ -0,0 +1,103 @@
+import io
+
+import cv2
+import numpy as np
+import pytest
+
+from src.pipeline.sources import (FrameSource, ImageSequenceSource, RawPipeSource, VideoFileSource, open_source,
+                                  parse_position, parse_size)
+
+
+def numbered_frame(k, size=(32, 24)):
+    width, height = size
+    return np.full((height, width, 3), 10 * k, dtype=np.uint8)
+
+
+@pytest.fixture
+def image_dir(tmp_path):
+    # frame_10 must sort after frame_9
+    for k in (1, 2, 9, 10):
+        cv2.imwrite(str(tmp_path / f"frame_{k}.png"), numbered_frame(k))
+    return tmp_path
+
+
+def test_frame_source_is_abstract():
+    with pytest.raises(TypeError):
+        FrameSource("x")
+
+
+def test_image_sequence_reads_in_natural_order(image_dir):
+    source = ImageSequenceSource(str(image_dir), 24)
+    assert (source.fps, source.width, source.height, source.frame_count) == (24.0, 32, 24, 4)
+    assert [int(frame[0, 0, 0]) for frame in source.frames()] == [10, 20, 90, 100]
+    assert source.position == 4
+
+
+def test_image_sequence_patterns_and_seek(image_dir):
+    for pattern in (str(image_dir / "frame_%d.png"), str(image_dir / "*.png")):
+        source = ImageSequenceSource(pattern, 24)
+        source.seek(2)
+        assert [int(frame[0, 0, 0]) for frame in source.frames(limit=5)] == [90, 100]
+
+
+def test_image_sequence_needs_a_frame_rate(image_dir):
+    with pytest.raises(ValueError):
+        ImageSequenceSource(str(image_dir), None)
+
+
+def test_raw_pipe_reads_whole_frames_only():
+    frames = [numbered_frame(k) for k in range(3)]
+    # A truncated trailing frame is not returned
+    stream = io.BytesIO(b"".join(frame.tobytes() for frame in frames) + b"\0" * 10)
+    source = RawPipeSource("-", 30, (32, 24), stream=stream)
+
+    read = list(source.frames())
+
+    assert not source.seekable and source.frame_count is None
+    assert len(read) == 3 and source.position == 3
+    for frame, expected in zip(read, frames):
+        np.testing.assert_array_equal(frame, expected)
+
+
+def test_raw_pipe_needs_rate_and_size():
+    with pytest.raises(ValueError):
+        RawPipeSource("-", 30, None, stream=io.BytesIO())
+
+
+def test_video_file_seek(tmp_path):
+    path = str(tmp_path / "clip.avi")
+    writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*"MJPG"), 10, (32, 24))
+    for k in range(6):
+        writer.write(numbered_frame(k))
+    writer.release()
+
+    source = open_source(path, {})
+    assert isinstance(source, VideoFileSource) and source.frame_count == 6
+    source.seek(4)
+    values = [int(frame[..., 0].mean().round()) for frame in source.frames()]
+    source.release()
+    assert values == pytest.approx([40, 50], abs=2)
+
+
+def test_open_source_picks_the_reader(image_dir):
+    config = {"input": {"fps": 12, "size": "32x24"}}
+    assert isinstance(open_source(str(image_dir), config), ImageSequenceSource)
+    assert isinstance(open_source("-", config), RawPipeSource)
+
+
+@pytest.mark.parametrize("value, expected", [("1920x1080", (1920, 1080)), ([640, 360], (640, 360)), (None, None)])
+def test_parse_size(value, expected):
+    assert parse_size(value) == expected
+
+
+@pytest.mark.parametrize("value, expected", [
+    ("120", 120), (48, 48), ("2s", 50), ("1.5s", 38), ("00:02", 50), ("0:01:00.5", 1512),
+])
+def test_parse_position(value, expected):
+    assert parse_position(value, 25) == expected
+
+
+@pytest.mark.parametrize("value", ["-1", -3, "-2.5s", "-00:01", "00:-01", "1:-30"])
+def test_parse_position_rejects_negative_positions(value):
+    with pytest.raises(ValueError, match="negative"):
+        parse_position(value, 25)
@@ -0,0 +1,66 @@
+import cv2
+import numpy as np
+import pytest
+from skimage.metrics import structural_similarity
+
+from src.detection.ssim import MAX_CHANNELS, ssim
+
+
+def textured_pair(seed, shape=(72, 96)):
+    """A smooth random image and a blurred, noisy, shifted copy of it."""
+    rng = np.random.default_rng(seed)
+    img = cv2.GaussianBlur(rng.uniform(0, 255, shape).astype(np.float32), (0, 0), 3)
+    img = cv2.normalize(img, None, 0, 255, cv2.NORM_MINMAX).astype(np.uint8)
+    other = np.roll(cv2.GaussianBlur(img, (5, 5), 1), 2, axis=1).astype(np.int16)
+    other = np.clip(other + rng.integers(-12, 13, shape), 0, 255).astype(np.uint8)
+    return img, other
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_box_window_matches_skimage(seed):
+    img1, img2 = textured_pair(seed)
+    expected, expected_map = structural_similarity(img1, img2, data_range=255, full=True)
+
+    score, ssim_map = ssim(img1, img2, full=True)
+
+    assert score == pytest.approx(expected, abs=1e-6)
+    # The map is float32 here, float64 in skimage
+    np.testing.assert_allclose(ssim_map, expected_map, atol=1e-4)
+
+
+def test_identical_frames_score_one():
+    img, _ = textured_pair(3)
+    assert ssim(img, img) == pytest.approx(1.0)
+
+
+def test_stack_matches_frame_by_frame():
+    pairs = [textured_pair(seed) for seed in range(4)]
+    stack1 = np.stack([a for a, _ in pairs])
+    stack2 = np.stack([b for _, b in pairs])
+
+    scores, maps = ssim(stack1, stack2, full=True)
+
+    assert scores.shape == (4,) and maps.shape == stack1.shape
+    for k, (a, b) in enumerate(pairs):
+        score, ssim_map = ssim(a, b, full=True)
+        assert scores[k] == pytest.approx(score, abs=1e-9)
+        np.testing.assert_allclose(maps[k], ssim_map, atol=1e-6)
+
+
+def test_stack_of_one_keeps_its_frame_axis():
+    img1, img2 = textured_pair(4)
+    scores, maps = ssim(img1[None], img2[None], full=True)
+    assert scores.shape == (1,) and maps.shape == (1,) + img1.shape
+    assert scores[0] == pytest.approx(ssim(img1, img2), abs=1e-9)
+
+
+def test_stacks_beyond_the_channel_limit_are_split():
+    img1, img2 = textured_pair(5, shape=(16, 16))
+    count = MAX_CHANNELS + 3
+    stack1 = np.repeat(img1[None], count, axis=0)
+    stack2 = np.repeat(img2[None], count, axis=0)
+
+    scores = ssim(stack1, stack2)
+
+    assert scores.shape == (count,)
+    np.testing.assert_allclose(scores, ssim(img1, img2), atol=1e-9)
@@ -0,0 +1,58 @@
+import numpy as np
+import pytest
+
+from src.detection.tiles import encode_tiles, tile_bounds, tile_means, tile_sums
+
+
+def naive_tile_sums(array, rows, cols):
+    ys = tile_bounds(array.shape[0], rows)
+    xs = tile_bounds(array.shape[1], cols)
+    return np.array([
+        [array[ys[r]:ys[r + 1], xs[c]:xs[c + 1]].astype(np.float64).sum() for c in range(cols)]
+        for r in range(rows)
+    ])
+
+
+@pytest.mark.parametrize("shape, rows, cols", [
+    ((48, 64), 4, 4),
+    ((37, 53), 5, 7),      # tiles of unequal size
+    ((30, 40, 3), 3, 4),   # colour: channels are summed
+])
+def test_tile_sums_match_naive_sums_exactly(shape, rows, cols):
+    array = np.random.default_rng(0).integers(0, 256, shape).astype(np.uint8)
+
+    sums = tile_sums(array, rows, cols)
+
+    np.testing.assert_array_equal(sums, naive_tile_sums(array, rows, cols))
+    assert sums.sum() == array.astype(np.int64).sum()
+
+
+def test_tile_bounds_cover_the_frame():
+    bounds = tile_bounds(37, 5)
+    assert bounds[0] == 0 and bounds[-1] == 37
+    assert np.all(np.diff(bounds) > 0)
+
+
+def test_tile_means_of_float_map():
+    values = np.random.default_rng(1).random((37, 53)).astype(np.float32)
+
+    means = tile_means(values, 5, 7)
+
+    ys, xs = tile_bounds(37, 5), tile_bounds(53, 7)
+    expected = np.array([[values[ys[r]:ys[r + 1], xs[c]:xs[c + 1]].mean() for c in range(7)] for r in range(5)])
+    assert means.dtype == np.float32
+    np.testing.assert_allclose(means, expected, rtol=1e-5)
+
+
+def test_tile_means_of_colour_frame_average_over_channels():
+    frame = np.zeros((20, 20, 3), dtype=np.uint8)
+    frame[:10, :10] = (30, 60, 90)
+    means = tile_means(frame, 2, 2)
+    np.testing.assert_allclose(means, [[60.0, 0.0], [0.0, 0.0]])
+
+
+def test_encode_tiles_records_grid_size():
+    tiles = {"motion": np.full((3, 4), 1.5, dtype=np.float32), "ssim": np.ones((3, 4), dtype=np.float32)}
+    encoded = encode_tiles(tiles)
+    assert encoded["rows"] == 3 and encoded["cols"] == 4
+    assert set(encoded) == {"rows", "cols", "motion", "ssim"}
@@ -0,0 +1,100 @@
+import logging
+
+import numpy as np
+import pytest
+
+from src.interpolation.engine import FILMInterpolator, LinearInterpolator
+from src.interpolation.tiling import TilePlan, auto_tile_size
+
+
+class BlendFILM(FILMInterpolator):
+    """FILM's batching and tiling around a per-pixel linear blend instead of the model."""
+    def __init__(self, tiling, batch_size=1):
+        self.logger = logging.getLogger(__name__)
+        self.tiling = tiling
+        self.batch_size = batch_size
+        self._tile_plans = {}
+        self.batch_sizes = []
+
+    def _run_model(self, frames1, frames2, times):
+        self.batch_sizes.append(len(frames1))
+        t = np.asarray(times, dtype=np.float32).reshape(-1, 1, 1, 1)
+        return ((1 - t) * np.stack(frames1) + t * np.stack(frames2)) / 255.0
+
+    def _postprocess_frames(self, frames):
+        return list(np.clip(np.rint(np.asarray(frames) * 255), 0, 255).astype(np.uint8))
+
+
+def random_frame(height, width, seed):
+    return np.random.default_rng(seed).integers(0, 256, (height, width, 3), dtype=np.uint8)
+
+
+@pytest.mark.parametrize("height, width, tile_size, overlap", [(150, 200, 64, 16), (96, 96, 96, 8), (70, 300, 64, 40)])
+def test_tiles_cover_the_frame(height, width, tile_size, overlap):
+    plan = TilePlan(height, width, tile_size, overlap)
+    frame = random_frame(height, width, 0)
+
+    covered = np.zeros((height, width), dtype=int)
+    for index, (y, x) in enumerate(plan.tiles):
+        assert plan.crop(frame, index).shape == (plan.tile_h, plan.tile_w, 3)
+        covered[y:y + plan.tile_h, x:x + plan.tile_w] += 1
+
+    assert covered.min() >= 1
+    assert max(y for y, _ in plan.tiles) + plan.tile_h == height
+    assert max(x for _, x in plan.tiles) + plan.tile_w == width
+    assert plan.weights.min() > 0
+
+
+def test_merging_unchanged_tiles_restores_the_frame():
+    plan = TilePlan(150, 200, 64, 16)
+    frame = random_frame(150, 200, 1)
+
+    merged = plan.merge([plan.crop(frame, k).astype(np.float32) for k in range(len(plan.tiles))])
+
+    np.testing.assert_allclose(merged, frame, atol=1e-3)
+
+
+def test_feathering_ramps_across_the_seam():
+    # Two tiles side by side (x = 0 and x = 48), overlapping on columns 48..63
+    overlap = 16
+    plan = TilePlan(64, 112, 64, overlap)
+    assert plan.tiles == [(0, 0), (0, 48)]
+
+    row = plan.merge([np.zeros((64, 64, 1), np.float32), np.full((64, 64, 1), 100, np.float32)])[32, :, 0]
+
+    np.testing.assert_allclose(row[:48], 0, atol=1e-4)
+    np.testing.assert_allclose(row[64:], 100, atol=1e-4)
+    seam = row[47:65]
+    # No hard edge: the value climbs monotonically in small steps across the overlap
+    assert np.all(np.diff(seam) > 0)
+    assert np.diff(seam).max() < 2 * 100 / overlap
+
+
+def test_tiled_inference_matches_whole_frames():
+    engine = BlendFILM({"mode": "fixed", "tile_size": 64, "overlap": 16}, batch_size=3)
+    pairs = [(random_frame(150, 200, 2), random_frame(150, 200, 3)), (random_frame(150, 200, 4), random_frame(150, 200, 5))]
+    times = [0.5, 0.25]
+
+    tiled = engine.interpolate_batch(pairs, times)
+
+    tiles = len(engine._tile_plan(150, 200).tiles)
+    assert sum(engine.batch_sizes) == 2 * tiles and max(engine.batch_sizes) == 3
+    for (frame1, frame2), time, result in zip(pairs, times, tiled):
+        expected = LinearInterpolator().interpolate(frame1, frame2, time)
+        np.testing.assert_allclose(result, expected, atol=1)
+
+
+def test_tile_plan_selection():
+    assert BlendFILM({"mode": "off"})._tile_plan(720, 1280) is None
+    assert BlendFILM({"mode": "fixed", "tile_size": 512})._tile_plan(360, 480) is None
+    assert BlendFILM({"mode": "auto", "memory_budget_mb": 4096, "bytes_per_pixel": 1024})._tile_plan(720, 1280) is None
+
+    plan = BlendFILM({"mode": "auto", "memory_budget_mb": 256, "bytes_per_pixel": 1024, "overlap": 32})._tile_plan(720, 1280)
+    assert plan is not None and plan.tile_h == plan.tile_w == 512 and len(plan.tiles) == 6
+
+
+def test_auto_tile_size_leaves_room_for_the_overlap():
+    assert auto_tile_size(360, 640, 2048, 4096) is None
+    assert auto_tile_size(1080, 1920, 16, 4096, overlap=64) == 2 * 64 + 64
+    assert auto_tile_size(1080, 1920, 256, 4096) == 256
+    assert auto_tile_size(1080, 1920, 256, 4096, tiles_per_call=4) == 128
@@ -0,0 +1,57 @@
+import pytest
+
+from src.pipeline.timing import FrameRateConverter
+
+
+def test_integer_factor_splits_each_pair_evenly():
+    converter = FrameRateConverter.from_factor(10, 4)
+    for pair in range(5):
+        assert converter.timesteps(pair) == [0.0, 0.25, 0.5, 0.75]
+        assert converter.output_index(pair) == 4 * pair
+        assert converter.includes_source_frame(pair)
+
+
+def test_24_to_60_repeats_a_two_pair_pattern():
+    converter = FrameRateConverter(24, 60)
+    assert converter.timesteps(0) == pytest.approx([0.0, 0.4, 0.8])
+    assert converter.timesteps(1) == pytest.approx([0.2, 0.6])
+    assert converter.timesteps(2) == pytest.approx([0.0, 0.4, 0.8])
+    # Every second source frame is shown as-is
+    assert [converter.includes_source_frame(i) for i in range(4)] == [True, False, True, False]
+    assert converter.output_index(1) == 3
+    assert converter.output_index(2) == 5
+
+
+def test_output_count_follows_the_rate_ratio():
+    converter = FrameRateConverter(24, 60)
+    pairs = 48
+    assert sum(len(converter.timesteps(pair)) for pair in range(pairs)) == pairs * 60 // 24
+
+
+def test_timesteps_stay_within_the_pair():
+    converter = FrameRateConverter(25, 60)
+    for pair in range(50):
+        steps = converter.timesteps(pair)
+        assert steps == sorted(steps)
+        assert all(0.0 <= t < 1.0 for t in steps)
+
+
+def test_ntsc_rates_are_exact():
+    # 23.976 -> 29.97 is exactly 4 -> 5
+    converter = FrameRateConverter(24000 / 1001, 30000 / 1001)
+    assert converter.timesteps(0) == pytest.approx([0.0, 0.8])
+    assert converter.timesteps(2) == pytest.approx([0.4])
+    assert converter.output_index(4) == 5
+
+
+def test_lower_target_rate_skips_pairs():
+    converter = FrameRateConverter(60, 24)
+    assert converter.timesteps(0) == [0.0]
+    assert converter.timesteps(1) == []
+    assert converter.timesteps(2) == pytest.approx([0.5])
+
+
+@pytest.mark.parametrize("source, target", [(0, 30), (30, 0), (-24, 60)])
+def test_rates_must_be_positive(source, target):
+    with pytest.raises(ValueError):
+        FrameRateConverter(source, target)